@@ -0,0 +1,111 @@
+"""
+Micro-benchmark of FXStreet calendar decoding, dicts against typed records.
+
+Builds a synthetic calendar payload and reports, for `json.loads` dicts and
+`FXStreetEvent` records, the decode time, the peak and retained memory per
+event while decoding, traced by tracemalloc, and the time to re-encode every
+event as a bronze line.
+
+Usage:
+    python -m benchmarks.fxstreet_events --events 50000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from src.parsers.fxstreet import decode_events, encode_event
+
+COUNTRIES = ("US", "UK", "EMU", "DE", "FR", "JP", "CN", "CA", "AU", "NZ", "CH")
+VOLATILITIES = ("LOW", "MEDIUM", "HIGH")
+
+
+def build_payload(events: int, extra_fields: int) -> bytes:
+    start = datetime(2024, 1, 1)
+    return json.dumps(
+        [
+            {
+                "id": f"{i:08x}-0000-0000-0000-000000000000",
+                "eventId": f"{i % 500:08x}-1111-1111-1111-111111111111",
+                "name": f"Event {i % 500} (MoM)",
+                "dateUtc": (start + timedelta(minutes=15 * (i // 4))).strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                ),
+                "countryCode": COUNTRIES[i % len(COUNTRIES)],
+                "categoryId": "33303F5E-1E3C-4016-AB2D-AC87E98F57CA",
+                "volatility": VOLATILITIES[i % len(VOLATILITIES)],
+                "actual": None if i % 3 else round(i * 0.01, 2),
+                "consensus": round(i * 0.011, 2),
+                "previous": round(i * 0.009, 2),
+                **{f"field{k}": k % 2 == 0 for k in range(extra_fields)},
+            }
+            for i in range(events)
+        ]
+    ).encode("utf-8")
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def traced_memory(function: Callable[[], object]) -> tuple[int, int]:
+    """Return the memory retained by the result of `function` and its peak."""
+    tracemalloc.start()
+    result = function()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark FXStreet event decoding")
+    parser.add_argument("--events", type=int, default=50_000, help="Events per run")
+    parser.add_argument(
+        "--extra-fields", type=int, default=4, help="Unmodelled fields per event"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+
+    payload = build_payload(args.events, args.extra_fields)
+    dicts = json.loads(payload)
+    records = decode_events(payload)
+    if [encode_event(record) for record in records] != [
+        json.dumps(event).encode("utf-8") for event in dicts
+    ]:
+        msg = "Re-encoded records differ from the re-encoded dicts"
+        raise AssertionError(msg)
+
+    print(f"payload: {len(payload) / 1024 / 1024:.1f} MiB, {args.events} events")  # noqa: T201
+    print(  # noqa: T201
+        f"{'':8} {'decode':>12} {'peak':>12} {'retained':>12} {'encode':>12}"
+    )
+    for name, decode, encode in (
+        ("dict", json.loads, json.dumps),
+        ("typed", decode_events, encode_event),
+    ):
+        decoded = decode(payload)
+        decode_best = best_time(lambda decode=decode: decode(payload), args.repeat)
+        encode_best = best_time(
+            lambda encode=encode, decoded=decoded: [encode(e) for e in decoded],
+            args.repeat,
+        )
+        retained, peak = traced_memory(lambda decode=decode: decode(payload))
+        print(  # noqa: T201
+            f"{name:8} {decode_best / args.events * 1e6:>9.2f} us "
+            f"{peak / args.events:>10.0f} B "
+            f"{retained / args.events:>10.0f} B "
+            f"{encode_best / args.events * 1e6:>9.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""
+Offline throughput benchmark of the workers and resources.
+
+Runs FXStreet backfill and raw modes, the Investing calendar pagination and
+parser and the TradingView calendar against the synthetic upstreams of
+`benchmarks.upstream` and the in-memory S3 of `benchmarks.s3`. Reports events
+and requests per second, HTTP latency percentiles and the peak memory allocated
+by each stage, and compares events per second with a stored baseline, which is
+only meaningful on the machine that recorded it.
+
+Usage:
+    python -m benchmarks.harness
+    python -m benchmarks.harness --latency 0.02 --error-rate 0.01
+    python -m benchmarks.harness --save-baseline
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+import httpx
+
+from benchmarks.s3 import InMemoryS3
+from benchmarks.upstream import SyntheticUpstream, UpstreamConfig
+from src.config import BackfillConfig, FXStreetConfig, IncrementalConfig, S3Config
+from src.date_windows import split_date_range
+from src.http_client import AsyncHTTPClient, HTTPClient
+from src.parsers.investing import parse_calendar_pages
+from src.resources.investing import InvestingResource
+from src.resources.trading_view import TradingViewResource
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+START_DATE = date(2025, 1, 1)
+
+
+class _TimedTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport, latencies: list[float]) -> None:
+        self.transport = transport
+        self.latencies = latencies
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.perf_counter()
+        response = self.transport.handle_request(request)
+        self.latencies.append(time.perf_counter() - started_at)
+        return response
+
+
+class _AsyncTimedTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, latencies: list[float]
+    ) -> None:
+        self.transport = transport
+        self.latencies = latencies
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        self.latencies.append(time.perf_counter() - started_at)
+        return response
+
+
+class Stage:
+    """Clients, S3 stand-in and scratch directory of one benchmark stage."""
+
+    def __init__(self, upstream: SyntheticUpstream, scratch_dir: Path) -> None:
+        self.upstream = upstream
+        self.scratch_dir = scratch_dir
+        self.s3 = InMemoryS3()
+        self.latencies: list[float] = []
+        self.http_client = HTTPClient(
+            rate_limit_delay=0,
+            transport=_TimedTransport(upstream.transport(), self.latencies),
+        )
+        self.async_http_client = AsyncHTTPClient(
+            rate_limit_delay=0,
+            max_concurrency=8,
+            transport=_AsyncTimedTransport(upstream.async_transport(), self.latencies),
+        )
+
+
+def run_fxstreet(stage: Stage, months: int, mode: str) -> int:
+    # Imported here so that boto3.client is patched when the worker creates it
+    from src.workers.fxstreet import FXStreetWorker  # noqa: PLC0415
+
+    end_date = date(START_DATE.year + months // 12, months % 12 + 1, 1) - timedelta(
+        days=1
+    )
+    config = FXStreetConfig(
+        http_client=stage.http_client,
+        async_http_client=stage.async_http_client,
+        s3_config=S3Config(
+            endpoint="http://s3.invalid",
+            access_key="",
+            secret_key="",
+            bucket_name="fxstreet",
+            bucket_cache_path=None,
+        ),
+        backfill_config=BackfillConfig(
+            checkpoint_path=str(stage.scratch_dir / f"{mode}.sqlite3")
+        ),
+        incremental_config=IncrementalConfig(
+            manifest_cache_path=str(stage.scratch_dir / f"{mode}_manifest.json")
+        ),
+    )
+    with mock.patch("boto3.client", return_value=stage.s3):
+        worker = FXStreetWorker(config)
+        if mode == "raw":
+            # Raw mode fetches a single window, stream one per month
+            for window_start, window_end in split_date_range(
+                START_DATE, end_date, "month"
+            ):
+                worker.run(window_start, window_end, mode)
+        else:
+            worker.run(START_DATE, end_date, mode)
+
+    return sum(
+        len(json.loads(body))
+        for (_, key), body in stage.s3.objects.items()
+        if key.startswith("fxstreet/events/")
+    )
+
+
+def run_investing(stage: Stage, months: int) -> int:
+    investing_resource = InvestingResource(stage.http_client)
+    return sum(
+        1
+        for _ in range(months)
+        for _ in parse_calendar_pages(
+            investing_resource.iter_calendar_pages(START_DATE, START_DATE)
+        )
+    )
+
+
+def run_trading_view(stage: Stage, months: int) -> int:
+    trading_view_resource = TradingViewResource(stage.http_client)
+    return sum(
+        len(trading_view_resource.get_calendar_events(START_DATE, START_DATE)["result"])
+        for _ in range(months)
+    )
+
+
+def measure(
+    name: str,
+    run: Callable[[Stage], int],
+    upstream_config: UpstreamConfig,
+    scratch_dir: Path,
+    repeat: int,
+) -> dict[str, float]:
+    """
+    Run a stage `repeat` times on fresh clients and report the fastest run.
+
+    Peak memory comes from one more run traced by `tracemalloc`, which would
+    slow down the timed runs. It counts the Python allocations of this stage
+    only, unlike the RSS high-water mark of the whole process.
+    """
+    runs = []
+    for attempt in range(repeat):
+        stage = Stage(SyntheticUpstream(upstream_config), scratch_dir / str(attempt))
+        started_at = time.perf_counter()
+        events = run(stage)
+        runs.append((time.perf_counter() - started_at, events, stage))
+    seconds, events, stage = min(runs, key=lambda run: run[0])
+    peak_bytes = _traced_peak_bytes(
+        run, Stage(SyntheticUpstream(upstream_config), scratch_dir / "traced")
+    )
+
+    latencies_ms = sorted(latency * 1000 for latency in stage.latencies)
+    percentiles = (
+        statistics.quantiles(latencies_ms, n=100, method="inclusive")
+        if len(latencies_ms) > 1
+        else latencies_ms * 99
+    )
+    return {
+        "stage": name,
+        "events": events,
+        "requests": stage.upstream.requests,
+        "s3_requests": stage.s3.requests,
+        "seconds": round(seconds, 4),
+        "events_per_sec": round(events / seconds, 1),
+        "requests_per_sec": round(stage.upstream.requests / seconds, 1),
+        "p50_ms": round(percentiles[49], 3),
+        "p99_ms": round(percentiles[98], 3),
+        "peak_traced_mib": round(peak_bytes / 1024 / 1024, 1),
+    }
+
+
+def _traced_peak_bytes(run: Callable[[Stage], int], stage: Stage) -> int:
+    """Return the peak of the memory traced by `tracemalloc` during a stage run."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline_bytes, _ = tracemalloc.get_traced_memory()
+    try:
+        run(stage)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return peak_bytes - baseline_bytes
+
+
+def compare(results: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    """Return the stages whose events per second regressed beyond tolerance."""
+    regressions = []
+    for result in results:
+        expected = baseline.get(result["stage"], {}).get("events_per_sec")
+        if expected is None:
+            continue
+        change = result["events_per_sec"] / expected - 1
+        print(f"{result['stage']:<24} {change:+.1%} events/s vs baseline")  # noqa: T201
+        if change < -tolerance:
+            regressions.append(result["stage"])
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline pipeline benchmark")
+    parser.add_argument("--months", type=int, default=12, help="Windows per stage")
+    parser.add_argument(
+        "--events", type=int, default=500, help="Events per response or page"
+    )
+    parser.add_argument("--pages", type=int, default=3, help="Investing pages")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds")
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Share of 503 responses, each retried after at least one second",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed events/s drop"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    upstream_config = UpstreamConfig(
+        latency=args.latency,
+        events_per_response=args.events,
+        pages=args.pages,
+        error_rate=args.error_rate,
+    )
+    stages: dict[str, Callable[[Stage], int]] = {
+        "fxstreet_backfill": lambda stage: run_fxstreet(stage, args.months, "backfill"),
+        "fxstreet_raw": lambda stage: run_fxstreet(stage, args.months, "raw"),
+        "investing_calendar": lambda stage: run_investing(stage, args.months),
+        "trading_view_calendar": lambda stage: run_trading_view(stage, args.months),
+    }
+
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        results = [
+            measure(name, run, upstream_config, Path(scratch_dir), args.repeat)
+            for name, run in stages.items()
+        ]
+
+    for result in results:
+        print(json.dumps(result))  # noqa: T201
+
+    if args.save_baseline:
+        args.baseline.write_text(
+            json.dumps({result["stage"]: result for result in results}, indent=2) + "\n"
+        )
+        return
+
+    if args.baseline.exists():
+        regressions = compare(
+            results, json.loads(args.baseline.read_text()), args.tolerance
+        )
+        if regressions:
+            print(f"Regressed: {', '.join(regressions)}")  # noqa: T201
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Import-time budget of the CLI.
+
+Imports the entry point in fresh interpreters with `-X importtime`, reports the
+slowest modules of the fastest run and fails when it exceeds the budget.
+
+Usage:
+    python -m benchmarks.import_time --budget-ms 100
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure(module: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds of every module."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is not None:
+            cumulative_us[match[4]] = int(match[2])
+    return cumulative_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check the CLI import time")
+    parser.add_argument("--module", default="main", help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="Budget")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs")
+    parser.add_argument("--top", type=int, default=10, help="Modules to report")
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda run: run[args.module])
+    total_ms = best[args.module] / 1000
+
+    for name, cumulative_us in sorted(
+        best.items(), key=lambda item: item[1], reverse=True
+    )[: args.top]:
+        print(f"{cumulative_us / 1000:8.1f} ms  {name}")  # noqa: T201
+    print(  # noqa: T201
+        f"import {args.module}: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)"
+    )
+
+    if total_ms > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Micro-benchmark of the Investing.com calendar fragment parser.
+
+Replays the recorded calendar page in `fixtures/` until the requested number of
+rows is reached and reports the parsing throughput.
+
+Usage:
+    python -m benchmarks.investing_parser --rows 50000
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from src.parsers.investing import iter_calendar_events
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "investing_calendar_page.json"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Investing parser")
+    parser.add_argument("--rows", type=int, default=50_000, help="Rows per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+
+    page = json.loads(FIXTURE_PATH.read_text())
+    rows_per_page = sum(1 for _ in iter_calendar_events(page["data"]))
+    pages = -(-args.rows // rows_per_page)
+    fragment = "\n".join([page["data"]] * pages)
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        rows = sum(1 for _ in iter_calendar_events(fragment))
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(f"fragment: {len(fragment) / 1024 / 1024:.1f} MiB, {rows} rows")  # noqa: T201
+    print(  # noqa: T201
+        f"best: {best:.3f}s ({rows / best:,.0f} rows/s, "
+        f"{best / rows * 1e6:.1f} us/row), median: {statistics.median(timings):.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
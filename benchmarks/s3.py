@@ -0,0 +1,111 @@
+"""In-process stand-in for the S3 client calls made by the workers."""
+
+import io
+import threading
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from botocore.exceptions import ClientError
+from botocore.hooks import HierarchicalEmitter
+
+
+class _Body(io.BytesIO):
+    def iter_chunks(self, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        while chunk := self.read(chunk_size):
+            yield chunk
+
+
+class InMemoryS3:
+    """Bucket objects kept in memory, with the boto3 S3 client call signatures."""
+
+    def __init__(self) -> None:
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.last_modified: dict[tuple[str, str], datetime] = {}
+        self.requests = 0
+        self._uploads: dict[str, dict[int, bytes]] = {}
+        self._lock = threading.Lock()
+        # Accepts the event handlers registered on real clients, never emitted
+        self.meta = SimpleNamespace(events=HierarchicalEmitter())
+
+    def create_bucket(self, Bucket: str) -> dict:  # noqa: N803, ARG002
+        self._count()
+        return {}
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **_: str) -> dict:  # noqa: N803
+        self._count()
+        self.objects[Bucket, Key] = bytes(Body)
+        self.last_modified[Bucket, Key] = datetime.now(UTC)
+        return {}
+
+    def get_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803
+        self._count()
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        body = self.objects[Bucket, Key]
+        return {"Body": _Body(body), "ContentLength": len(body)}
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **_: str) -> dict:  # noqa: N803, ARG002
+        self._count()
+        with self._lock:
+            upload_id = str(len(self._uploads))
+            self._uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(
+        self,
+        Bucket: str,  # noqa: N803, ARG002
+        Key: str,  # noqa: N803, ARG002
+        UploadId: str,  # noqa: N803
+        PartNumber: int,  # noqa: N803
+        Body: bytes,  # noqa: N803
+    ) -> dict:
+        self._count()
+        self._uploads[UploadId][PartNumber] = bytes(Body)
+        return {"ETag": f'"{UploadId}-{PartNumber}"'}
+
+    def complete_multipart_upload(
+        self,
+        Bucket: str,  # noqa: N803
+        Key: str,  # noqa: N803
+        UploadId: str,  # noqa: N803
+        MultipartUpload: dict,  # noqa: N803
+    ) -> dict:
+        self._count()
+        parts = self._uploads.pop(UploadId)
+        self.objects[Bucket, Key] = b"".join(
+            parts[part["PartNumber"]] for part in MultipartUpload["Parts"]
+        )
+        self.last_modified[Bucket, Key] = datetime.now(UTC)
+        return {}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> dict:  # noqa: N803, ARG002
+        self._count()
+        self._uploads.pop(UploadId, None)
+        return {}
+
+    def get_paginator(self, operation_name: str) -> "_ListObjectsPaginator":  # noqa: ARG002
+        return _ListObjectsPaginator(self)
+
+    def _count(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+
+class _ListObjectsPaginator:
+    def __init__(self, s3: InMemoryS3) -> None:
+        self.s3 = s3
+
+    def paginate(self, Bucket: str, Prefix: str = "") -> Iterator[dict]:  # noqa: N803
+        self.s3._count()  # noqa: SLF001
+        yield {
+            "Contents": [
+                {
+                    "Key": key,
+                    "Size": len(body),
+                    "LastModified": self.s3.last_modified[bucket, key],
+                }
+                for (bucket, key), body in sorted(self.s3.objects.items())
+                if bucket == Bucket and key.startswith(Prefix)
+            ]
+        }
@@ -0,0 +1,143 @@
+"""
+Synthetic FXStreet, Investing.com and TradingView upstreams for benchmarks.
+
+Responses are generated in-process and served through `httpx.MockTransport`, so
+benchmarks exercise the real clients, retries and parsers without a network.
+"""
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import httpx
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "investing_calendar_page.json"
+
+_FXSTREET_CALENDAR_PATH = re.compile(
+    r"/en/api/v2/eventDates/(\d{4}-\d{2}-\d{2})T[^/]*/(\d{4}-\d{2}-\d{2})T"
+)
+_INVESTING_ROW = re.compile(r'<tr id="eventRowId_.*?</tr>', re.DOTALL)
+_COUNTRIES = ("US", "UK", "EMU", "DE", "JP", "CN", "CA", "AU")
+
+
+@dataclass(frozen=True, slots=True)
+class UpstreamConfig:
+    """Shape of the synthetic responses, `latency` and `error_rate` per request."""
+
+    latency: float = 0.0
+    events_per_response: int = 500
+    pages: int = 3
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+class SyntheticUpstream:
+    """Request handler generating calendar responses of every source."""
+
+    def __init__(self, config: UpstreamConfig) -> None:
+        self.config = config
+        self.requests = 0
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+
+        page = json.loads(FIXTURE_PATH.read_text())
+        rows = _INVESTING_ROW.findall(page["data"])
+        self._investing_page = {
+            **page,
+            "data": "\n".join(
+                rows[i % len(rows)] for i in range(config.events_per_response)
+            ),
+        }
+
+    def transport(self) -> httpx.MockTransport:
+        def handle(request: httpx.Request) -> httpx.Response:
+            time.sleep(self.config.latency)
+            return self.handle(request)
+
+        return httpx.MockTransport(handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        async def handle(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(self.config.latency)
+            return self.handle(request)
+
+        return httpx.MockTransport(handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.config.error_rate
+        if failed:
+            return httpx.Response(httpx.codes.SERVICE_UNAVAILABLE)
+
+        host, path = request.url.host, request.url.path
+        if host == "calendar-api.fxsstatic.com":
+            match = _FXSTREET_CALENDAR_PATH.search(path)
+            if match is not None:
+                return httpx.Response(
+                    httpx.codes.OK,
+                    json=self._fxstreet_events(
+                        date.fromisoformat(match[1]), date.fromisoformat(match[2])
+                    ),
+                )
+            return httpx.Response(
+                httpx.codes.OK, json={"id": path.rsplit("/", 1)[-1], "name": "Event"}
+            )
+        if host == "www.investing.com" and request.method == "POST":
+            page_num = int(parse_qs(request.content.decode())["limit_from"][0])
+            return httpx.Response(
+                httpx.codes.OK,
+                json={
+                    **self._investing_page,
+                    "bind_scroll_handler": page_num < self.config.pages - 1,
+                },
+            )
+        if host == "economic-calendar.tradingview.com":
+            return httpx.Response(
+                httpx.codes.OK,
+                json={"status": "ok", "result": self._trading_view_events()},
+            )
+        return httpx.Response(httpx.codes.NOT_FOUND)
+
+    def _fxstreet_events(self, start_date: date, end_date: date) -> list[dict]:
+        days = (end_date - start_date).days + 1
+        return [
+            {
+                "id": f"{start_date}-{i}",
+                "eventId": f"E{i % 97}",
+                "dateUtc": (
+                    datetime.combine(start_date, datetime.min.time())
+                    + timedelta(days=i % days, minutes=15 * (i % 96))
+                ).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "countryCode": _COUNTRIES[i % len(_COUNTRIES)],
+                "categoryId": "33303F5E-1E3C-4016-AB2D-AC87E98F57CA",
+                "name": f"Event {i % 97}",
+                "volatility": "HIGH",
+                "actual": None,
+                "consensus": 1.2,
+                "previous": 1.1,
+            }
+            for i in range(self.config.events_per_response)
+        ]
+
+    def _trading_view_events(self) -> list[dict]:
+        return [
+            {
+                "id": str(i),
+                "title": f"Event {i % 97}",
+                "country": "US",
+                "ticker": f"USEVT{i % 97}",
+                "date": "2025-01-06T13:30:00.000Z",
+                "actual": None,
+                "forecast": 1.2,
+                "previous": 1.1,
+            }
+            for i in range(self.config.events_per_response)
+        ]
@@ -1,11 +1,19 @@
 import argparse
+import signal
+import threading
 from datetime import datetime
 from logging.config import fileConfig
 from pathlib import Path
 
 import yaml
 
-from src.worker_factory import build_worker
+from src import metrics, profiling, tracing
+from src.orchestrator import run_sources, serve_sources
+from src.worker_factory import SOURCES, build_worker
+
+CONFIG_DIR = Path("config")
+# Seconds between rewrites of the --metrics-file in serve mode
+METRICS_FILE_INTERVAL = 15.0
 
 
 def load_config(config_path: Path) -> dict:
@@ -15,42 +23,156 @@ def load_config(config_path: Path) -> dict:
     return config_data
 
 
+def _write_metrics_file_until(path: Path, stop_event: threading.Event) -> None:
+    while not stop_event.wait(METRICS_FILE_INTERVAL):
+        metrics.REGISTRY.write_textfile(path)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Economic calendar worker")
     parser.add_argument(
         "-s",
         "--start-date",
         type=str,
-        required=True,
-        help="Start date in YYYYMMDD format",
+        help="Start date in YYYYMMDD format, not used in serve mode",
     )
     parser.add_argument(
         "-e",
         "--end-date",
         type=str,
-        required=True,
-        help="End date in YYYYMMDD format",
+        help="End date in YYYYMMDD format, not used in serve mode",
     )
     parser.add_argument(
         "-m",
         "--mode",
         type=str,
         default="raw",
-        help="Worker mode (default: raw)",
+        help=(
+            "Worker mode: raw, backfill, incremental, retry, delta, details or "
+            "silver, or serve to keep polling the horizons configured under "
+            "`serve` until interrupted (default: raw)"
+        ),
+    )
+
+    parser.add_argument(
+        "--sources",
+        type=str,
+        default="fxstreet",
+        help=(
+            "Comma-separated sources to run concurrently, each configured by "
+            f"config/<source>.yaml, or 'all' ({', '.join(SOURCES)}). The catalog "
+            "source matches events across sources in silver mode "
+            "(default: fxstreet)"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip windows already recorded as completed in the checkpoint journal",
+    )
+
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        help=(
+            "Write Prometheus metrics to this file for the node_exporter textfile "
+            "collector when the run ends, and periodically in serve mode"
+        ),
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus metrics on http://<host>:<port>/metrics",
+    )
+    parser.add_argument(
+        "--trace-file",
+        type=Path,
+        help="Write stage spans to this Chrome trace event file (Perfetto)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        nargs="?",
+        const=Path("profiles"),
+        help=(
+            "Sample the run and write fetch, decode, serialize and upload "
+            "profiles and a tracemalloc snapshot of the memory peak under "
+            "<dir>/<sources>_<mode>_<timestamp> (default dir: profiles)"
+        ),
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        help="Functions and allocation sites listed per profile (default: 25)",
     )
 
     args = parser.parse_args()
 
-    config_path = Path("config/fxstreet.yaml")
-    log_config_path = Path("config/log.conf")
+    log_config_path = CONFIG_DIR / "log.conf"
 
     fileConfig(log_config_path)
 
-    config_data = load_config(config_path)
-    worker = build_worker(config_data)
+    if args.metrics_port is not None:
+        metrics.start_http_server(args.metrics_port)
+    if args.trace_file is not None:
+        tracing.TRACER.start(args.trace_file)
+    profiler = None
+    if args.profile is not None:
+        profiler = profiling.SamplingProfiler(top=args.profile_top)
+        profiler.start()
+    try:
+        _run(parser, args)
+    finally:
+        tracing.TRACER.stop()
+        if profiler is not None:
+            profiler.stop()
+            profiler.write(
+                args.profile
+                / (
+                    f"{args.sources.replace(',', '_')}_{args.mode}_"
+                    f"{datetime.now().strftime('%Y%m%dT%H%M%S')}"
+                )
+            )
+        if args.metrics_file is not None:
+            metrics.REGISTRY.write_textfile(args.metrics_file)
+
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    sources = (
+        list(SOURCES)
+        if args.sources == "all"
+        else [source.strip() for source in args.sources.split(",")]
+    )
+    configs = {source: load_config(CONFIG_DIR / f"{source}.yaml") for source in sources}
+
+    if args.mode == "serve":
+        stop_event = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop_event.set())
+        if args.metrics_file is not None:
+            threading.Thread(
+                target=_write_metrics_file_until,
+                args=(args.metrics_file, stop_event),
+                name="metrics-file",
+                daemon=True,
+            ).start()
+        serve_sources(configs, stop_event)
+        return
+
+    if args.start_date is None or args.end_date is None:
+        parser.error("--start-date and --end-date are required outside serve mode")
+
     start_date = datetime.strptime(args.start_date, "%Y%m%d").date()
     end_date = datetime.strptime(args.end_date, "%Y%m%d").date()
-    worker.run(start_date, end_date, mode=args.mode)
+
+    if len(configs) == 1:
+        worker = build_worker(configs[sources[0]])
+        with tracing.span("run", source=sources[0], mode=args.mode):
+            worker.run(start_date, end_date, mode=args.mode, resume=args.resume)
+    else:
+        run_sources(configs, start_date, end_date, args.mode, resume=args.resume)
 
 
 if __name__ == "__main__":
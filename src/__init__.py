@@ -1,3 +1,15 @@
-from .resources import FXStreetResource, InvestingResource
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .resources import FXStreetResource, InvestingResource
 
 __all__ = ["FXStreetResource", "InvestingResource"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # Resources import httpx and tenacity, load them on first access only
+    if name in __all__:
+        return getattr(import_module(".resources", __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
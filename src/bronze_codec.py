@@ -0,0 +1,312 @@
+import codecs
+import json
+import re
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from src import profiling
+
+FORMATS = ("json", "ndjson")
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+FORMAT_SUFFIXES = {"json": ".json", "ndjson": ".ndjson"}
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+CONTENT_TYPES = {"json": "application/json", "ndjson": "application/x-ndjson"}
+
+_JSON_DECODER = json.JSONDecoder()
+_WHITESPACE_PATTERN = re.compile(r"[ \t\r\n]*")
+_SEPARATORS_PATTERN = re.compile(r"[ \t\r\n,]*")
+_ITEM_ENDS = " \t\r\n,]"
+_NUMBER_CHARACTERS = "0123456789.eE+-"
+
+
+def _import_zstandard():  # noqa: ANN202
+    try:
+        import zstandard  # noqa: PLC0415
+    except ImportError as e:
+        msg = (
+            "zstd compression requires the `zstandard` package, "
+            "install it with `pip install economic-calendar[zstd]`"
+        )
+        raise ImportError(msg) from e
+    return zstandard
+
+
+@dataclass(frozen=True, slots=True)
+class BronzeCodec:
+    """Serialization format and compression of bronze objects."""
+
+    format: str = "json"
+    compression: str = "none"
+
+    def __post_init__(self) -> None:
+        if self.format not in FORMATS:
+            msg = f"Invalid bronze format: {self.format}"
+            raise ValueError(msg)
+        if self.compression not in COMPRESSIONS:
+            msg = f"Invalid bronze compression: {self.compression}"
+            raise ValueError(msg)
+
+    @property
+    def suffix(self) -> str:
+        return FORMAT_SUFFIXES[self.format] + COMPRESSION_SUFFIXES[self.compression]
+
+    def output_key(self, key: str) -> str:
+        """Replace the format suffix of a templated key with the codec suffix."""
+        for suffix in FORMAT_SUFFIXES.values():
+            if key.endswith(suffix):
+                key = key.removesuffix(suffix)
+                break
+        return key + self.suffix
+
+    def put_kwargs(self) -> dict[str, str]:
+        """Object metadata matching the encoded payload."""
+        kwargs = {"ContentType": CONTENT_TYPES[self.format]}
+        if self.compression != "none":
+            kwargs["ContentEncoding"] = self.compression
+        return kwargs
+
+    def encode(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Re-encode a streamed JSON array payload."""
+        if self.format == "json":
+            return self._compress(chunks)
+        return self.encode_records(iter_json_array_items(chunks))
+
+    def encode_records(self, records: Iterable[bytes]) -> Iterator[bytes]:
+        """Encode already serialized JSON records."""
+        if self.format == "json":
+            return self._compress(_join_json_array(records))
+        return self._compress(record + b"\n" for record in records)
+
+    @profiling.stage("decode")
+    def decode(self, chunks: Iterable[bytes]) -> Iterator[dict]:
+        """Decode an encoded payload record by record."""
+        for record in self.iter_raw_records(chunks):
+            yield json.loads(record)
+
+    def iter_raw_records(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Yield the raw JSON bytes of each record of an encoded payload."""
+        chunks = self._decompress(chunks)
+        if self.format == "json":
+            return iter_json_array_items(chunks)
+        return _iter_lines(chunks)
+
+    @profiling.stage("serialize")
+    def _compress(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        if self.compression == "none":
+            yield from chunks
+            return
+
+        compressor = _new_compressor(self.compression)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    @profiling.stage("decode")
+    def _decompress(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        if self.compression == "none":
+            yield from chunks
+            return
+
+        decompress = _new_decompressor(self.compression)
+        for chunk in chunks:
+            decompressed = decompress(chunk)
+            if decompressed:
+                yield decompressed
+
+
+def codec_for_key(key: str) -> BronzeCodec:
+    """Infer the codec of an existing bronze object from its key suffix."""
+    compression = "none"
+    for name, suffix in COMPRESSION_SUFFIXES.items():
+        if suffix and key.endswith(suffix):
+            compression = name
+            key = key.removesuffix(suffix)
+            break
+
+    for name, suffix in FORMAT_SUFFIXES.items():
+        if key.endswith(suffix):
+            return BronzeCodec(format=name, compression=compression)
+
+    msg = f"Cannot infer bronze codec of {key}"
+    raise ValueError(msg)
+
+
+def _new_compressor(compression: str):  # noqa: ANN202
+    if compression == "gzip":
+        return zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    return _import_zstandard().ZstdCompressor().compressobj()
+
+
+def _new_decompressor(compression: str) -> Callable[[bytes], bytes]:
+    if compression == "gzip":
+        return zlib.decompressobj(wbits=zlib.MAX_WBITS | 16).decompress
+    return _import_zstandard().ZstdDecompressor().decompressobj().decompress
+
+
+@profiling.stage("serialize")
+def _join_json_array(records: Iterable[bytes]) -> Iterator[bytes]:
+    separator = b"["
+    for record in records:
+        yield separator
+        yield record
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+@profiling.stage("decode")
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        yield from (line for line in lines if line.strip())
+    if pending.strip():
+        yield pending
+
+
+def iter_json_array_items(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Split a streamed top-level JSON array into the raw bytes of its items.
+
+    Items are located with the C scanner of `json.JSONDecoder.raw_decode` and
+    sliced out of the text buffer, so they can span any number of chunks while
+    only the unfinished tail of the stream is kept in memory.
+
+    Args:
+        chunks: Byte chunks of a JSON array document
+
+    Yields:
+        Raw JSON bytes of each array item
+    """
+    return _split_json_array(chunks, _JSONArraySplitter())
+
+
+def iter_json_array_values(chunks: Iterable[bytes]) -> Iterator[object]:
+    """
+    Decode a streamed top-level JSON array item by item.
+
+    Like `iter_json_array_items`, but yields the decoded items, so that only
+    the item being converted and the unfinished tail of the stream are held
+    in memory instead of the whole decoded array.
+    """
+    return _split_json_array(chunks, _JSONArraySplitter(values=True))
+
+
+@profiling.stage("decode")
+def _split_json_array(
+    chunks: Iterable[bytes], splitter: "_JSONArraySplitter"
+) -> Iterator[Any]:
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        yield from splitter.feed(text_decoder.decode(chunk), final=False)
+    yield from splitter.feed(text_decoder.decode(b"", final=True), final=True)
+
+    if not splitter.closed:
+        msg = "Truncated JSON array"
+        raise ValueError(msg)
+
+
+class JSONArrayItemCounter:
+    """
+    Count the items of a JSON array fed chunk by chunk.
+
+    Items are found as in `iter_json_array_items`, which lets a payload be
+    passed through unchanged while its items are counted.
+    """
+
+    __slots__ = ("_splitter", "_text_decoder", "count")
+
+    def __init__(self) -> None:
+        self._splitter = _JSONArraySplitter(values=True)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.count = 0
+
+    def feed(self, chunk: bytes) -> None:
+        text = self._text_decoder.decode(chunk)
+        self.count += sum(1 for _ in self._splitter.feed(text, final=False))
+
+    def close(self) -> int:
+        """Count the items left in the stream tail and return the total."""
+        text = self._text_decoder.decode(b"", final=True)
+        self.count += sum(1 for _ in self._splitter.feed(text, final=True))
+        if not self._splitter.closed:
+            msg = "Truncated JSON array"
+            raise ValueError(msg)
+        return self.count
+
+
+class _JSONArraySplitter:
+    # Yields decoded items if `values`, otherwise their raw JSON bytes
+    __slots__ = ("buffer", "closed", "started", "values")
+
+    def __init__(self, *, values: bool = False) -> None:
+        self.buffer = ""
+        self.started = False
+        self.closed = False
+        self.values = values
+
+    def feed(self, text: str, *, final: bool) -> Iterator[Any]:
+        buffer = self.buffer + text
+        size = len(buffer)
+        position = _WHITESPACE_PATTERN.match(buffer).end()
+        if not self.started:
+            if position == size:
+                self.buffer = ""
+                return
+            position = self._open(buffer, position)
+
+        # Hot loop, the scanner and the separator pattern run in C
+        scan_once = _JSON_DECODER.scan_once
+        skip_separators = _SEPARATORS_PATTERN.match
+        values = self.values
+        while True:
+            position = skip_separators(buffer, position).end()
+            if position == size:
+                break
+            if buffer[position] == "]":
+                self.closed = True
+                break
+
+            try:
+                value, end = scan_once(buffer, position)
+            except (StopIteration, json.JSONDecodeError):
+                if final:
+                    # Raises the error with its message and position
+                    _JSON_DECODER.raw_decode(buffer, position)
+                break
+
+            if (end == size or buffer[end] not in _ITEM_ENDS) and not (
+                _is_item_complete(buffer, end, final=final)
+            ):
+                break
+
+            yield value if values else buffer[position:end].encode("utf-8")
+            position = end
+
+        self.buffer = buffer[position:]
+
+    def _open(self, buffer: str, position: int) -> int:
+        if buffer[position] != "[":
+            msg = "Expected a JSON array"
+            raise ValueError(msg)
+        self.started = True
+        return position + 1
+
+
+def _is_item_complete(buffer: str, end: int, *, final: bool) -> bool:
+    # A scalar ending exactly at the buffer end may continue in the next
+    # chunk, so wait for more data before emitting it.
+    if end == len(buffer):
+        return final
+    # So may a number cut in its fraction or exponent, e.g. "3." or "1e"
+    if buffer[end] not in _ITEM_ENDS:
+        if final or buffer[end:].strip(_NUMBER_CHARACTERS):
+            msg = "Invalid JSON array item"
+            raise ValueError(msg)
+        return False
+    return True
@@ -0,0 +1,58 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Workers of several sources may share the cache file from their own threads
+_lock = threading.Lock()
+
+
+class BucketCache:
+    """Buckets known to exist, cached in a local JSON file across runs."""
+
+    def __init__(self, path: Path, ttl: float = 86400.0) -> None:
+        """
+        Initialize bucket cache.
+
+        Args:
+            path: Location of the local cache file
+            ttl: Seconds after which a bucket is checked again
+        """
+        self.path = path
+        self.ttl = ttl
+
+    def contains(self, endpoint: str, bucket_name: str) -> bool:
+        """Return whether the bucket was seen at the endpoint within the TTL."""
+        with _lock:
+            checked_at = self._load().get(_cache_key(endpoint, bucket_name))
+        return checked_at is not None and time.time() - checked_at <= self.ttl
+
+    def add(self, endpoint: str, bucket_name: str) -> None:
+        """Record that the bucket exists at the endpoint."""
+        with _lock:
+            buckets = self._load()
+            buckets[_cache_key(endpoint, bucket_name)] = time.time()
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = self.path.with_name(f"{self.path.name}.{os.getpid()}")
+            temporary_path.write_text(json.dumps(buckets), encoding="utf-8")
+            # Readers in other processes see either the old or the new file
+            temporary_path.replace(self.path)
+
+    def _load(self) -> dict[str, float]:
+        if not self.path.exists():
+            return {}
+
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            logger.warning("Ignoring corrupt bucket cache %s", self.path)
+            return {}
+
+
+def _cache_key(endpoint: str, bucket_name: str) -> str:
+    return f"{endpoint}/{bucket_name}"
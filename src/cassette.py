@@ -0,0 +1,182 @@
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# The recorded body is already decoded, replaying these would misdescribe it
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+class CassetteMissError(LookupError):
+    """A replayed request was never recorded in the cassette."""
+
+    def __init__(self, request: httpx.Request) -> None:
+        super().__init__(f"No recorded response for {request.method} {request.url}")
+
+
+class Cassette:
+    """
+    HTTP exchanges recorded in a gzip-compressed NDJSON file.
+
+    Each exchange is appended as its own gzip member as soon as it completes,
+    so a recording survives an interrupted run. Requests are matched on method,
+    URL and a hash of their body; a request recorded several times is replayed
+    in recording order, repeating the last response once exhausted.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._exchanges: dict[str, list[dict]] | None = None
+        self._replayed: dict[str, int] = defaultdict(int)
+
+    def record(
+        self, request: httpx.Request, response: httpx.Response, elapsed: float
+    ) -> httpx.Response:
+        """Append a read response to the cassette and return its replayed form."""
+        exchange = {
+            "key": _request_key(request),
+            "method": request.method,
+            "url": str(request.url),
+            "status_code": response.status_code,
+            "headers": [
+                (name, value)
+                for name, value in response.headers.multi_items()
+                if name.lower() not in _DROPPED_HEADERS
+            ],
+            "body": base64.b64encode(response.content).decode("ascii"),
+            "elapsed": elapsed,
+        }
+        line = json.dumps(exchange).encode("utf-8") + b"\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, "ab") as file:
+                file.write(line)
+        return _exchange_response(exchange, request)
+
+    def replay(self, request: httpx.Request) -> tuple[httpx.Response, float]:
+        """Return the recorded response of a request and its original duration."""
+        key = _request_key(request)
+        with self._lock:
+            recorded = self._load().get(key)
+            if not recorded:
+                raise CassetteMissError(request)
+            exchange = recorded[min(self._replayed[key], len(recorded) - 1)]
+            self._replayed[key] += 1
+
+        return _exchange_response(exchange, request), exchange["elapsed"]
+
+    def _load(self) -> dict[str, list[dict]]:
+        if self._exchanges is None:
+            self._exchanges = defaultdict(list)
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    exchange = json.loads(line)
+                    self._exchanges[exchange["key"]].append(exchange)
+            logger.info(
+                "Loaded %d recorded requests from %s",
+                sum(map(len, self._exchanges.values())),
+                self.path,
+            )
+        return self._exchanges
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Transport sending requests upstream and recording them in a cassette."""
+
+    def __init__(self, cassette: Cassette, transport: httpx.BaseTransport) -> None:
+        self.cassette = cassette
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.perf_counter()
+        response = self.transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self.cassette.record(request, response, time.perf_counter() - started_at)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    """Async transport sending requests upstream and recording them."""
+
+    def __init__(self, cassette: Cassette, transport: httpx.AsyncBaseTransport) -> None:
+        self.cassette = cassette
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return await asyncio.to_thread(
+            self.cassette.record, request, response, time.perf_counter() - started_at
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """
+    Transport answering from a cassette without network access.
+
+    Responses take their recorded duration times `timing_scale`, 0 answers
+    immediately.
+    """
+
+    def __init__(self, cassette: Cassette, timing_scale: float = 1.0) -> None:
+        self.cassette = cassette
+        self.timing_scale = timing_scale
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response, elapsed = self.cassette.replay(request)
+        if self.timing_scale > 0:
+            time.sleep(elapsed * self.timing_scale)
+        return response
+
+
+class AsyncReplayTransport(httpx.AsyncBaseTransport):
+    """Async transport answering from a cassette, see `ReplayTransport`."""
+
+    def __init__(self, cassette: Cassette, timing_scale: float = 1.0) -> None:
+        self.cassette = cassette
+        self.timing_scale = timing_scale
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response, elapsed = self.cassette.replay(request)
+        if self.timing_scale > 0:
+            await asyncio.sleep(elapsed * self.timing_scale)
+        return response
+
+
+def _request_key(request: httpx.Request) -> str:
+    body_sha256 = hashlib.sha256(request.read()).hexdigest()
+    return f"{request.method} {request.url} {body_sha256}"
+
+
+def _exchange_response(exchange: dict, request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        exchange["status_code"],
+        headers=exchange["headers"],
+        content=base64.b64decode(exchange["body"]),
+        request=request,
+    )
@@ -0,0 +1,145 @@
+import logging
+import sqlite3
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS completed_windows (
+    s3_key TEXT PRIMARY KEY,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    payload_sha256 TEXT NOT NULL,
+    completed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS failed_windows (
+    s3_key TEXT PRIMARY KEY,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    error TEXT NOT NULL,
+    failed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS deltas (
+    s3_key TEXT PRIMARY KEY,
+    snapshot_key TEXT NOT NULL,
+    sequence INTEGER NOT NULL,
+    events INTEGER NOT NULL,
+    written_at TEXT NOT NULL
+);
+"""
+
+
+class CheckpointJournal:
+    """
+    Local SQLite journal of windows that were fetched and uploaded.
+
+    Windows that failed are kept in a separate table until they succeed, so they
+    can be retried later. Delta objects written against a window snapshot are
+    numbered in a third table.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open (or create) the journal.
+
+        Args:
+            path: Location of the SQLite database file
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+
+    def is_completed(self, s3_key: str) -> bool:
+        """Return whether the window written to `s3_key` already succeeded."""
+        row = self._connection.execute(
+            "SELECT 1 FROM completed_windows WHERE s3_key = ?", (s3_key,)
+        ).fetchone()
+        return row is not None
+
+    def record(
+        self, start_date: date, end_date: date, s3_key: str, payload_sha256: str
+    ) -> None:
+        """Mark a window as completed, replacing any previous entry for its key."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO completed_windows "
+                "(s3_key, start_date, end_date, payload_sha256, completed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    s3_key,
+                    start_date.isoformat(),
+                    end_date.isoformat(),
+                    payload_sha256,
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM failed_windows WHERE s3_key = ?", (s3_key,)
+            )
+        logger.debug("Recorded checkpoint for %s", s3_key)
+
+    def record_failure(
+        self, start_date: date, end_date: date, s3_key: str, error: BaseException
+    ) -> None:
+        """Mark a window as failed so a later run can retry it."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO failed_windows "
+                "(s3_key, start_date, end_date, error, failed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    s3_key,
+                    start_date.isoformat(),
+                    end_date.isoformat(),
+                    f"{type(error).__name__}: {error}",
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
+        logger.debug("Recorded failure for %s", s3_key)
+
+    def failed_windows(
+        self, start_date: date, end_date: date
+    ) -> list[tuple[date, date]]:
+        """Return the failed windows lying within the given dates, oldest first."""
+        rows = self._connection.execute(
+            "SELECT start_date, end_date FROM failed_windows "
+            "WHERE start_date >= ? AND end_date <= ? ORDER BY start_date",
+            (start_date.isoformat(), end_date.isoformat()),
+        ).fetchall()
+        return [
+            (date.fromisoformat(window_start), date.fromisoformat(window_end))
+            for window_start, window_end in rows
+        ]
+
+    def last_delta_sequence(self, snapshot_key: str) -> int:
+        """Return the sequence number of the last delta of a snapshot, 0 if none."""
+        row = self._connection.execute(
+            "SELECT MAX(sequence) FROM deltas WHERE snapshot_key = ?",
+            (snapshot_key,),
+        ).fetchone()
+        return row[0] or 0
+
+    def record_delta(
+        self, snapshot_key: str, s3_key: str, sequence: int, events: int
+    ) -> None:
+        """Record a delta object written against the snapshot of a window."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO deltas "
+                "(s3_key, snapshot_key, sequence, events, written_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    s3_key,
+                    snapshot_key,
+                    sequence,
+                    events,
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
+        logger.debug("Recorded delta %s", s3_key)
+
+    def close(self) -> None:
+        self._connection.close()
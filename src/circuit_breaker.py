@@ -0,0 +1,156 @@
+import logging
+import threading
+import time
+
+from src.config import CircuitBreakerConfig, RetryBudgetConfig
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit for {host} is open, retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class _HostCircuit:
+    __slots__ = ("failures", "opened_at", "probes_in_flight", "state")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker per host.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests fail fast with `CircuitOpenError`. Once `reset_timeout` has passed
+    up to `half_open_max_calls` probe requests are let through: a success closes
+    the circuit again, a failure re-opens it.
+    """
+
+    def __init__(self, circuit_breaker_config: CircuitBreakerConfig) -> None:
+        self.circuit_breaker_config = circuit_breaker_config
+        self._circuits: dict[str, _HostCircuit] = {}
+        self._lock = threading.Lock()
+
+    def before_request(self, host: str) -> bool:
+        """
+        Raise `CircuitOpenError` if a request to `host` must not be sent.
+
+        Returns whether the request is a half-open probe, whose slot must be
+        given back with `release_probe` if it ends without an outcome.
+        """
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _HostCircuit())
+            if circuit.state == CLOSED:
+                return False
+
+            retry_in = (
+                circuit.opened_at + self.circuit_breaker_config.reset_timeout - now
+            )
+            if circuit.state == OPEN and retry_in <= 0:
+                logger.info("Circuit for %s is half-open, probing", host)
+                circuit.state = HALF_OPEN
+                circuit.probes_in_flight = 0
+
+            if (
+                circuit.state == HALF_OPEN
+                and circuit.probes_in_flight
+                < self.circuit_breaker_config.half_open_max_calls
+            ):
+                circuit.probes_in_flight += 1
+                return True
+
+        raise CircuitOpenError(host, max(retry_in, 0.0))
+
+    def release_probe(self, host: str) -> None:
+        """
+        Give back the slot of a probe that ended with neither a success nor a
+        failure, e.g. cancelled or failing in the caller.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _HostCircuit())
+            if circuit.state == HALF_OPEN and circuit.probes_in_flight > 0:
+                circuit.probes_in_flight -= 1
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _HostCircuit())
+            if circuit.state != CLOSED:
+                logger.info("Circuit for %s is closed again", host)
+            circuit.state = CLOSED
+            circuit.failures = 0
+            circuit.probes_in_flight = 0
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _HostCircuit())
+            circuit.failures += 1
+            if (
+                circuit.state == HALF_OPEN
+                or circuit.failures >= self.circuit_breaker_config.failure_threshold
+            ):
+                if circuit.state != OPEN:
+                    logger.warning(
+                        "Opening circuit for %s after %d failures",
+                        host,
+                        circuit.failures,
+                    )
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probes_in_flight = 0
+
+
+class RetryBudget:
+    """
+    Retry budget shared by every request of a run.
+
+    Retries are allowed while they stay below `min_retries` plus `ratio` of the
+    requests made so far; beyond that failing requests give up immediately.
+    """
+
+    def __init__(self, retry_budget_config: RetryBudgetConfig) -> None:
+        self.retry_budget_config = retry_budget_config
+        self._requests = 0
+        self._retries = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._requests += 1
+
+    def try_spend(self) -> bool:
+        """Consume one retry, returning False if the budget is exhausted."""
+        with self._lock:
+            allowed = (
+                self.retry_budget_config.min_retries
+                + self.retry_budget_config.ratio * self._requests
+            )
+            if self._retries >= allowed:
+                logger.warning(
+                    "Retry budget exhausted (%d retries for %d requests)",
+                    self._retries,
+                    self._requests,
+                )
+                return False
+
+            self._retries += 1
+            return True
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests = 0
+            self._retries = 0
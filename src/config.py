@@ -1,8 +1,11 @@
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from src.bronze_codec import BronzeCodec
+
 if TYPE_CHECKING:
-    from src.http_client import HTTPClient
+    from src.http_client import AsyncHTTPClient, HTTPClient
 
 
 @dataclass(frozen=True, slots=True)
@@ -13,6 +16,63 @@ class ProxyConfig:
     https_proxy: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class RateLimitConfig:
+    """Adaptive per-host rate limit configuration, rates in requests/second."""
+
+    initial_rate: float = 1.0
+    min_rate: float = 0.1
+    max_rate: float = 5.0
+    burst: int = 1
+    increase_step: float = 0.05
+    decrease_factor: float = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class CircuitBreakerConfig:
+    """Per-host circuit breaker configuration."""
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    half_open_max_calls: int = 1
+
+
+@dataclass(frozen=True, slots=True)
+class RetryBudgetConfig:
+    """Run-wide retry budget, as a share of the requests made."""
+
+    ratio: float = 0.2
+    min_retries: int = 10
+
+
+@dataclass(frozen=True, slots=True)
+class CacheRule:
+    """Time-to-live override for URLs matching a regular expression."""
+
+    pattern: str
+    ttl: float
+
+
+@dataclass(frozen=True, slots=True)
+class HTTPCacheConfig:
+    """Persistent HTTP response cache configuration."""
+
+    path: str = ".cache/http_cache.sqlite3"
+    max_bytes: int = 512 * 1024 * 1024
+    default_ttl: float = 300.0
+    past_ttl: float = 30 * 24 * 3600.0
+    rules: tuple[CacheRule, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class CassetteConfig:
+    """HTTP record/replay configuration, mode is "record" or "replay"."""
+
+    mode: str
+    path: str
+    timing_scale: float = 1.0
+
+
 @dataclass(frozen=True, slots=True)
 class S3Config:
     """S3-compatible storage configuration (MinIO)."""
@@ -23,6 +83,58 @@ class S3Config:
     bucket_name: str
     use_ssl: bool = False
     region: str = "us-east-1"
+    part_size: int = 8 * 1024 * 1024
+    # Buckets created or found here are not checked again for bucket_cache_ttl
+    # seconds, None checks them on every run
+    bucket_cache_path: str | None = ".checkpoints/s3_buckets.json"
+    bucket_cache_ttl: float = 86400.0
+
+
+@dataclass(frozen=True, slots=True)
+class BackfillConfig:
+    """Date-range chunking configuration for backfill runs."""
+
+    window: str = "month"
+    max_workers: int = 4
+    checkpoint_path: str = ".checkpoints/fxstreet.sqlite3"
+
+
+@dataclass(frozen=True, slots=True)
+class IncrementalConfig:
+    """Incremental run configuration."""
+
+    volatile_days: int = 7
+    manifest_cache_path: str = ".checkpoints/fxstreet_manifest.json"
+    manifest_cache_ttl: float = 3600.0
+
+
+@dataclass(frozen=True, slots=True)
+class ShardingConfig:
+    """Calendar request sharding by "country" or "category", off when None."""
+
+    shard_by: str | None = None
+    shard_size: int = 10
+
+
+@dataclass(frozen=True, slots=True)
+class EnrichmentConfig:
+    """Event details enrichment configuration."""
+
+    details_store_path: str = ".checkpoints/fxstreet_event_details.sqlite3"
+    details_max_age: float = 30 * 24 * 3600.0
+    max_concurrency: int = 8
+    details_output_name_template: str = (
+        "fxstreet/event_details/{start_date}_{end_date}.json"
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class DeltaConfig:
+    """Change-data-capture configuration, deltas numbered by `{sequence}`."""
+
+    output_name_template: str = (
+        "fxstreet/deltas/{start_date}_{end_date}/{sequence:06d}.json"
+    )
 
 
 @dataclass(frozen=True, slots=True)
@@ -31,4 +143,94 @@ class FXStreetConfig:
 
     http_client: "HTTPClient"
     s3_config: S3Config
+    async_http_client: "AsyncHTTPClient | None" = None
     raw_output_name_template: str = "fxstreet/events/{start_date}_{end_date}.json"
+    backfill_config: BackfillConfig = field(default_factory=BackfillConfig)
+    incremental_config: IncrementalConfig = field(default_factory=IncrementalConfig)
+    enrichment_config: EnrichmentConfig = field(default_factory=EnrichmentConfig)
+    sharding_config: ShardingConfig = field(default_factory=ShardingConfig)
+    delta_config: DeltaConfig = field(default_factory=DeltaConfig)
+    bronze_codec: BronzeCodec = field(default_factory=BronzeCodec)
+    silver_output_prefix: str = "fxstreet/silver/events"
+    typed_events: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class DetailScrapeConfig:
+    """Detail page scraping configuration, `max_workers` parser processes."""
+
+    max_concurrency: int = 8
+    batch_size: int = 32
+    max_workers: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class InvestingConfig:
+    """Investing.com configuration."""
+
+    http_client: "HTTPClient"
+    s3_config: S3Config
+    async_http_client: "AsyncHTTPClient | None" = None
+    raw_output_name_template: str = "investing/events/{start_date}_{end_date}.json"
+    details_output_name_template: str = (
+        "investing/event_details/{start_date}_{end_date}.json"
+    )
+    checkpoint_path: str = ".checkpoints/investing.sqlite3"
+    bronze_codec: BronzeCodec = field(default_factory=BronzeCodec)
+    detail_scrape_config: DetailScrapeConfig = field(default_factory=DetailScrapeConfig)
+
+
+@dataclass(frozen=True, slots=True)
+class TradingViewConfig:
+    """TradingView configuration."""
+
+    http_client: "HTTPClient"
+    s3_config: S3Config
+    async_http_client: "AsyncHTTPClient | None" = None
+    raw_output_name_template: str = "trading_view/events/{start_date}_{end_date}.json"
+    details_output_name_template: str = (
+        "trading_view/event_details/{start_date}_{end_date}.json"
+    )
+    checkpoint_path: str = ".checkpoints/trading_view.sqlite3"
+    bronze_codec: BronzeCodec = field(default_factory=BronzeCodec)
+    detail_scrape_config: DetailScrapeConfig = field(default_factory=DetailScrapeConfig)
+
+
+@dataclass(frozen=True, slots=True)
+class BronzeSourceConfig:
+    """Location of the bronze calendar objects of an ingested source."""
+
+    bucket_name: str
+    raw_output_name_template: str
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogConfig:
+    """Unified catalog configuration, matching events across `sources`."""
+
+    s3_config: S3Config
+    sources: Mapping[str, BronzeSourceConfig]
+    crosswalk_output_prefix: str = "catalog/silver/crosswalk"
+    time_bucket_minutes: int = 10
+    manifest_cache_dir: str = ".checkpoints/catalog"
+
+
+@dataclass(frozen=True, slots=True)
+class PollHorizon:
+    """
+    Dates polled by serve mode, as day offsets from today, every `interval` seconds.
+    """
+
+    name: str
+    start_offset_days: int
+    end_offset_days: int
+    interval: float
+    mode: str = "raw"
+
+
+@dataclass(frozen=True, slots=True)
+class ServeConfig:
+    """Serve mode configuration, poll intervals jittered by +/- `jitter`."""
+
+    horizons: tuple[PollHorizon, ...] = ()
+    jitter: float = 0.1
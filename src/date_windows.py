@@ -0,0 +1,49 @@
+from datetime import date, timedelta
+
+WINDOW_SIZES = ("day", "week", "month")
+
+
+def _next_window_start(current: date, window: str) -> date:
+    if window == "day":
+        return current + timedelta(days=1)
+    if window == "week":
+        return current + timedelta(days=7 - current.weekday())
+    if current.month == 12:
+        return date(current.year + 1, 1, 1)
+    return date(current.year, current.month + 1, 1)
+
+
+def split_date_range(
+    start_date: date, end_date: date, window: str
+) -> list[tuple[date, date]]:
+    """
+    Split an inclusive date range into calendar-aligned windows.
+
+    Weeks start on Monday and months on the first day of the month, so the same
+    date always falls into the same window regardless of the requested range.
+    Only the first and last windows are clipped to the range boundaries.
+
+    Args:
+        start_date: First date of the range
+        end_date: Last date of the range (inclusive)
+        window: Window size, one of `WINDOW_SIZES`
+
+    Returns:
+        List of (window_start, window_end) tuples, both inclusive
+    """
+    if window not in WINDOW_SIZES:
+        msg = f"Invalid window: {window}. Expected one of {', '.join(WINDOW_SIZES)}"
+        raise ValueError(msg)
+
+    if start_date > end_date:
+        msg = f"Start date {start_date} is after end date {end_date}"
+        raise ValueError(msg)
+
+    windows: list[tuple[date, date]] = []
+    current = start_date
+    while current <= end_date:
+        next_start = _next_window_start(current, window)
+        windows.append((current, min(next_start - timedelta(days=1), end_date)))
+        current = next_start
+
+    return windows
@@ -0,0 +1,44 @@
+import hashlib
+import json
+from collections.abc import Iterable, Mapping
+
+
+def event_fingerprint(event: dict) -> bytes:
+    """Return a hash of every field of an event, independent of key order."""
+    payload = json.dumps(event, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def fingerprint_events(events: Iterable[dict]) -> dict[str, bytes]:
+    """Return the fingerprint of each event with an id, keyed by id."""
+    return {
+        event["id"]: event_fingerprint(event) for event in events if event.get("id")
+    }
+
+
+def changed_events(
+    previous_fingerprints: Mapping[str, bytes], events: Iterable[dict]
+) -> tuple[list[dict], int, int]:
+    """
+    Return the events that are new or differ from a previous snapshot.
+
+    Args:
+        previous_fingerprints: Fingerprints of the previous snapshot, by event id
+        events: Events of the fresh pull
+
+    Returns:
+        Changed and new events in pull order, and the number of new and of
+        changed events among them
+    """
+    delta = []
+    new = changed = 0
+    for event in events:
+        previous_fingerprint = previous_fingerprints.get(event.get("id"))
+        if previous_fingerprint is None:
+            new += 1
+        elif previous_fingerprint != event_fingerprint(event):
+            changed += 1
+        else:
+            continue
+        delta.append(event)
+    return delta, new, changed
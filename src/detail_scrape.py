@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import Executor
+from typing import TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 32
+
+# (key, raw body, encoding), decoded by the parser in the worker process
+DetailPage = tuple[str, bytes, str]
+
+RecordT = TypeVar("RecordT")
+
+
+async def scrape_details(
+    keys: Iterable[str],
+    fetch: Callable[[str], Awaitable[httpx.Response]],
+    parse_batch: Callable[[list[DetailPage]], list[RecordT]],
+    executor: Executor,
+    *,
+    max_concurrency: int = 8,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> tuple[list[RecordT], list[str]]:
+    """
+    Fetch detail pages concurrently and parse them in batches on an executor.
+
+    Pages are handed to `parse_batch` in groups of `batch_size` as soon as a
+    group is complete, so parsing overlaps with fetching. With a
+    `ProcessPoolExecutor` the CPU-bound parsing runs outside the GIL and only
+    raw page bytes and the compact parsed records cross the process boundary;
+    `parse_batch` must then be a module-level function.
+
+    Args:
+        keys: Detail page keys, e.g. event URLs or tickers, deduplicated here
+        fetch: Coroutine function fetching the page of a key
+        parse_batch: Function parsing a list of pages into records
+        executor: Executor running `parse_batch`
+        max_concurrency: Maximum number of pages being fetched at once
+        batch_size: Number of pages per `parse_batch` call
+
+    Returns:
+        Parsed records, and the keys whose page could not be fetched
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_page(key: str) -> DetailPage:
+        async with semaphore:
+            response = await fetch(key)
+        return key, response.content, response.encoding or "utf-8"
+
+    fetching = {
+        asyncio.ensure_future(fetch_page(key)): key for key in dict.fromkeys(keys)
+    }
+    parsing: list[asyncio.Future[list[RecordT]]] = []
+    failed_keys: list[str] = []
+    batch: list[DetailPage] = []
+
+    pending = set(fetching)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                exception = task.exception()
+                if exception is not None:
+                    logger.error(
+                        "Fetching details of %s failed",
+                        fetching[task],
+                        exc_info=exception,
+                    )
+                    failed_keys.append(fetching[task])
+                    continue
+
+                batch.append(task.result())
+                if len(batch) >= batch_size:
+                    parsing.append(loop.run_in_executor(executor, parse_batch, batch))
+                    batch = []
+
+        if batch:
+            parsing.append(loop.run_in_executor(executor, parse_batch, batch))
+
+        parsed_batches = await asyncio.gather(*parsing)
+    finally:
+        for task in pending:
+            task.cancel()
+
+    logger.info(
+        "Parsed %d detail pages in %d batches, %d failed",
+        sum(len(records) for records in parsed_batches),
+        len(parsed_batches),
+        len(failed_keys),
+    )
+    return [record for records in parsed_batches for record in records], failed_keys
@@ -0,0 +1,68 @@
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS event_details (
+    event_id TEXT PRIMARY KEY,
+    details TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+)
+"""
+
+# Stay well below SQLite's limit on bound parameters per statement
+_LOOKUP_BATCH_SIZE = 500
+
+
+class EventDetailsStore:
+    """Local SQLite store of event details keyed by event id."""
+
+    def __init__(self, path: Path, max_age: float) -> None:
+        """
+        Open (or create) the store.
+
+        Args:
+            path: Location of the SQLite database file
+            max_age: Seconds after which stored details are fetched again
+        """
+        self.path = path
+        self.max_age = max_age
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(SCHEMA)
+
+    def get_many(self, event_ids: Iterable[str]) -> dict[str, dict]:
+        """Return the fresh details stored for the given event ids."""
+        event_ids = list(event_ids)
+        oldest = time.time() - self.max_age
+        details = {}
+        for offset in range(0, len(event_ids), _LOOKUP_BATCH_SIZE):
+            batch = event_ids[offset : offset + _LOOKUP_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            rows = self._connection.execute(
+                "SELECT event_id, details FROM event_details "  # noqa: S608
+                f"WHERE fetched_at >= ? AND event_id IN ({placeholders})",
+                (oldest, *batch),
+            ).fetchall()
+            details.update(
+                (event_id, json.loads(payload)) for event_id, payload in rows
+            )
+        return details
+
+    def put(self, event_id: str, details: dict) -> None:
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO event_details (event_id, details, fetched_at) "
+                "VALUES (?, ?, ?)",
+                (event_id, json.dumps(details), time.time()),
+            )
+        logger.debug("Stored details for event %s", event_id)
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,246 @@
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+
+from src.config import HTTPCacheConfig
+
+logger = logging.getLogger(__name__)
+
+CACHEABLE_METHODS = ("GET", "POST")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+"""
+
+# Stored bodies are already decoded, so transfer framing headers no longer apply
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "connection"}
+)
+_DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """Response entry read back from the cache."""
+
+    url: str
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, method: str) -> httpx.Response:
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.body,
+            request=httpx.Request(method, self.url),
+        )
+
+
+class HTTPCache:
+    """
+    On-disk HTTP response cache with TTLs, revalidation and LRU eviction.
+
+    Entries are keyed on method, URL, query parameters and request body, and
+    stored in a single SQLite database shared by the sync and async clients.
+    """
+
+    def __init__(self, cache_config: HTTPCacheConfig) -> None:
+        self.cache_config = cache_config
+        self._rules = [
+            (re.compile(rule.pattern), rule.ttl) for rule in cache_config.rules
+        ]
+        self._lock = threading.Lock()
+
+        path = Path(cache_config.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+
+    @staticmethod
+    def cache_key(method: str, url: str, request_kwargs: dict[str, Any]) -> str | None:
+        """
+        Build the cache key of a request, or None if it is not cacheable.
+
+        Args:
+            method: HTTP method
+            url: Request URL without query parameters
+            request_kwargs: Keyword arguments passed to the httpx request
+
+        Returns:
+            SHA-256 hex digest identifying the request
+        """
+        method = method.upper()
+        if method not in CACHEABLE_METHODS:
+            return None
+
+        full_url, body = _describe_request(url, request_kwargs)
+        digest = hashlib.sha256()
+        for part in (method.encode(), full_url.encode(), body):
+            digest.update(part)
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def ttl_for(self, url: str, request_kwargs: dict[str, Any]) -> float:
+        """
+        Pick the time-to-live of a response.
+
+        Configured rules matched against the full URL win; otherwise requests
+        that only reference dates before today (historical ranges) get
+        `past_ttl` and everything else `default_ttl`.
+        """
+        full_url, body = _describe_request(url, request_kwargs)
+        for pattern, ttl in self._rules:
+            if pattern.search(full_url):
+                return ttl
+
+        dates = _DATE_PATTERN.findall(full_url + body.decode(errors="replace"))
+        today = date.today().isoformat()
+        if dates and all("-".join(parts) < today for parts in dates):
+            return self.cache_config.past_ttl
+        return self.cache_config.default_ttl
+
+    def lookup(self, cache_key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, status_code, headers, body, etag, last_modified, "
+                "expires_at FROM responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE responses SET last_access = ? WHERE cache_key = ?",
+                    (time.time(), cache_key),
+                )
+
+        url, status_code, headers, body, etag, last_modified, expires_at = row
+        return CachedResponse(
+            url=url,
+            status_code=status_code,
+            headers=[tuple(header) for header in json.loads(headers)],
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=expires_at,
+        )
+
+    def store(self, cache_key: str, response: httpx.Response, ttl: float) -> None:
+        url = str(response.request.url)
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        body = response.content
+        now = time.time()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (cache_key, url, status_code, "
+                "headers, body, etag, last_modified, expires_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    url,
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    response.headers.get("etag"),
+                    response.headers.get("last-modified"),
+                    now + ttl,
+                    now,
+                    len(body),
+                ),
+            )
+            self._evict()
+
+    def refresh(self, cache_key: str, ttl: float) -> None:
+        """Extend the lifetime of an entry after a 304 Not Modified."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET expires_at = ?, last_access = ? "
+                "WHERE cache_key = ?",
+                (now + ttl, now, cache_key),
+            )
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the size cap is respected."""
+        (total_size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        excess = total_size - self.cache_config.max_bytes
+        if excess <= 0:
+            return
+
+        evicted = 0
+        for cache_key, size in self._connection.execute(
+            "SELECT cache_key, size FROM responses ORDER BY last_access"
+        ).fetchall():
+            if excess <= 0:
+                break
+            self._connection.execute(
+                "DELETE FROM responses WHERE cache_key = ?", (cache_key,)
+            )
+            excess -= size
+            evicted += 1
+        logger.debug("Evicted %d cached responses", evicted)
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def _describe_request(url: str, request_kwargs: dict[str, Any]) -> tuple[str, bytes]:
+    """Return the full URL and canonical body bytes of a request."""
+    full_url = str(httpx.URL(url, params=request_kwargs.get("params")))
+    body = b""
+    if "data" in request_kwargs:
+        body = urlencode(sorted(request_kwargs["data"].items()), doseq=True).encode()
+    elif "json" in request_kwargs:
+        body = json.dumps(request_kwargs["json"], sort_keys=True).encode()
+    elif "content" in request_kwargs:
+        body = request_kwargs["content"]
+    return full_url, body
@@ -1,19 +1,213 @@
+import asyncio
 import logging
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import cast
 
 import httpx
 from tenacity import (
+    RetryCallState,
     retry,
-    retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
+from tenacity.wait import wait_base
 
+from src import metrics, profiling, tracing
+from src.circuit_breaker import CircuitBreaker, RetryBudget
 from src.config import ProxyConfig
+from src.http_cache import HTTPCache
+from src.rate_limiter import AdaptiveRateLimiter, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
+RETRY_BACKOFF_MAX = 60.0
+RETRY_AFTER_MAX = 300.0
+THROTTLE_STATUS_CODES = frozenset(
+    {httpx.codes.TOO_MANY_REQUESTS, httpx.codes.SERVICE_UNAVAILABLE}
+)
+
+# Streamed bodies are read by whoever consumes them, and JSON bodies decoded
+profiling.mark_stage("fetch", httpx.Response.iter_raw, httpx.Response.aiter_raw)
+profiling.mark_stage("decode", httpx.Response.json)
+
+
+def _is_retryable(exception: BaseException) -> bool:
+    """Retry transport errors, throttling and server errors, not client errors."""
+    if isinstance(exception, httpx.HTTPStatusError):
+        status_code = exception.response.status_code
+        return (
+            status_code in THROTTLE_STATUS_CODES
+            or status_code >= httpx.codes.INTERNAL_SERVER_ERROR
+        )
+    return isinstance(exception, (httpx.NetworkError, httpx.TimeoutException))
+
+
+class _wait_retry_after(wait_base):  # noqa: N801 - named like tenacity's waits
+    """Wait for the server's `Retry-After`, falling back to another strategy."""
+
+    def __init__(self, fallback: wait_base) -> None:
+        self.fallback = fallback
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exception = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exception, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(exception.response)
+            if retry_after is not None:
+                return min(retry_after, RETRY_AFTER_MAX)
+        return self.fallback(retry_state)
+
+
+def _build_retry(  # noqa: ANN202
+    max_retries: int,
+    retry_backoff_base: float,
+    retry_budget: RetryBudget | None = None,
+):
+    def should_retry(retry_state: RetryCallState) -> bool:
+        # The budget is only spent on failures that would otherwise be retried,
+        # so not on the last attempt, after which `stop` gives up anyway
+        exception = retry_state.outcome.exception() if retry_state.outcome else None
+        return (
+            exception is not None
+            and _is_retryable(exception)
+            and retry_state.attempt_number <= max_retries
+            and (retry_budget is None or retry_budget.try_spend())
+        )
+
+    return retry(
+        retry=should_retry,
+        stop=stop_after_attempt(max_retries + 1),
+        wait=_wait_retry_after(
+            wait_exponential(
+                multiplier=retry_backoff_base, min=1, max=RETRY_BACKOFF_MAX
+            )
+        ),
+        before_sleep=_record_retry,
+        reraise=True,
+    )
+
+
+def _record_retry(retry_state: RetryCallState) -> None:
+    exception = retry_state.outcome.exception() if retry_state.outcome else None
+    try:
+        host = exception.request.url.host
+    except (AttributeError, RuntimeError):
+        # Retried exceptions carry their request, unless raised before sending
+        host = "unknown"
+    sleep_time = retry_state.next_action.sleep if retry_state.next_action else 0.0
+    metrics.HTTP_RETRIES.inc(host=host)
+    metrics.HTTP_RETRY_SLEEP_SECONDS.inc(sleep_time, host=host)
+
+
+def _response_bytes(response: httpx.Response) -> int:
+    # Responses built in memory, e.g. by mock transports, are never downloaded
+    return response.num_bytes_downloaded or len(response.content)
+
+
+@contextmanager
+def _guard_circuit(circuit_breaker: CircuitBreaker | None, host: str) -> Iterator[None]:
+    """
+    Check the circuit of `host` before a request.
+
+    A half-open probe failing before its outcome is recorded, e.g. cancelled
+    while rate limited, gives its slot back instead of keeping the circuit
+    half-open for good.
+    """
+    probe = circuit_breaker is not None and circuit_breaker.before_request(host)
+    try:
+        yield
+    except BaseException:
+        if probe:
+            circuit_breaker.release_probe(host)
+        raise
+
+
+@contextmanager
+def _measure_request(method: str, host: str) -> Iterator[dict[str, object]]:
+    """Time an upstream request in the metrics and a trace span."""
+    with tracing.span("http.request", method=method, host=host) as attributes:
+        started_at = time.perf_counter()
+        try:
+            yield attributes
+        except httpx.TransportError:
+            metrics.HTTP_REQUESTS.inc(host=host, status="error")
+            raise
+        finally:
+            metrics.HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started_at, host=host
+            )
+
+
+def _record_response(
+    host: str, response: httpx.Response, attributes: dict[str, object]
+) -> None:
+    attributes["status"] = response.status_code
+    metrics.HTTP_REQUESTS.inc(host=host, status=response.status_code)
+    metrics.HTTP_REQUEST_BYTES.inc(
+        int(response.request.headers.get("content-length", 0)), host=host
+    )
+
+
+def _default_rate_limiter(rate_limit_delay: float) -> AdaptiveRateLimiter | None:
+    if rate_limit_delay <= 0:
+        return None
+    return AdaptiveRateLimiter.fixed(rate_limit_delay)
+
+
+def _observe_response(
+    rate_limiter: AdaptiveRateLimiter | None,
+    circuit_breaker: CircuitBreaker | None,
+    host: str,
+    response: httpx.Response,
+) -> None:
+    """Feed the outcome of a request back into the rate limiter and breaker."""
+    if circuit_breaker is not None:
+        # A throttling host is not healthy, even though 429 is a client error
+        if (
+            response.status_code >= httpx.codes.INTERNAL_SERVER_ERROR
+            or response.status_code in THROTTLE_STATUS_CODES
+        ):
+            circuit_breaker.record_failure(host)
+        else:
+            circuit_breaker.record_success(host)
+
+    if rate_limiter is None:
+        return
+
+    if response.status_code in THROTTLE_STATUS_CODES:
+        rate_limiter.on_throttle(host, parse_retry_after(response))
+    elif response.is_success:
+        rate_limiter.on_success(host)
+
+
+def _convert_proxy_config_to_httpx(
+    proxy_config: ProxyConfig | None,
+) -> dict[str, str] | None:
+    """
+    Convert ProxyConfig to httpx proxy format.
+
+    Args:
+        proxy_config: Proxy configuration to convert
+
+    Returns:
+        Dictionary with 'http://' and 'https://' keys,
+        or None if no proxy configured
+    """
+    if not proxy_config:
+        return None
+
+    if not proxy_config.http_proxy and not proxy_config.https_proxy:
+        return None
+
+    proxies: dict[str, str] = {}
+    if proxy_config.http_proxy:
+        proxies["http://"] = proxy_config.http_proxy
+    if proxy_config.https_proxy:
+        proxies["https://"] = proxy_config.https_proxy
+
+    return proxies if proxies else None
+
 
 class HTTPClient:
     """HTTP client with retry logic, rate limiting, and proxy support."""
@@ -25,6 +219,11 @@ class HTTPClient:
         retry_backoff_base: float = 2.0,
         rate_limit_delay: float = 1.0,
         proxy_config: ProxyConfig | None = None,
+        cache: HTTPCache | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         """
         Initialize HTTP client.
@@ -33,71 +232,104 @@ class HTTPClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             retry_backoff_base: Base for exponential backoff (seconds)
-            rate_limit_delay: Delay between requests in seconds
+            rate_limit_delay: Delay between requests in seconds, used when no
+                rate_limiter is given
             proxy_config: Optional proxy configuration
+            cache: Optional persistent response cache
+            rate_limiter: Optional adaptive per-host rate limiter
+            circuit_breaker: Optional per-host circuit breaker, failing fast
+                with `CircuitOpenError` while a host is unhealthy
+            retry_budget: Optional retry budget shared across requests
+            transport: Optional httpx transport replacing the network, e.g. an
+                `httpx.MockTransport`
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_backoff_base = retry_backoff_base
         self.rate_limit_delay = rate_limit_delay
         self.proxy_config = proxy_config
-        self._last_request_time: float = 0.0
+        self.cache = cache
+        self.rate_limiter = rate_limiter or _default_rate_limiter(rate_limit_delay)
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+
+        retry_decorator = _build_retry(max_retries, retry_backoff_base, retry_budget)
+        self._send = retry_decorator(self._send)
+        self._open_stream = retry_decorator(self._open_stream)
 
-        proxies = self._convert_proxy_config_to_httpx(proxy_config)
+        proxies = _convert_proxy_config_to_httpx(proxy_config)
         self._client = httpx.Client(
             proxy=cast("httpx.Proxy | None", proxies),
             timeout=timeout,
+            transport=transport,
         )
 
-    @staticmethod
-    def _convert_proxy_config_to_httpx(
-        proxy_config: ProxyConfig | None,
-    ) -> dict[str, str] | None:
+    def _enforce_rate_limit(self, host: str) -> None:
+        """Enforce the host's rate limit by sleeping if necessary."""
+        if self.rate_limiter is None:
+            return
+
+        sleep_time = self.rate_limiter.reserve(host)
+        if sleep_time > 0:
+            logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_time)
+            metrics.RATE_LIMIT_SLEEP_SECONDS.inc(sleep_time, host=host)
+            with tracing.span("rate_limit.wait", host=host):
+                time.sleep(sleep_time)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        ignore_codes: list[int] | None = None,
+        **kwargs,
+    ) -> httpx.Response:
         """
-        Convert ProxyConfig to httpx proxy format.
+        Make HTTP request with caching, retry logic and rate limiting.
+
+        Fresh cached responses are returned without touching the network, stale
+        ones are revalidated with `If-None-Match`/`If-Modified-Since`.
 
         Args:
-            proxy_config: Proxy configuration to convert
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            headers: Request headers
+            ignore_codes: List of HTTP status codes to ignore (don't raise)
+            **kwargs: Additional arguments passed to httpx request
 
         Returns:
-            Dictionary with 'http://' and 'https://' keys,
-            or None if no proxy configured
+            httpx.Response object
         """
-        if not proxy_config:
-            return None
+        cache_key = self.cache.cache_key(method, url, kwargs) if self.cache else None
+        cached = self.cache.lookup(cache_key) if self.cache and cache_key else None
+        if cached is not None and cached.is_fresh:
+            logger.debug("Cache hit for %s", url)
+            return cached.to_response(method)
 
-        if not proxy_config.http_proxy and not proxy_config.https_proxy:
-            return None
+        if cached is not None:
+            headers = {**(headers or {}), **cached.validators()}
+            ignore_codes = [*(ignore_codes or []), httpx.codes.NOT_MODIFIED]
 
-        proxies: dict[str, str] = {}
-        if proxy_config.http_proxy:
-            proxies["http://"] = proxy_config.http_proxy
-        if proxy_config.https_proxy:
-            proxies["https://"] = proxy_config.https_proxy
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        response = self._send(method, url, headers, ignore_codes, **kwargs)
+        if self.cache is None or cache_key is None:
+            return response
 
-        return proxies if proxies else None
+        ttl = self.cache.ttl_for(url, kwargs)
 
-    def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting by sleeping if necessary."""
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.debug("Cached response for %s revalidated", url)
+            self.cache.refresh(cache_key, ttl)
+            return cached.to_response(method)
 
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
-            logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_time)
-            time.sleep(sleep_time)
+        if response.status_code == httpx.codes.OK:
+            self.cache.store(cache_key, response, ttl)
 
-        self._last_request_time = time.time()
+        return response
 
-    @retry(
-        retry=retry_if_exception_type(
-            (httpx.NetworkError, httpx.TimeoutException, httpx.HTTPStatusError)
-        ),
-        stop=stop_after_attempt(4),  # 1 initial + 3 retries
-        wait=wait_exponential(multiplier=2, min=1, max=60),
-        reraise=True,
-    )
-    def request(
+    @profiling.stage("fetch")
+    def _send(
         self,
         method: str,
         url: str,
@@ -105,8 +337,212 @@ class HTTPClient:
         ignore_codes: list[int] | None = None,
         **kwargs,
     ) -> httpx.Response:
+        host = httpx.URL(url).host
+        with _guard_circuit(self.circuit_breaker, host):
+            self._enforce_rate_limit(host)
+
+            with _measure_request(method, host) as attributes:
+                try:
+                    response = self._client.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        **kwargs,
+                    )
+                except httpx.TransportError:
+                    if self.circuit_breaker is not None:
+                        self.circuit_breaker.record_failure(host)
+                    raise
+                _record_response(host, response, attributes)
+            metrics.HTTP_RESPONSE_BYTES.inc(_response_bytes(response), host=host)
+            _observe_response(self.rate_limiter, self.circuit_breaker, host, response)
+
+        if ignore_codes and response.status_code in ignore_codes:
+            return response
+
+        response.raise_for_status()
+
+        return response
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        **kwargs,
+    ) -> Iterator[httpx.Response]:
         """
-        Make HTTP request with retry logic and rate limiting.
+        Make HTTP request and yield the response without reading its body.
+
+        Opening the response is retried like `request`; once the body is being
+        consumed (e.g. with `iter_bytes`) errors propagate to the caller.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            headers: Request headers
+            **kwargs: Additional arguments passed to httpx request
+
+        Yields:
+            httpx.Response object with an unread body
+        """
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        response = self._open_stream(method, url, headers=headers, **kwargs)
+        try:
+            yield response
+        finally:
+            response.close()
+            metrics.HTTP_RESPONSE_BYTES.inc(
+                response.num_bytes_downloaded, host=response.request.url.host
+            )
+
+    @profiling.stage("fetch")
+    def _open_stream(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        host = httpx.URL(url).host
+        with _guard_circuit(self.circuit_breaker, host):
+            self._enforce_rate_limit(host)
+
+            request = self._client.build_request(
+                method=method,
+                url=url,
+                headers=headers,
+                **kwargs,
+            )
+            # Times the response headers, the body is streamed by the caller
+            with _measure_request(method, host) as attributes:
+                try:
+                    response = self._client.send(request, stream=True)
+                except httpx.TransportError:
+                    if self.circuit_breaker is not None:
+                        self.circuit_breaker.record_failure(host)
+                    raise
+                _record_response(host, response, attributes)
+            _observe_response(self.rate_limiter, self.circuit_breaker, host, response)
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            response.close()
+            raise
+
+        return response
+
+
+class AsyncHTTPClient:
+    """Asyncio HTTP client with bounded concurrency, retry logic, and rate limiting."""
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        retry_backoff_base: float = 2.0,
+        rate_limit_delay: float = 1.0,
+        max_concurrency: int = 8,
+        proxy_config: ProxyConfig | None = None,
+        cache: HTTPCache | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        Initialize async HTTP client.
+
+        Args:
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retry attempts
+            retry_backoff_base: Base for exponential backoff (seconds)
+            rate_limit_delay: Delay between request starts in seconds, used
+                when no rate_limiter is given
+            max_concurrency: Maximum number of requests in flight at once
+            proxy_config: Optional proxy configuration
+            cache: Optional persistent response cache
+            rate_limiter: Optional adaptive per-host rate limiter
+            circuit_breaker: Optional per-host circuit breaker, failing fast
+                with `CircuitOpenError` while a host is unhealthy
+            retry_budget: Optional retry budget shared across requests
+            transport: Optional httpx transport replacing the network, e.g. an
+                `httpx.MockTransport`, reused by the client of every event loop
+        """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff_base = retry_backoff_base
+        self.rate_limit_delay = rate_limit_delay
+        self.max_concurrency = max_concurrency
+        self.proxy_config = proxy_config
+        self.cache = cache
+        self.rate_limiter = rate_limiter or _default_rate_limiter(rate_limit_delay)
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.transport = transport
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore
+        self._client: httpx.AsyncClient
+
+        self._send = _build_retry(max_retries, retry_backoff_base, retry_budget)(
+            self._send
+        )
+
+    def _bind_to_running_loop(self) -> None:
+        """
+        Create the loop-bound client state on first use in each event loop.
+
+        Semaphores and pooled connections belong to the loop they were
+        created in, so a worker calling `asyncio.run` more than once gets a fresh
+        set for every run.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        proxies = _convert_proxy_config_to_httpx(self.proxy_config)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._client = httpx.AsyncClient(
+            proxy=cast("httpx.Proxy | None", proxies),
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_concurrency),
+            transport=self.transport,
+        )
+        self._loop = loop
+
+    async def _enforce_rate_limit(self, host: str) -> None:
+        """Space out request starts, without holding back requests in flight."""
+        if self.rate_limiter is None:
+            return
+
+        sleep_time = self.rate_limiter.reserve(host)
+        if sleep_time > 0:
+            logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_time)
+            metrics.RATE_LIMIT_SLEEP_SECONDS.inc(sleep_time, host=host)
+            with tracing.span("rate_limit.wait", host=host):
+                await asyncio.sleep(sleep_time)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        ignore_codes: list[int] | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Make HTTP request with caching, retry logic, rate limiting, and bounded
+        concurrency.
+
+        Fresh cached responses are returned without touching the network, stale
+        ones are revalidated with `If-None-Match`/`If-Modified-Since`.
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -118,14 +554,68 @@ class HTTPClient:
         Returns:
             httpx.Response object
         """
-        self._enforce_rate_limit()
+        cache_key = self.cache.cache_key(method, url, kwargs) if self.cache else None
+        cached = self.cache.lookup(cache_key) if self.cache and cache_key else None
+        if cached is not None and cached.is_fresh:
+            logger.debug("Cache hit for %s", url)
+            return cached.to_response(method)
 
-        response = self._client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            **kwargs,
-        )
+        if cached is not None:
+            headers = {**(headers or {}), **cached.validators()}
+            ignore_codes = [*(ignore_codes or []), httpx.codes.NOT_MODIFIED]
+
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        response = await self._send(method, url, headers, ignore_codes, **kwargs)
+        if self.cache is None or cache_key is None:
+            return response
+
+        ttl = self.cache.ttl_for(url, kwargs)
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.debug("Cached response for %s revalidated", url)
+            self.cache.refresh(cache_key, ttl)
+            return cached.to_response(method)
+
+        if response.status_code == httpx.codes.OK:
+            self.cache.store(cache_key, response, ttl)
+
+        return response
+
+    @profiling.stage("fetch")
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        ignore_codes: list[int] | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        self._bind_to_running_loop()
+        host = httpx.URL(url).host
+
+        async with self._semaphore:
+            # Checked once a slot is free, the circuit may have opened meanwhile
+            with _guard_circuit(self.circuit_breaker, host):
+                await self._enforce_rate_limit(host)
+
+                with _measure_request(method, host) as attributes:
+                    try:
+                        response = await self._client.request(
+                            method=method,
+                            url=url,
+                            headers=headers,
+                            **kwargs,
+                        )
+                    except httpx.TransportError:
+                        if self.circuit_breaker is not None:
+                            self.circuit_breaker.record_failure(host)
+                        raise
+                    _record_response(host, response, attributes)
+                metrics.HTTP_RESPONSE_BYTES.inc(_response_bytes(response), host=host)
+                _observe_response(
+                    self.rate_limiter, self.circuit_breaker, host, response
+                )
 
         if ignore_codes and response.status_code in ignore_codes:
             return response
@@ -133,3 +623,11 @@ class HTTPClient:
         response.raise_for_status()
 
         return response
+
+    async def aclose(self) -> None:
+        """Close the connection pool of the current event loop, if any."""
+        if self._loop is None:
+            return
+
+        await self._client.aclose()
+        self._loop = None
@@ -0,0 +1,153 @@
+import json
+import logging
+import re
+import time
+from collections.abc import Iterable
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+logger = logging.getLogger(__name__)
+
+
+class BronzeManifest:
+    """Index of existing bronze objects and their write times, cached locally."""
+
+    def __init__(
+        self,
+        s3_client: "BaseClient",
+        bucket_name: str,
+        prefix: str,
+        cache_path: Path,
+        cache_ttl: float = 3600.0,
+    ) -> None:
+        """
+        Initialize bronze manifest.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket_name: Bucket holding the bronze objects
+            prefix: Key prefix to index
+            cache_path: Location of the local cache file
+            cache_ttl: Maximum age of the cached listing in seconds
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self._objects: dict[str, float] | None = None
+
+    def objects(self, *, refresh: bool = False) -> dict[str, float]:
+        """
+        Return the indexed keys with their write times.
+
+        Args:
+            refresh: List the bucket even if the local cache is still fresh
+
+        Returns:
+            `LastModified` POSIX timestamp of each object key under the prefix
+        """
+        if self._objects is None and not refresh:
+            self._objects = self._load_cache()
+        if self._objects is None or refresh:
+            self._objects = self._list_objects()
+            self.save()
+        return self._objects
+
+    def keys(self, *, refresh: bool = False) -> set[str]:
+        """Return the indexed keys, see `objects`."""
+        return set(self.objects(refresh=refresh))
+
+    def keys_by_write_time(self, *, refresh: bool = False) -> list[str]:
+        """Return the indexed keys, least recently written first."""
+        objects = self.objects(refresh=refresh)
+        return sorted(objects, key=lambda key: (objects[key], key))
+
+    def add(self, key: str) -> None:
+        """Add a freshly written key to the index, if it has been loaded."""
+        if self._objects is not None:
+            self._objects[key] = time.time()
+
+    def save(self) -> None:
+        if self._objects is None:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache = {
+            "bucket_name": self.bucket_name,
+            "prefix": self.prefix,
+            "listed_at": time.time(),
+            "objects": dict(sorted(self._objects.items())),
+        }
+        self.cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+    def _load_cache(self) -> dict[str, float] | None:
+        if not self.cache_path.exists():
+            return None
+
+        try:
+            cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            logger.warning("Ignoring corrupt manifest cache %s", self.cache_path)
+            return None
+
+        # Caches without write times predate them, and are listed again
+        if (
+            cache.get("bucket_name") != self.bucket_name
+            or cache.get("prefix") != self.prefix
+            or time.time() - cache.get("listed_at", 0) > self.cache_ttl
+            or "objects" not in cache
+        ):
+            return None
+
+        logger.info("Loaded %d keys from manifest cache", len(cache["objects"]))
+        return cache["objects"]
+
+    def _list_objects(self) -> dict[str, float]:
+        logger.info("Listing s3://%s/%s ...", self.bucket_name, self.prefix)
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        objects = {
+            obj["Key"]: obj["LastModified"].timestamp()
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self.prefix)
+            for obj in page.get("Contents", [])
+        }
+        logger.info("Indexed %d existing objects", len(objects))
+        return objects
+
+
+def parse_bronze_windows(
+    keys: Iterable[str], raw_output_name_template: str
+) -> list[tuple[str, tuple[date, date]]]:
+    """
+    Return the keys written from a raw output template with their windows.
+
+    Keys match whatever bronze codec they were written with, and are returned
+    in the order of `keys`, e.g. `BronzeManifest.keys_by_write_time`.
+    """
+    template_stem = re.sub(r"\.(?:json|ndjson)$", "", raw_output_name_template)
+    pattern = re.compile(
+        re.escape(template_stem)
+        .replace(r"\{start_date\}", r"(?P<start_date>\d{4}-\d{2}-\d{2})")
+        .replace(r"\{end_date\}", r"(?P<end_date>\d{4}-\d{2}-\d{2})")
+        + r"\.(?:json|ndjson)(?:\.gz|\.zst)?"
+    )
+
+    bronze_windows = []
+    for key in keys:
+        match = pattern.fullmatch(key)
+        if match is None:
+            continue
+        bronze_windows.append(
+            (
+                key,
+                (
+                    date.fromisoformat(match["start_date"]),
+                    date.fromisoformat(match["end_date"]),
+                ),
+            )
+        )
+    return bronze_windows
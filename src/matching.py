@@ -0,0 +1,312 @@
+import hashlib
+import html
+import logging
+import re
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from typing import NamedTuple
+
+from src.parsers.investing import InvestingEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKET_MINUTES = 10
+
+# FXStreet `SUPPORTED_COUNTRIES` codes that are not ISO 3166 alpha-2, TradingView
+# `COUNTRIES` already are (with "EU" for the euro area)
+FXSTREET_COUNTRY_ALIASES = {"UK": "GB", "EMU": "EU"}
+
+# Investing `COUNTRIES_MAPPING` names to ISO 3166 alpha-2 codes
+INVESTING_COUNTRY_CODES = {
+    "Albania": "AL",
+    "Angola": "AO",
+    "Argentina": "AR",
+    "Australia": "AU",
+    "Austria": "AT",
+    "Azerbaijan": "AZ",
+    "Bahrain": "BH",
+    "Bangladesh": "BD",
+    "Belgium": "BE",
+    "Bermuda": "BM",
+    "Bosnia-Herzegovina": "BA",
+    "Botswana": "BW",
+    "Brazil": "BR",
+    "Bulgaria": "BG",
+    "Canada": "CA",
+    "Cayman Islands": "KY",
+    "Chile": "CL",
+    "China": "CN",
+    "Colombia": "CO",
+    "Costa Rica": "CR",
+    "Cote D'Ivoire": "CI",
+    "Croatia": "HR",
+    "Cyprus": "CY",
+    "Czech Republic": "CZ",
+    "Denmark": "DK",
+    "Ecuador": "EC",
+    "Egypt": "EG",
+    "Estonia": "EE",
+    "Euro Zone": "EU",
+    "Finland": "FI",
+    "France": "FR",
+    "Germany": "DE",
+    "Ghana": "GH",
+    "Greece": "GR",
+    "Hong Kong": "HK",
+    "Hungary": "HU",
+    "Iceland": "IS",
+    "India": "IN",
+    "Indonesia": "ID",
+    "Iraq": "IQ",
+    "Ireland": "IE",
+    "Israel": "IL",
+    "Italy": "IT",
+    "Jamaica": "JM",
+    "Japan": "JP",
+    "Jordan": "JO",
+    "Kazakhstan": "KZ",
+    "Kenya": "KE",
+    "Kuwait": "KW",
+    "Kyrgyzstan": "KG",
+    "Latvia": "LV",
+    "Lebanon": "LB",
+    "Lithuania": "LT",
+    "Luxembourg": "LU",
+    "Malawi": "MW",
+    "Malaysia": "MY",
+    "Malta": "MT",
+    "Mauritius": "MU",
+    "Mexico": "MX",
+    "Mongolia": "MN",
+    "Montenegro": "ME",
+    "Morocco": "MA",
+    "Mozambique": "MZ",
+    "Namibia": "NA",
+    "Netherlands": "NL",
+    "New Zealand": "NZ",
+    "Nigeria": "NG",
+    "Norway": "NO",
+    "Oman": "OM",
+    "Pakistan": "PK",
+    "Palestinian Territory": "PS",
+    "Paraguay": "PY",
+    "Peru": "PE",
+    "Philippines": "PH",
+    "Poland": "PL",
+    "Portugal": "PT",
+    "Qatar": "QA",
+    "Romania": "RO",
+    "Russia": "RU",
+    "Rwanda": "RW",
+    "Saudi Arabia": "SA",
+    "Serbia": "RS",
+    "Singapore": "SG",
+    "Slovakia": "SK",
+    "Slovenia": "SI",
+    "South Africa": "ZA",
+    "South Korea": "KR",
+    "Spain": "ES",
+    "Sri Lanka": "LK",
+    "Sweden": "SE",
+    "Switzerland": "CH",
+    "Taiwan": "TW",
+    "Tanzania": "TZ",
+    "Thailand": "TH",
+    "Tunisia": "TN",
+    "Türkiye": "TR",
+    "Uganda": "UG",
+    "Ukraine": "UA",
+    "United Arab Emirates": "AE",
+    "United Kingdom": "GB",
+    "United States": "US",
+    "Uruguay": "UY",
+    "Uzbekistan": "UZ",
+    "Venezuela": "VE",
+    "Vietnam": "VN",
+    "Zambia": "ZM",
+    "Zimbabwe": "ZW",
+}
+
+# Period and release qualifiers that differ between sources for the same event,
+# e.g. "CPI (Dec)", "GDP (Q4) Prel", "Retail Sales (MoM)"
+_PERIOD_QUALIFIERS = re.compile(
+    r"\((?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\)"
+    r"|\((?:q[1-4]|h[12]|\d{4})\)"
+    r"|\b(?:prel(?:iminary)?|final|flash|adv(?:ance)?|revised|sa|nsa)\b"
+)
+_RATE_OF_CHANGE = re.compile(r"\b([mqy])/?o?/?\1\b")
+_RATE_OF_CHANGE_NAMES = {"m": "mom", "q": "qoq", "y": "yoy"}
+_JOINED_CHARACTERS = re.compile(r"'|(?<=[a-z])-(?=[a-z])")
+_TOKEN_SEPARATOR = re.compile(r"[^0-9a-z]+")
+_STOPWORDS = frozenset(("the", "of", "and", "a", "an", "index", "rate"))
+
+
+class MatchCandidate(NamedTuple):
+    """Calendar event of one source, normalized for matching."""
+
+    source: str
+    event_id: str
+    country: str
+    datetime_utc: datetime
+    name: str
+
+
+class CrosswalkRow(NamedTuple):
+    """Source event and the cross-source match it belongs to."""
+
+    match_id: str
+    source: str
+    source_event_id: str
+    country: str
+    datetime_utc: datetime
+    canonical_name: str
+    name: str
+
+
+def normalize_country(country: str) -> str:
+    """
+    Return the ISO 3166 alpha-2 code of a country as written by any source.
+
+    Accepts FXStreet codes, Investing country names and TradingView codes.
+    """
+    if country in INVESTING_COUNTRY_CODES:
+        return INVESTING_COUNTRY_CODES[country]
+    code = country.strip().upper()
+    return FXSTREET_COUNTRY_ALIASES.get(code, code)
+
+
+def canonical_name(name: str) -> str:
+    """
+    Return the name of an event reduced to what identifies it across sources.
+
+    Case, punctuation, filler words, reference period and release stage are
+    dropped, rates of change are spelled one way and the remaining words are
+    sorted, so "Non-Farm Payrolls (Dec)" and "Nonfarm Payrolls", or "Trade
+    Balance" and "Balance of Trade", share the same canonical name.
+    """
+    name = html.unescape(name).casefold()
+    name = _RATE_OF_CHANGE.sub(lambda match: _RATE_OF_CHANGE_NAMES[match[1]], name)
+    name = _JOINED_CHARACTERS.sub("", _PERIOD_QUALIFIERS.sub(" ", name))
+    return " ".join(
+        sorted(
+            token
+            for token in _TOKEN_SEPARATOR.split(name)
+            if token and token not in _STOPWORDS
+        )
+    )
+
+
+def from_fxstreet(events: Iterable[dict]) -> Iterator[MatchCandidate]:
+    for event in events:
+        if not (event.get("id") and event.get("dateUtc") and event.get("name")):
+            continue
+        yield MatchCandidate(
+            "fxstreet",
+            event["id"],
+            normalize_country(event.get("countryCode") or ""),
+            _parse_iso_datetime(event["dateUtc"]),
+            event["name"],
+        )
+
+
+def from_investing(events: Iterable[InvestingEvent]) -> Iterator[MatchCandidate]:
+    for event in events:
+        if event.datetime_utc is None:
+            continue
+        yield MatchCandidate(
+            "investing",
+            event.row_id,
+            normalize_country(event.country or ""),
+            event.datetime_utc,
+            event.name,
+        )
+
+
+def from_trading_view(events: Iterable[dict]) -> Iterator[MatchCandidate]:
+    for event in events:
+        if not (event.get("id") and event.get("date") and event.get("title")):
+            continue
+        yield MatchCandidate(
+            "trading_view",
+            str(event["id"]),
+            normalize_country(event.get("country") or ""),
+            _parse_iso_datetime(event["date"]),
+            event["title"],
+        )
+
+
+def match_events(
+    candidates: Iterable[MatchCandidate],
+    bucket_minutes: int = DEFAULT_BUCKET_MINUTES,
+) -> list[CrosswalkRow]:
+    """
+    Group the events of all sources that describe the same release.
+
+    Events are indexed by (country, time bucket, canonical name) in a single
+    pass, so matching is linear in the number of events rather than comparing
+    every pair. An event also joins a match in the neighbouring buckets, which
+    absorbs sources disagreeing by a few minutes around a bucket boundary.
+
+    Args:
+        candidates: Events of any number of sources, newest versions first.
+            Later occurrences of an event already seen are ignored
+        bucket_minutes: Width of the time buckets
+
+    Returns:
+        One row per event, with the id of the match it belongs to. Events
+        without a counterpart form a match of their own.
+    """
+    bucket_seconds = bucket_minutes * 60
+    index: dict[tuple[str, int, str], str] = {}
+    rows: dict[tuple[str, str], CrosswalkRow] = {}
+
+    for candidate in candidates:
+        if (candidate.source, candidate.event_id) in rows:
+            continue
+
+        name = canonical_name(candidate.name)
+        bucket = int(candidate.datetime_utc.timestamp()) // bucket_seconds
+        match_id = next(
+            (
+                index[key]
+                for key in (
+                    (candidate.country, bucket, name),
+                    (candidate.country, bucket - 1, name),
+                    (candidate.country, bucket + 1, name),
+                )
+                if key in index
+            ),
+            None,
+        )
+        if match_id is None:
+            match_id = _match_id(candidate.country, bucket, name)
+        index.setdefault((candidate.country, bucket, name), match_id)
+
+        rows[candidate.source, candidate.event_id] = CrosswalkRow(
+            match_id,
+            candidate.source,
+            candidate.event_id,
+            candidate.country,
+            candidate.datetime_utc,
+            name,
+            candidate.name,
+        )
+
+    logger.info(
+        "Matched %d events into %d cross-source events",
+        len(rows),
+        len({row.match_id for row in rows.values()}),
+    )
+    return list(rows.values())
+
+
+def _match_id(country: str, bucket: int, name: str) -> str:
+    """Return an id that is stable across runs for the key founding a match."""
+    return hashlib.sha256(f"{country}|{bucket}|{name}".encode()).hexdigest()[:16]
+
+
+def _parse_iso_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
@@ -0,0 +1,236 @@
+import logging
+import math
+import os
+import threading
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class Counter:
+    """Monotonic counter, one value per combination of label values."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = _label_values(self.labels, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(_label_values(self.labels, labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{_format_labels(self.labels, key)} {_format(value)}"
+
+
+class Histogram:
+    """Cumulative histogram of observed values, e.g. latencies in seconds."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.buckets = (*sorted(buckets), math.inf)
+        # Per label values: count of each bucket (not cumulative), sum, count
+        self._values: dict[tuple[str, ...], tuple[list[int], float, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = _label_values(self.labels, labels)
+        bucket = next(i for i, bound in enumerate(self.buckets) if value <= bound)
+        with self._lock:
+            counts, total, count = self._values.get(
+                key, ([0] * len(self.buckets), 0.0, 0)
+            )
+            counts[bucket] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels: object) -> int:
+        with self._lock:
+            values = self._values.get(_label_values(self.labels, labels))
+        return 0 if values is None else values[2]
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = sorted(
+                (key, (counts.copy(), total, count))
+                for key, (counts, total, count) in self._values.items()
+            )
+        for key, (counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                cumulative += bucket_count
+                labels = _format_labels((*self.labels, "le"), (*key, _format(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labels, key)
+            yield f"{self.name}_sum{labels} {_format(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+MetricT = TypeVar("MetricT", Counter, Histogram)
+
+
+class MetricsRegistry:
+    """Metrics of the process, rendered in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram] = {}
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def _register(self, metric: MetricT) -> MetricT:
+        if metric.name in self._metrics:
+            msg = f"Metric {metric.name} is already registered"
+            raise ValueError(msg)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Path) -> None:
+        """
+        Write the metrics for the node_exporter textfile collector.
+
+        The file is replaced atomically, so the collector never reads a
+        partial file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}")
+        temporary_path.write_text(self.render(), encoding="utf-8")
+        temporary_path.replace(path)
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Upstream request latency, rate limit waits excluded",
+    ("host",),
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "Upstream requests by status code, error for transport errors",
+    ("host", "status"),
+)
+HTTP_REQUEST_BYTES = REGISTRY.counter(
+    "http_request_bytes_total", "Request body bytes sent upstream", ("host",)
+)
+HTTP_RESPONSE_BYTES = REGISTRY.counter(
+    "http_response_bytes_total",
+    "Response body bytes received, before decompression",
+    ("host",),
+)
+HTTP_RETRIES = REGISTRY.counter(
+    "http_retries_total", "Upstream requests retried", ("host",)
+)
+HTTP_RETRY_SLEEP_SECONDS = REGISTRY.counter(
+    "http_retry_sleep_seconds_total", "Time spent backing off retries", ("host",)
+)
+RATE_LIMIT_SLEEP_SECONDS = REGISTRY.counter(
+    "rate_limit_sleep_seconds_total", "Time spent waiting for rate limits", ("host",)
+)
+S3_REQUEST_SECONDS = REGISTRY.histogram(
+    "s3_request_duration_seconds",
+    "S3 request latency by operation, e.g. PutObject or UploadPart",
+    ("operation",),
+)
+EVENTS_UPLOADED = REGISTRY.counter(
+    "events_uploaded_total", "Bronze records uploaded", ("bucket",)
+)
+
+
+def start_http_server(
+    port: int, address: str = "", registry: MetricsRegistry = REGISTRY
+) -> "ThreadingHTTPServer":
+    """Serve the metrics on `/metrics` from a daemon thread."""
+    from http import HTTPStatus  # noqa: PLC0415
+    from http.server import (  # noqa: PLC0415
+        BaseHTTPRequestHandler,
+        ThreadingHTTPServer,
+    )
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            logger.debug(format, *args)
+
+    server = ThreadingHTTPServer((address, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    logger.info("Serving metrics on port %d", server.server_address[1])
+    return server
+
+
+def _label_values(names: tuple[str, ...], labels: dict[str, object]) -> tuple[str, ...]:
+    return tuple(str(labels[name]) for name in names)
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
@@ -0,0 +1,104 @@
+import logging
+import threading
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from typing import Any
+
+from src import tracing
+from src.scheduler import serve
+from src.worker_factory import build_serve_config, build_worker
+
+logger = logging.getLogger(__name__)
+
+
+def run_sources(
+    configs: Mapping[str, Mapping[str, Any]],
+    start_date: date,
+    end_date: date,
+    mode: str,
+    *,
+    resume: bool = False,
+) -> None:
+    """
+    Run the workers of several sources concurrently, one thread each.
+
+    Every worker is built inside its own thread, so it gets its own HTTP clients
+    and rate limits and its SQLite connections stay on the thread using them.
+    A failing source does not stop the others.
+
+    Args:
+        configs: Worker configuration per source name
+        start_date: First date to process
+        end_date: Last date to process
+        mode: Worker mode passed to every worker
+        resume: Skip windows already recorded as completed
+
+    Raises:
+        RuntimeError: If at least one source failed
+    """
+
+    def run_source(config_data: Mapping[str, Any]) -> None:
+        worker = build_worker(config_data)
+        with tracing.span("run", source=config_data["worker"], mode=mode):
+            worker.run(start_date, end_date, mode=mode, resume=resume)
+
+    with ThreadPoolExecutor(
+        max_workers=len(configs), thread_name_prefix="source"
+    ) as executor:
+        futures = {
+            source: executor.submit(run_source, config_data)
+            for source, config_data in configs.items()
+        }
+
+    _raise_for_failed_sources(futures)
+
+
+def serve_sources(
+    configs: Mapping[str, Mapping[str, Any]], stop_event: threading.Event
+) -> None:
+    """
+    Poll the horizons of several sources concurrently until `stop_event` is set.
+
+    Like `run_sources`, every worker is built in its own thread, once, and is
+    kept warm for all its polls.
+
+    Args:
+        configs: Worker configuration, with a `serve` section, per source name
+        stop_event: Event stopping every source once set
+
+    Raises:
+        RuntimeError: If at least one source could not be served
+    """
+
+    def serve_source(config_data: Mapping[str, Any]) -> None:
+        serve(build_worker(config_data), build_serve_config(config_data), stop_event)
+
+    with ThreadPoolExecutor(
+        max_workers=len(configs), thread_name_prefix="serve"
+    ) as executor:
+        futures = {
+            source: executor.submit(serve_source, config_data)
+            for source, config_data in configs.items()
+        }
+        for future in futures.values():
+            # A source that cannot start stops the others instead of leaving
+            # the daemon half running
+            future.add_done_callback(lambda _: stop_event.set())
+
+    _raise_for_failed_sources(futures)
+
+
+def _raise_for_failed_sources(futures: Mapping[str, Future[None]]) -> None:
+    failed_sources = []
+    for source, future in futures.items():
+        exception = future.exception()
+        if exception is None:
+            logger.info("Source %s completed", source)
+        else:
+            logger.error("Source %s failed", source, exc_info=exception)
+            failed_sources.append(source)
+
+    if failed_sources:
+        msg = f"Sources failed: {', '.join(failed_sources)}"
+        raise RuntimeError(msg)
@@ -0,0 +1,19 @@
+from .fxstreet import FXStreetEvent, decode_events, encode_event
+from .investing import (
+    InvestingEvent,
+    InvestingEventDetails,
+    iter_calendar_events,
+    parse_calendar_pages,
+)
+from .trading_view import TradingViewEventDetails
+
+__all__ = [
+    "FXStreetEvent",
+    "InvestingEvent",
+    "InvestingEventDetails",
+    "TradingViewEventDetails",
+    "decode_events",
+    "encode_event",
+    "iter_calendar_events",
+    "parse_calendar_pages",
+]
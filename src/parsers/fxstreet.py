@@ -0,0 +1,207 @@
+import json
+from collections.abc import Callable
+from operator import itemgetter
+from sys import intern
+from typing import NamedTuple
+
+from src import profiling
+from src.bronze_codec import iter_json_array_values
+
+# Payload key of every modelled FXStreetEvent field, in field order
+JSON_KEYS = (
+    "id",
+    "eventId",
+    "name",
+    "dateUtc",
+    "countryCode",
+    "categoryId",
+    "volatility",
+    "actual",
+    "consensus",
+    "previous",
+)
+
+
+class FXStreetEvent(NamedTuple):
+    """Calendar event of the FXStreet API, named like the silver columns."""
+
+    event_id: str
+    event_series_id: str | None
+    name: str | None
+    date_utc: str
+    country_code: str | None
+    category_id: str | None
+    volatility: str | None
+    actual: float | None
+    consensus: float | None
+    previous: float | None
+    # Values of the other payload fields, in payload order, and the payload
+    # key order, kept so that re-encoding gives back the bytes of the dict path
+    extra: tuple = ()
+    key_order: tuple[str, ...] = JSON_KEYS
+
+
+class _KeyLayout:
+    """Mapping between the payloads sharing one key order and their records."""
+
+    __slots__ = ("get_extra", "keys", "reorder")
+
+    def __init__(self, keys: tuple[str, ...]) -> None:
+        self.keys = tuple(map(intern, keys))
+        extra_keys = tuple(key for key in self.keys if key not in _KEY_SET)
+        self.get_extra: Callable[[dict], tuple] | None = (
+            _tuple_getter(extra_keys) if extra_keys else None
+        )
+        # Maps record values, modelled fields then extra, to the key order
+        record_keys = (*JSON_KEYS, *extra_keys)
+        positions = [record_keys.index(key) for key in self.keys]
+        self.reorder: Callable[[tuple], tuple] | None = (
+            None if positions == sorted(positions) else itemgetter(*positions)
+        )
+
+
+def _tuple_getter(keys: tuple[str, ...]) -> Callable[[dict], tuple]:
+    if len(keys) == 1:
+        (key,) = keys
+        return lambda payload: (payload[key],)
+    return itemgetter(*keys)
+
+
+_KEY_SET = frozenset(JSON_KEYS)
+_get_fields = itemgetter(*JSON_KEYS)
+
+_TEXT_TYPES = frozenset({str, type(None)})
+# bool is excluded, it is an int subclass but not a valid value
+_NUMBER_TYPES = frozenset({int, float, type(None)})
+_ENCODER = json.JSONEncoder()
+# Payloads are split into chunks of this size, so the decoded text of the
+# whole payload is never held at once
+_CHUNK_SIZE = 64 * 1024
+# Layout of every key order seen so far, records of events with the same keys
+# share its key tuple
+_LAYOUTS = {JSON_KEYS: _KeyLayout(JSON_KEYS)}
+# Field type combinations already validated, most events share a few
+_VALID_TYPES: set[tuple[type, ...]] = set()
+# Builds a record without the field count check of `FXStreetEvent._make`
+_new_event = tuple.__new__
+
+
+@profiling.stage("decode")
+def decode_events(payload: bytes) -> list[FXStreetEvent]:
+    """
+    Decode and validate a calendar response into compact event records.
+
+    Events are decoded one at a time from the payload and converted to their
+    record right away, so at most one event dict exists at once instead of
+    the whole decoded array. The fields the silver layer reads are required
+    and type checked, other fields are kept in `extra`. Strings repeated
+    across events, such as keys, series names, countries and release times,
+    are interned to share one object.
+
+    Args:
+        payload: JSON array body of a calendar response
+
+    Returns:
+        One `FXStreetEvent` per event, in payload order
+
+    Raises:
+        ValueError: If the payload is not an array of valid events
+    """
+    view = memoryview(payload)
+    chunks = (view[i : i + _CHUNK_SIZE] for i in range(0, len(view), _CHUNK_SIZE))
+    return [
+        _decode_event(index, event)
+        for index, event in enumerate(iter_json_array_values(chunks))
+    ]
+
+
+@profiling.stage("serialize")
+def encode_event(event: FXStreetEvent) -> bytes:
+    """Re-encode an event record exactly like `json.dumps` of its original dict."""
+    layout = _LAYOUTS.get(event.key_order) or _add_layout(event.key_order)
+    values = event[:10] + event.extra
+    if layout.reorder is not None:
+        values = layout.reorder(values)
+    return _ENCODER.encode(dict(zip(event.key_order, values, strict=True))).encode(
+        "utf-8"
+    )
+
+
+def _add_layout(keys: tuple[str, ...]) -> _KeyLayout:
+    return _LAYOUTS.setdefault(keys, _KeyLayout(keys))
+
+
+def _decode_event(index: int, event: object) -> FXStreetEvent:
+    if type(event) is not dict:
+        msg = f"FXStreet event {index} is not a JSON object"
+        raise ValueError(msg)
+
+    try:
+        fields = _get_fields(event)
+    except KeyError as error:
+        msg = f"FXStreet event {index} has no {error}"
+        raise ValueError(msg) from None
+    if tuple(map(type, fields)) not in _VALID_TYPES:
+        _validate_types(index, event, fields)
+
+    keys = tuple(event)
+    layout = _LAYOUTS.get(keys) or _add_layout(keys)
+    (
+        event_id,
+        event_series_id,
+        name,
+        date_utc,
+        country_code,
+        category_id,
+        volatility,
+        actual,
+        consensus,
+        previous,
+    ) = fields
+    return _new_event(
+        FXStreetEvent,
+        (
+            event_id,
+            event_series_id and intern(event_series_id),
+            name and intern(name),
+            intern(date_utc),
+            country_code and intern(country_code),
+            category_id and intern(category_id),
+            volatility and intern(volatility),
+            actual,
+            consensus,
+            previous,
+            () if layout.get_extra is None else layout.get_extra(event),
+            layout.keys,
+        ),
+    )
+
+
+def _validate_types(index: int, event: dict, fields: tuple) -> None:
+    (
+        event_id,
+        event_series_id,
+        name,
+        date_utc,
+        country_code,
+        category_id,
+        volatility,
+        actual,
+        consensus,
+        previous,
+    ) = fields
+    if (
+        type(event_id) is not str
+        or type(date_utc) is not str
+        or type(event_series_id) not in _TEXT_TYPES
+        or type(name) not in _TEXT_TYPES
+        or type(country_code) not in _TEXT_TYPES
+        or type(category_id) not in _TEXT_TYPES
+        or type(volatility) not in _TEXT_TYPES
+        or type(actual) not in _NUMBER_TYPES
+        or type(consensus) not in _NUMBER_TYPES
+        or type(previous) not in _NUMBER_TYPES
+    ):
+        msg = f"FXStreet event {index} has a field of an invalid type: {event!r}"
+        raise ValueError(msg)
+    _VALID_TYPES.add(tuple(map(type, fields)))
@@ -0,0 +1,191 @@
+import re
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from html import unescape
+from typing import NamedTuple
+
+from src import profiling
+from src.resources.investing import COUNTRIES_MAPPING
+
+# Flag titles carry the country name, the calendar filter uses its id
+COUNTRY_IDS = {name: country_id for country_id, name in COUNTRIES_MAPPING.items()}
+
+_ROW_START = '<tr id="eventRowId_'
+_ROW_END = "</tr>"
+_ROW_HEADER_PATTERN = re.compile(r'<tr id="eventRowId_(\d+)"([^>]*)>')
+_EVENT_ID_PATTERN = re.compile(r'event_attr_ID="(\d+)"')
+_DATETIME_PATTERN = re.compile(r'data-event-datetime="([^"]+)"')
+
+# Every pattern starts with a literal so the engine can skip ahead quickly, and
+# cell contents use an unrolled loop instead of a lazy `.*?`
+_CELL_CONTENT = r"([^<]*(?:<(?!/td>)[^<]*)*)</td>"
+_FLAG_PATTERN = re.compile(
+    r'<span title="([^"]*)" class="ceFlags[^>]*>[^<]*</span>([^<]*)'
+)
+_IMPORTANCE_PATTERN = re.compile(r'data-img_key="bull(\d)"')
+_EVENT_CELL_PATTERN = re.compile(r'<td class="left event"[^>]*>' + _CELL_CONTENT)
+_HREF_PATTERN = re.compile(r'href="([^"]*)"')
+_ACTUAL_PATTERN = re.compile(r'id="eventActual_\d+"[^>]*>' + _CELL_CONTENT)
+_FORECAST_PATTERN = re.compile(r'id="eventForecast_\d+"[^>]*>' + _CELL_CONTENT)
+_PREVIOUS_PATTERN = re.compile(r'id="eventPrevious_\d+"[^>]*>' + _CELL_CONTENT)
+_TAG_PATTERN = re.compile(r"<[^>]*>")
+
+
+class InvestingEvent(NamedTuple):
+    """Calendar row of an Investing.com economic event."""
+
+    row_id: str
+    event_id: str | None
+    datetime_utc: datetime | None
+    country_id: str | None
+    country: str | None
+    currency: str | None
+    importance: int | None
+    name: str
+    url: str | None
+    actual: str | None
+    forecast: str | None
+    previous: str | None
+
+
+@profiling.stage("decode")
+def iter_calendar_events(fragment: str) -> Iterator[InvestingEvent]:
+    """
+    Parse the HTML table fragment of a calendar page into events.
+
+    Rows are located with `str.find` and their cells matched in place with
+    precompiled patterns, without building a DOM or slicing the fragment. Day
+    separator rows are skipped. Times are UTC as the calendar is
+    requested with `timeZone` 55.
+
+    Args:
+        fragment: `data` field of a `getCalendarFilteredData` response
+
+    Yields:
+        One `InvestingEvent` per event row
+    """
+    for start, end in _iter_row_spans(fragment):
+        header = _ROW_HEADER_PATTERN.match(fragment, start, end)
+        if header is None:
+            continue
+        row_id, attributes = header.groups()
+        body_start = header.end()
+
+        event_id = _EVENT_ID_PATTERN.search(attributes)
+        event_datetime = _DATETIME_PATTERN.search(attributes)
+        flag = _FLAG_PATTERN.search(fragment, body_start, end)
+        importance = _IMPORTANCE_PATTERN.search(fragment, body_start, end)
+        event_cell = _EVENT_CELL_PATTERN.search(fragment, body_start, end)
+        href = _HREF_PATTERN.search(event_cell.group(1)) if event_cell else None
+
+        country = unescape(flag.group(1)) if flag else None
+        yield InvestingEvent(
+            row_id=row_id,
+            event_id=event_id.group(1) if event_id else None,
+            datetime_utc=(
+                _parse_datetime(event_datetime.group(1)) if event_datetime else None
+            ),
+            country_id=COUNTRY_IDS.get(country) if country else None,
+            country=country,
+            currency=(flag.group(2).strip() or None) if flag else None,
+            importance=int(importance.group(1)) if importance else None,
+            name=(_cell_text(event_cell.group(1)) if event_cell else None) or "",
+            url=unescape(href.group(1)) if href else None,
+            actual=_search_cell_text(_ACTUAL_PATTERN, fragment, body_start, end),
+            forecast=_search_cell_text(_FORECAST_PATTERN, fragment, body_start, end),
+            previous=_search_cell_text(_PREVIOUS_PATTERN, fragment, body_start, end),
+        )
+
+
+def parse_calendar_pages(pages: Iterable[dict]) -> Iterator[InvestingEvent]:
+    """Parse calendar pages lazily, e.g. straight from `iter_calendar_pages`."""
+    for page in pages:
+        yield from iter_calendar_events(page["data"])
+
+
+def _parse_datetime(value: str) -> datetime:
+    # "2025/01/06 13:30:00", fromisoformat is much faster than strptime
+    return datetime.fromisoformat(value.replace("/", "-")).replace(tzinfo=UTC)
+
+
+def _iter_row_spans(fragment: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) offsets of event rows, scanning with `str.find`."""
+    start = fragment.find(_ROW_START)
+    while start != -1:
+        end = fragment.find(_ROW_END, start)
+        if end == -1:
+            end = len(fragment)
+        yield start, end
+        start = fragment.find(_ROW_START, end)
+
+
+def _search_cell_text(
+    pattern: re.Pattern[str], fragment: str, start: int, end: int
+) -> str | None:
+    match = pattern.search(fragment, start, end)
+    return _cell_text(match.group(1)) if match else None
+
+
+def _cell_text(html: str) -> str | None:
+    if "<" in html:
+        html = _TAG_PATTERN.sub("", html)
+    if "&" in html:
+        html = unescape(html)
+    return " ".join(html.split()) or None
+
+
+class InvestingEventDetails(NamedTuple):
+    """Overview of an Investing.com event page."""
+
+    event_url: str
+    title: str | None
+    description: str | None
+    importance: int | None
+    country: str | None
+    currency: str | None
+    source: str | None
+    source_url: str | None
+
+
+_TITLE_PATTERN = re.compile(r'<h1 class="ecTitle[^>]*>([^<]*)</h1>')
+_OVERVIEW_PATTERN = re.compile(
+    r'<div id="overViewBox"[^>]*>\s*<div class="left">([^<]*(?:<(?!/div>)[^<]*)*)'
+)
+_DETAILS_COUNTRY_PATTERN = re.compile(r'Country:</span>\s*<span>\s*<i title="([^"]*)"')
+_DETAILS_CURRENCY_PATTERN = re.compile(r"Currency:</span>\s*<span>([^<]*)</span>")
+_DETAILS_SOURCE_PATTERN = re.compile(
+    r'Source:</span>\s*<span>\s*<a href="([^"]*)"[^>]*title="([^"]*)"'
+)
+
+
+@profiling.stage("decode")
+def parse_event_details_page(event_url: str, html: str) -> InvestingEventDetails:
+    """Extract the overview box of an event page fetched by `get_event_details`."""
+    title = _TITLE_PATTERN.search(html)
+    overview = _OVERVIEW_PATTERN.search(html)
+    overview_end = overview.end() if overview else 0
+    importance = _IMPORTANCE_PATTERN.search(html, overview_end)
+    country = _DETAILS_COUNTRY_PATTERN.search(html, overview_end)
+    currency = _DETAILS_CURRENCY_PATTERN.search(html, overview_end)
+    source = _DETAILS_SOURCE_PATTERN.search(html, overview_end)
+
+    return InvestingEventDetails(
+        event_url=event_url,
+        title=_cell_text(title.group(1)) if title else None,
+        description=_cell_text(overview.group(1)) if overview else None,
+        importance=int(importance.group(1)) if importance else None,
+        country=unescape(country.group(1)) if country else None,
+        currency=_cell_text(currency.group(1)) if currency else None,
+        source=unescape(source.group(2)) if source else None,
+        source_url=unescape(source.group(1)) if source else None,
+    )
+
+
+def parse_event_details_batch(
+    pages: list[tuple[str, bytes, str]],
+) -> list[InvestingEventDetails]:
+    """Parse (event_url, content, encoding) pages, e.g. in a worker process."""
+    return [
+        parse_event_details_page(event_url, content.decode(encoding, "replace"))
+        for event_url, content, encoding in pages
+    ]
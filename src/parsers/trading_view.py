@@ -0,0 +1,48 @@
+import re
+from html import unescape
+from typing import NamedTuple
+
+from src import profiling
+
+
+class TradingViewEventDetails(NamedTuple):
+    """Metadata of a TradingView economic indicator page."""
+
+    event_ticker: str
+    title: str | None
+    description: str | None
+    canonical_url: str | None
+
+
+_TITLE_PATTERN = re.compile(r"<title>([^<]*)</title>")
+_DESCRIPTION_PATTERN = re.compile(r'<meta name="description" content="([^"]*)"')
+_CANONICAL_PATTERN = re.compile(r'<link rel="canonical" href="([^"]*)"')
+
+
+@profiling.stage("decode")
+def parse_event_details_page(event_ticker: str, html: str) -> TradingViewEventDetails:
+    """Extract the page metadata of an indicator fetched by `get_event_details`."""
+    title = _TITLE_PATTERN.search(html)
+    description = _DESCRIPTION_PATTERN.search(html)
+    canonical = _CANONICAL_PATTERN.search(html)
+
+    return TradingViewEventDetails(
+        event_ticker=event_ticker,
+        title=_text(title.group(1)) if title else None,
+        description=_text(description.group(1)) if description else None,
+        canonical_url=unescape(canonical.group(1)) if canonical else None,
+    )
+
+
+def parse_event_details_batch(
+    pages: list[tuple[str, bytes, str]],
+) -> list[TradingViewEventDetails]:
+    """Parse (event_ticker, content, encoding) pages, e.g. in a worker process."""
+    return [
+        parse_event_details_page(event_ticker, content.decode(encoding, "replace"))
+        for event_ticker, content, encoding in pages
+    ]
+
+
+def _text(value: str) -> str | None:
+    return " ".join(unescape(value).split()) or None
@@ -0,0 +1,223 @@
+import json
+import logging
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from tracemalloc import Snapshot
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+STAGES = ("fetch", "decode", "serialize", "upload")
+OTHER_STAGE = "other"
+
+# Code objects of the functions marking a stage, the innermost one on a sampled
+# stack gives the stage of the sample
+_stage_codes: dict[CodeType, str] = {}
+
+
+def mark_stage(name: str, *functions: Callable) -> None:
+    """Attribute the time spent in `functions`, and what they call, to a stage."""
+    if name not in STAGES:
+        msg = f"Unknown profiling stage: {name}"
+        raise ValueError(msg)
+    for function in functions:
+        _stage_codes[function.__code__] = name
+
+
+def stage(name: str) -> Callable[[F], F]:
+    """Decorator marking a function as a stage, see `mark_stage`."""
+
+    def mark(function: F) -> F:
+        mark_stage(name, function)
+        return function
+
+    return mark
+
+
+mark_stage("decode", json.loads)
+mark_stage("serialize", json.dumps)
+
+
+class SamplingProfiler:
+    """
+    Wall-clock sampling profiler of every thread, split by pipeline stage.
+
+    Stacks are sampled from a background thread every `interval` seconds, so
+    the profiled code runs unmodified. Time a thread spends blocked, e.g. on
+    a synchronous request, counts like time spent computing. Only the running
+    asyncio task is on its thread's stack though: time tasks spend suspended
+    on an `await`, e.g. on the network, shows up as the event loop waiting in
+    its selector under the other stage, not in the stage of the awaiting
+    task. Allocations are traced with tracemalloc and snapshotted whenever the
+    traced memory reaches a new peak.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.005,
+        top: int = 25,
+        memory_check_interval: float = 1.0,
+        traceback_frames: int = 10,
+    ) -> None:
+        self.interval = interval
+        self.top = top
+        self.memory_check_interval = memory_check_interval
+        self.traceback_frames = traceback_frames
+        self._stacks: dict[str, Counter[tuple[CodeType, ...]]] = defaultdict(Counter)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+        self._seconds = 0.0
+        self._peak_memory = 0
+        self._peak_snapshot: Snapshot | None = None
+
+    def start(self) -> None:
+        import tracemalloc  # noqa: PLC0415
+
+        tracemalloc.start(self.traceback_frames)
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._sample_until_stopped, name="profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        import tracemalloc  # noqa: PLC0415
+
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._seconds = time.perf_counter() - self._started_at
+        self._check_memory()
+        tracemalloc.stop()
+
+    def write(self, output_dir: Path) -> None:
+        """
+        Write the profiles of each stage and the allocation snapshot.
+
+        Every stage gets `<stage>.txt`, its hottest functions, and
+        `<stage>.folded`, its collapsed stacks for flame graph tools such as
+        speedscope or flamegraph.pl. `allocations.txt` holds the lines
+        allocating the most memory at the peak.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        total_samples = sum(sum(stacks.values()) for stacks in self._stacks.values())
+        summary = [
+            (
+                f"{self._seconds:.2f} s sampled every {self.interval * 1000:g} ms, "
+                f"{total_samples} thread samples"
+            ),
+            "",
+        ]
+        for name in (*STAGES, OTHER_STAGE):
+            stacks = self._stacks.get(name, Counter())
+            samples = sum(stacks.values())
+            summary.append(
+                f"{name:<10} {samples:>8} samples "
+                f"{samples / max(total_samples, 1):>7.1%}"
+            )
+            (output_dir / f"{name}.folded").write_text(
+                "".join(
+                    f"{';'.join(_describe(code) for code in reversed(stack))} {count}\n"
+                    for stack, count in stacks.most_common()
+                ),
+                encoding="utf-8",
+            )
+            (output_dir / f"{name}.txt").write_text(
+                _format_stage(name, stacks, self.top), encoding="utf-8"
+            )
+        (output_dir / "summary.txt").write_text(
+            "\n".join(summary) + "\n", encoding="utf-8"
+        )
+        (output_dir / "allocations.txt").write_text(
+            self._format_allocations(), encoding="utf-8"
+        )
+        logger.info("Wrote profiles to %s", output_dir)
+
+    def _sample_until_stopped(self) -> None:
+        own_thread_id = threading.get_ident()
+        next_memory_check = time.monotonic()
+        while not self._stop_event.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():  # noqa: SLF001
+                if thread_id != own_thread_id:
+                    self._sample(frame)
+            if time.monotonic() >= next_memory_check:
+                self._check_memory()
+                next_memory_check = time.monotonic() + self.memory_check_interval
+
+    def _sample(self, frame: FrameType | None) -> None:
+        stack = []
+        stage_name = None
+        while frame is not None:
+            code = frame.f_code
+            if stage_name is None:
+                stage_name = _stage_codes.get(code)
+            stack.append(code)
+            frame = frame.f_back
+        self._stacks[stage_name or OTHER_STAGE][tuple(stack)] += 1
+
+    def _check_memory(self) -> None:
+        import tracemalloc  # noqa: PLC0415
+
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self._peak_memory:
+            self._peak_memory = current
+            self._peak_snapshot = tracemalloc.take_snapshot()
+
+    def _format_allocations(self) -> str:
+        import tracemalloc  # noqa: PLC0415
+
+        lines = [f"Traced memory peak: {self._peak_memory / 2**20:.1f} MiB", ""]
+        if self._peak_snapshot is None:
+            return "\n".join(lines) + "\n"
+
+        snapshot = self._peak_snapshot.filter_traces(
+            (
+                tracemalloc.Filter(inclusive=False, filename_pattern=__file__),
+                tracemalloc.Filter(inclusive=False, filename_pattern="<frozen *>"),
+            )
+        )
+        for statistic in snapshot.statistics("traceback")[: self.top]:
+            lines.append(
+                f"{statistic.size / 2**20:8.2f} MiB {statistic.count:>9} blocks"
+            )
+            lines.extend(f"    {line}" for line in statistic.traceback.format())
+        return "\n".join(lines) + "\n"
+
+
+def _format_stage(name: str, stacks: Counter[tuple[CodeType, ...]], top: int) -> str:
+    samples = sum(stacks.values())
+    self_samples: Counter[CodeType] = Counter()
+    total_samples: Counter[CodeType] = Counter()
+    for stack, count in stacks.items():
+        self_samples[stack[0]] += count
+        for code in set(stack):
+            total_samples[code] += count
+
+    lines = [f"{name}: {samples} samples", "", "   self   total  function"]
+    lines.extend(
+        f"{count / samples:>7.1%} {total_samples[code] / samples:>7.1%}  "
+        f"{_describe(code)}"
+        for code, count in self_samples.most_common(top)
+    )
+    lines.extend(["", "  total  function"])
+    lines.extend(
+        f"{count / samples:>7.1%}  {_describe(code)}"
+        for code, count in total_samples.most_common(top)
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _describe(code: CodeType) -> str:
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
@@ -0,0 +1,128 @@
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from src.config import RateLimitConfig
+
+logger = logging.getLogger(__name__)
+
+
+class _HostBucket:
+    __slots__ = ("blocked_until", "rate", "tokens", "updated")
+
+    def __init__(self, rate: float, tokens: float) -> None:
+        self.rate = rate
+        self.tokens = tokens
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket rate limiter per host with additive increase and
+    multiplicative decrease.
+
+    Every healthy response raises the host's rate by `increase_step` up to
+    `max_rate`; a 429 or 503 multiplies it by `decrease_factor` down to
+    `min_rate` and blocks the host for the `Retry-After` period, if given.
+    """
+
+    def __init__(self, rate_limit_config: RateLimitConfig) -> None:
+        self.rate_limit_config = rate_limit_config
+        self._buckets: dict[str, _HostBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def fixed(cls, rate_limit_delay: float) -> "AdaptiveRateLimiter":
+        """Build a non-adaptive limiter spacing requests by `rate_limit_delay`."""
+        rate = 1.0 / rate_limit_delay
+        return cls(
+            RateLimitConfig(
+                initial_rate=rate,
+                min_rate=rate,
+                max_rate=rate,
+                burst=1,
+                increase_step=0.0,
+                decrease_factor=1.0,
+            )
+        )
+
+    def reserve(self, host: str) -> float:
+        """
+        Take a token for the next request to `host`.
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._get_bucket(host, now)
+            bucket.tokens = min(
+                self.rate_limit_config.burst,
+                bucket.tokens + (now - bucket.updated) * bucket.rate,
+            )
+            bucket.updated = now
+            bucket.tokens -= 1
+
+            wait = max(-bucket.tokens / bucket.rate, bucket.blocked_until - now, 0.0)
+        return wait
+
+    def on_success(self, host: str) -> None:
+        with self._lock:
+            bucket = self._get_bucket(host, time.monotonic())
+            bucket.rate = min(
+                self.rate_limit_config.max_rate,
+                bucket.rate + self.rate_limit_config.increase_step,
+            )
+
+    def on_throttle(self, host: str, retry_after: float | None = None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._get_bucket(host, now)
+            bucket.rate = max(
+                self.rate_limit_config.min_rate,
+                bucket.rate * self.rate_limit_config.decrease_factor,
+            )
+            bucket.tokens = min(bucket.tokens, 0.0)
+            if retry_after is not None:
+                bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+            rate = bucket.rate
+
+        logger.warning(
+            "Throttled by %s, slowing down to %.2f requests/s (retry after %s)",
+            host,
+            rate,
+            retry_after,
+        )
+
+    def _get_bucket(self, host: str, now: float) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = _HostBucket(
+                rate=self.rate_limit_config.initial_rate,
+                tokens=self.rate_limit_config.burst,
+            )
+            bucket.updated = now
+            self._buckets[host] = bucket
+        return bucket
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """Parse a `Retry-After` header given in seconds or as an HTTP date."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
@@ -1,4 +1,23 @@
-from .fxstreet import FXStreetResource
-from .investing import InvestingResource
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["FXStreetResource", "InvestingResource"]
+if TYPE_CHECKING:
+    from .fxstreet import FXStreetResource
+    from .investing import InvestingResource
+    from .trading_view import TradingViewResource
+
+# Resources by name, imported from their module on first access
+_RESOURCE_MODULES = {
+    "FXStreetResource": ".fxstreet",
+    "InvestingResource": ".investing",
+    "TradingViewResource": ".trading_view",
+}
+
+__all__ = ["FXStreetResource", "InvestingResource", "TradingViewResource"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _RESOURCE_MODULES:
+        return getattr(import_module(_RESOURCE_MODULES[name], __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,10 +1,20 @@
+import asyncio
 import logging
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from datetime import date, datetime, time
+from operator import attrgetter, methodcaller
+from typing import TypeVar
 
-from src.http_client import HTTPClient
+import httpx
+
+from src.http_client import AsyncHTTPClient, HTTPClient
+from src.parsers.fxstreet import FXStreetEvent, decode_events
 
 logger = logging.getLogger(__name__)
 
+EventT = TypeVar("EventT", dict, FXStreetEvent)
+
 EVENTS_API_URL_TEMPLATE = (
     "https://calendar-api.fxsstatic.com/en/api/v2/eventDates/{start_date}/{end_date}"
 )
@@ -106,9 +116,11 @@ SUPPORTED_VOLATILITIES = ["NONE", "LOW", "MEDIUM", "HIGH"]
 EVENTS_API_PARAMS = {
     "volatilities": SUPPORTED_VOLATILITIES,
     "countries": SUPPORTED_COUNTRIES,
-    "categories": CATEGORY_MAPPING.keys(),
+    "categories": list(CATEGORY_MAPPING),
 }
 
+SHARD_KEYS = {"country": "countries", "category": "categories"}
+
 REQUEST_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 
@@ -116,14 +128,23 @@ class FXStreetResource:
     def __init__(
         self,
         http_client: HTTPClient,
+        async_http_client: AsyncHTTPClient | None = None,
     ) -> None:
         """
         Initialize FXStreet resource.
 
         Args:
             http_client: HTTP client instance with retry and rate limiting
+            async_http_client: Optional async HTTP client used by the `a*` methods
         """
         self.http_client = http_client
+        self.async_http_client = async_http_client
+
+    def _get_async_http_client(self) -> AsyncHTTPClient:
+        if self.async_http_client is None:
+            msg = "FXStreetResource was created without an async HTTP client"
+            raise RuntimeError(msg)
+        return self.async_http_client
 
     def create_request_url(self, start_date: date, end_date: date) -> str:
         start_dt = datetime.combine(start_date, time(hour=0, minute=0, second=0))
@@ -145,6 +166,21 @@ class FXStreetResource:
         )
         return response.json()
 
+    @contextmanager
+    def stream_calendar_events(
+        self, start_date: date, end_date: date
+    ) -> Iterator[httpx.Response]:
+        """Yield the calendar response unread, for piping its raw JSON bytes."""
+        logger.info("Streaming calendar events for %s to %s ...", start_date, end_date)
+        url = self.create_request_url(start_date, end_date)
+        with self.http_client.stream(
+            method="GET",
+            url=url,
+            headers=HEADERS,
+            params=EVENTS_API_PARAMS,
+        ) as response:
+            yield response
+
     def get_event_details(self, event_id: str) -> dict:
         logger.info("Getting event details for %s ...", event_id)
         url = EVENT_DETAILS_API_URL_TEMPLATE.format(event_id=event_id)
@@ -154,3 +190,141 @@ class FXStreetResource:
             headers=HEADERS,
         )
         return response.json()
+
+    async def aget_calendar_events(
+        self, start_date: date, end_date: date
+    ) -> list[dict]:
+        logger.info("Getting calendar events for %s to %s ...", start_date, end_date)
+        url = self.create_request_url(start_date, end_date)
+        response = await self._get_async_http_client().request(
+            method="GET",
+            url=url,
+            headers=HEADERS,
+            params=EVENTS_API_PARAMS,
+        )
+        return response.json()
+
+    async def aget_calendar_events_sharded(
+        self, start_date: date, end_date: date, shard_by: str, shard_size: int
+    ) -> list[dict]:
+        """
+        Get calendar events with one request per shard of countries or categories.
+
+        Shards are fetched in parallel and each is retried on its own by the HTTP
+        client; the results are merged with `merge_events`.
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range
+            shard_by: "country" or "category"
+            shard_size: Number of countries or categories per request
+        """
+        shards = await self._aget_shards(
+            start_date, end_date, shard_by, shard_size, httpx.Response.json
+        )
+        return merge_events(shards)
+
+    async def aget_calendar_event_records(
+        self, start_date: date, end_date: date
+    ) -> list[FXStreetEvent]:
+        """Like `aget_calendar_events`, decoded into validated event records."""
+        logger.info("Getting calendar events for %s to %s ...", start_date, end_date)
+        url = self.create_request_url(start_date, end_date)
+        response = await self._get_async_http_client().request(
+            method="GET",
+            url=url,
+            headers=HEADERS,
+            params=EVENTS_API_PARAMS,
+        )
+        return decode_events(response.content)
+
+    async def aget_calendar_event_records_sharded(
+        self, start_date: date, end_date: date, shard_by: str, shard_size: int
+    ) -> list[FXStreetEvent]:
+        """Like `aget_calendar_events_sharded`, decoded into event records."""
+        shards = await self._aget_shards(
+            start_date,
+            end_date,
+            shard_by,
+            shard_size,
+            lambda response: decode_events(response.content),
+        )
+        return merge_events(shards, key=attrgetter("event_id"))
+
+    async def _aget_shards(
+        self,
+        start_date: date,
+        end_date: date,
+        shard_by: str,
+        shard_size: int,
+        decode: Callable[[httpx.Response], list[EventT]],
+    ) -> list[list[EventT]]:
+        """Fetch the shards in parallel, decoding each response once it arrives."""
+        shards = shard_params(shard_by, shard_size)
+        logger.info(
+            "Getting calendar events for %s to %s in %d %s shards ...",
+            start_date,
+            end_date,
+            len(shards),
+            shard_by,
+        )
+        url = self.create_request_url(start_date, end_date)
+        http_client = self._get_async_http_client()
+
+        async def get_shard(params: dict) -> list[EventT]:
+            response = await http_client.request(
+                method="GET",
+                url=url,
+                headers=HEADERS,
+                params=params,
+            )
+            # The body is dropped as soon as it is decoded, instead of being
+            # held until every shard has arrived
+            return decode(response)
+
+        return await asyncio.gather(*(get_shard(params) for params in shards))
+
+    async def aget_event_details(self, event_id: str) -> dict:
+        logger.info("Getting event details for %s ...", event_id)
+        url = EVENT_DETAILS_API_URL_TEMPLATE.format(event_id=event_id)
+        response = await self._get_async_http_client().request(
+            method="GET",
+            url=url,
+            headers=HEADERS,
+        )
+        return response.json()
+
+
+def shard_params(shard_by: str, shard_size: int) -> list[dict]:
+    """Split `EVENTS_API_PARAMS` into requests covering a few values each."""
+    key = SHARD_KEYS.get(shard_by)
+    if key is None:
+        msg = f"Invalid shard_by {shard_by!r}, expected one of {sorted(SHARD_KEYS)}"
+        raise ValueError(msg)
+    if shard_size < 1:
+        msg = "shard_size must be at least 1"
+        raise ValueError(msg)
+
+    values = EVENTS_API_PARAMS[key]
+    return [
+        {**EVENTS_API_PARAMS, key: values[offset : offset + shard_size]}
+        for offset in range(0, len(values), shard_size)
+    ]
+
+
+def merge_events(
+    shards: Iterable[list[EventT]],
+    key: Callable[[EventT], str | None] = methodcaller("get", "id"),
+) -> list[EventT]:
+    """Concatenate shard results, keeping the first occurrence of every event id."""
+    seen_ids: set[str] = set()
+    events = []
+    for shard in shards:
+        for event in shard:
+            event_id = key(event)
+            if event_id is not None:
+                if event_id in seen_ids:
+                    continue
+                seen_ids.add(event_id)
+            events.append(event)
+    return events
@@ -1,10 +1,13 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from urllib.parse import urljoin
 
 import httpx
 
-from src.http_client import HTTPClient
+from src.http_client import AsyncHTTPClient, HTTPClient
 
 logger = logging.getLogger(__name__)
 
@@ -155,7 +158,7 @@ CATEGORIES = [
 IMPACT_LEVELS = ["1", "2", "3"]
 
 EVENTS_API_PARAMS = {
-    "countries": COUNTRIES_MAPPING.keys(),
+    "countries": list(COUNTRIES_MAPPING),
     "categories": CATEGORIES,
     "impact_levels": IMPACT_LEVELS,
     "timeZone": "55",  # UTC
@@ -169,37 +172,75 @@ class InvestingResource:
     def __init__(
         self,
         http_client: HTTPClient,
+        async_http_client: AsyncHTTPClient | None = None,
     ) -> None:
         self.http_client = http_client
+        self.async_http_client = async_http_client
 
-    def get_calendar_events(self, start_date: date, end_date: date) -> list[dict]:
-        logger.info("Getting calendar events for %s to %s ...", start_date, end_date)
+    def _get_async_http_client(self) -> AsyncHTTPClient:
+        if self.async_http_client is None:
+            msg = "InvestingResource was created without an async HTTP client"
+            raise RuntimeError(msg)
+        return self.async_http_client
 
+    @staticmethod
+    def _create_request_params(start_date: date, end_date: date) -> dict:
         params = EVENTS_API_PARAMS.copy()
         params["dateFrom"] = start_date.strftime("%Y-%m-%d")
         params["dateTo"] = end_date.strftime("%Y-%m-%d")
+        return params
+
+    @staticmethod
+    def _next_page_params(params: dict, page_num: int, data: dict) -> dict:
+        # A fresh dict per page, the previous one may still be in flight
+        return {
+            **params,
+            "limit_from": page_num,
+            "last_time_scope": data["last_time_scope"],
+        }
+
+    def get_calendar_events(self, start_date: date, end_date: date) -> list[dict]:
+        return list(self.iter_calendar_pages(start_date, end_date))
+
+    def iter_calendar_pages(self, start_date: date, end_date: date) -> Iterator[dict]:
+        """
+        Yield calendar pages as they arrive.
 
-        response_list = []
+        The next page is requested in a background thread as soon as the current
+        page's `last_time_scope` is known, so it downloads while the caller
+        processes the current one. At most two pages are held at a time. A
+        caller abandoning the pages early does not wait for the page in flight.
+        """
+        logger.info("Getting calendar events for %s to %s ...", start_date, end_date)
 
-        page_num = 0
-        while True:
-            response = self.http_client.request(
-                method="POST",
-                url=EVENTS_API_URL_TEMPLATE,
-                headers=HEADERS,
-                data=params,
-            )
-            data = response.json()
-            response_list.append(data)
+        params = self._create_request_params(start_date, end_date)
 
-            if not data["bind_scroll_handler"]:
-                break
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = executor.submit(self._get_calendar_page, params)
 
-            page_num += 1
-            params["limit_from"] = page_num
-            params["last_time_scope"] = data["last_time_scope"]
+            page_num = 0
+            while True:
+                data = pending.result()
+                if not data["bind_scroll_handler"]:
+                    yield data
+                    return
 
-        return response_list
+                page_num += 1
+                params = self._next_page_params(params, page_num, data)
+                pending = executor.submit(self._get_calendar_page, params)
+                yield data
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_calendar_page(self, params: dict) -> dict:
+        response = self.http_client.request(
+            method="POST",
+            url=EVENTS_API_URL_TEMPLATE,
+            headers=HEADERS,
+            data=params,
+        )
+        return response.json()
 
     def get_event_details(self, event_url: str) -> httpx.Response:
         logger.info("Getting event details for %s ...", event_url)
@@ -211,3 +252,52 @@ class InvestingResource:
         )
 
         return response
+
+    async def aget_calendar_events(
+        self, start_date: date, end_date: date
+    ) -> list[dict]:
+        return [page async for page in self.aiter_calendar_pages(start_date, end_date)]
+
+    async def aiter_calendar_pages(
+        self, start_date: date, end_date: date
+    ) -> AsyncIterator[dict]:
+        """Async variant of `iter_calendar_pages`, prefetching with a task."""
+        logger.info("Getting calendar events for %s to %s ...", start_date, end_date)
+
+        params = self._create_request_params(start_date, end_date)
+
+        pending = asyncio.create_task(self._aget_calendar_page(params))
+        try:
+            page_num = 0
+            while True:
+                data = await pending
+                if not data["bind_scroll_handler"]:
+                    yield data
+                    return
+
+                page_num += 1
+                params = self._next_page_params(params, page_num, data)
+                pending = asyncio.create_task(self._aget_calendar_page(params))
+                yield data
+        finally:
+            pending.cancel()
+
+    async def _aget_calendar_page(self, params: dict) -> dict:
+        response = await self._get_async_http_client().request(
+            method="POST",
+            url=EVENTS_API_URL_TEMPLATE,
+            headers=HEADERS,
+            data=params,
+        )
+        return response.json()
+
+    async def aget_event_details(self, event_url: str) -> httpx.Response:
+        logger.info("Getting event details for %s ...", event_url)
+        url = urljoin("https://www.investing.com/", event_url)
+        response = await self._get_async_http_client().request(
+            method="GET",
+            url=url,
+            headers=HEADERS,
+        )
+
+        return response
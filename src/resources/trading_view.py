@@ -3,7 +3,7 @@ from datetime import date, datetime, time
 
 import httpx
 
-from src.http_client import HTTPClient
+from src.http_client import AsyncHTTPClient, HTTPClient
 
 logger = logging.getLogger(__name__)
 
@@ -63,12 +63,19 @@ class TradingViewResource:
     def __init__(
         self,
         http_client: HTTPClient,
+        async_http_client: AsyncHTTPClient | None = None,
     ) -> None:
         self.http_client = http_client
+        self.async_http_client = async_http_client
 
-    def get_calendar_events(self, start_date: date, end_date: date) -> list[dict]:
-        logger.info("Getting calendar events for %s to %s ...", start_date, end_date)
+    def _get_async_http_client(self) -> AsyncHTTPClient:
+        if self.async_http_client is None:
+            msg = "TradingViewResource was created without an async HTTP client"
+            raise RuntimeError(msg)
+        return self.async_http_client
 
+    @staticmethod
+    def _create_request_params(start_date: date, end_date: date) -> dict:
         params = EVENTS_API_PARAMS.copy()
 
         start_dt = datetime.combine(start_date, time(hour=0, minute=0, second=0))
@@ -76,6 +83,12 @@ class TradingViewResource:
 
         params["from"] = start_dt.strftime(DATETIME_FORMAT)
         params["to"] = end_dt.strftime(DATETIME_FORMAT)
+        return params
+
+    def get_calendar_events(self, start_date: date, end_date: date) -> list[dict]:
+        logger.info("Getting calendar events for %s to %s ...", start_date, end_date)
+
+        params = self._create_request_params(start_date, end_date)
 
         response = self.http_client.request(
             method="GET",
@@ -94,3 +107,28 @@ class TradingViewResource:
             headers=HEADERS,
         )
         return response
+
+    async def aget_calendar_events(
+        self, start_date: date, end_date: date
+    ) -> list[dict]:
+        logger.info("Getting calendar events for %s to %s ...", start_date, end_date)
+
+        params = self._create_request_params(start_date, end_date)
+
+        response = await self._get_async_http_client().request(
+            method="GET",
+            url=EVENTS_API_URL,
+            headers=HEADERS,
+            params=params,
+        )
+        return response.json()
+
+    async def aget_event_details(self, event_ticker: str) -> httpx.Response:
+        logger.info("Getting event details for %s ...", event_ticker)
+        url = EVENT_DETAILS_URL_TEMPLATE.format(event_ticker=event_ticker)
+        response = await self._get_async_http_client().request(
+            method="GET",
+            url=url,
+            headers=HEADERS,
+        )
+        return response
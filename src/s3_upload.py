@@ -0,0 +1,159 @@
+import hashlib
+import logging
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from botocore.client import BaseClient
+
+from src import metrics, profiling, tracing
+
+logger = logging.getLogger(__name__)
+
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+
+ReEncoder = Callable[[Iterable[bytes]], Iterable[bytes]]
+
+
+@profiling.stage("upload")
+def upload_stream(
+    s3_client: BaseClient,
+    bucket_name: str,
+    key: str,
+    chunks: Iterable[bytes],
+    part_size: int = DEFAULT_PART_SIZE,
+    reencoder: ReEncoder | None = None,
+    **put_kwargs,
+) -> str:
+    """
+    Upload a byte stream to S3 holding at most one part in memory.
+
+    Payloads smaller than `part_size` are sent with a single `put_object`,
+    larger ones with a multipart upload that is aborted on failure.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket_name: Target bucket
+        key: Target object key
+        chunks: Byte chunks of the payload, e.g. `httpx.Response.iter_bytes()`
+        part_size: Multipart part size in bytes (at least 5 MiB)
+        reencoder: Optional transformation applied to the chunks before upload
+        **put_kwargs: Extra object arguments such as `ContentType`
+
+    Returns:
+        SHA-256 hex digest of the uploaded payload
+    """
+    if part_size < MIN_PART_SIZE:
+        msg = f"part_size must be at least {MIN_PART_SIZE} bytes"
+        raise ValueError(msg)
+
+    if reencoder is not None:
+        chunks = reencoder(chunks)
+
+    digest = hashlib.sha256()
+    buffer = bytearray()
+    upload_id: str | None = None
+    parts: list[dict] = []
+
+    try:
+        for chunk in chunks:
+            digest.update(chunk)
+            buffer += chunk
+            while len(buffer) >= part_size:
+                if upload_id is None:
+                    upload_id = s3_client.create_multipart_upload(
+                        Bucket=bucket_name, Key=key, **put_kwargs
+                    )["UploadId"]
+                parts.append(
+                    _upload_part(
+                        s3_client,
+                        bucket_name,
+                        key,
+                        upload_id,
+                        len(parts) + 1,
+                        bytes(buffer[:part_size]),
+                    )
+                )
+                del buffer[:part_size]
+
+        if upload_id is None:
+            s3_client.put_object(
+                Bucket=bucket_name, Key=key, Body=bytes(buffer), **put_kwargs
+            )
+            return digest.hexdigest()
+
+        if buffer:
+            parts.append(
+                _upload_part(
+                    s3_client,
+                    bucket_name,
+                    key,
+                    upload_id,
+                    len(parts) + 1,
+                    bytes(buffer),
+                )
+            )
+        s3_client.complete_multipart_upload(
+            Bucket=bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except Exception:
+        if upload_id is not None:
+            logger.exception("Aborting multipart upload of %s", key)
+            s3_client.abort_multipart_upload(
+                Bucket=bucket_name, Key=key, UploadId=upload_id
+            )
+        raise
+
+    logger.info("Uploaded %s in %d parts", key, len(parts))
+    return digest.hexdigest()
+
+
+def _upload_part(
+    s3_client: BaseClient,
+    bucket_name: str,
+    key: str,
+    upload_id: str,
+    part_number: int,
+    body: bytes,
+) -> dict:
+    response = s3_client.upload_part(
+        Bucket=bucket_name,
+        Key=key,
+        UploadId=upload_id,
+        PartNumber=part_number,
+        Body=body,
+    )
+    return {"ETag": response["ETag"], "PartNumber": part_number}
+
+
+def instrument_s3_client(s3_client: BaseClient) -> None:
+    """Time every request of an S3 client in the metrics and trace spans."""
+    events = s3_client.meta.events
+    events.register("before-call.s3", _start_s3_request)
+    events.register("after-call.s3", _end_s3_request)
+    events.register("after-call-error.s3", _end_s3_request)
+
+
+def _start_s3_request(model: Any, context: dict, **_: Any) -> None:  # noqa: ANN401
+    context["instrumented_operation"] = model.name
+    context["instrumented_started_at"] = time.perf_counter_ns()
+
+
+def _end_s3_request(context: dict, **_: Any) -> None:  # noqa: ANN401
+    started_at = context.pop("instrumented_started_at", None)
+    if started_at is None:
+        return
+
+    ended_at = time.perf_counter_ns()
+    operation = context["instrumented_operation"]
+    metrics.S3_REQUEST_SECONDS.observe(
+        (ended_at - started_at) / 1e9, operation=operation
+    )
+    if tracing.TRACER.enabled:
+        tracing.TRACER.record(
+            "s3.request", started_at, ended_at, {"operation": operation}
+        )
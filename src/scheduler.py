@@ -0,0 +1,87 @@
+import logging
+import random
+import threading
+import time
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from src import tracing
+
+if TYPE_CHECKING:
+    from src.config import PollHorizon, ServeConfig
+    from src.worker_factory import Worker
+
+logger = logging.getLogger(__name__)
+
+
+def serve(
+    worker: "Worker",
+    serve_config: "ServeConfig",
+    stop_event: threading.Event | None = None,
+) -> None:
+    """
+    Poll the horizons of a worker on their own cadences until stopped.
+
+    The worker, with its HTTP connection pools, S3 client and event loop, stays
+    warm between polls, so a poll costs little more than its HTTP round trips.
+    Each poll is rescheduled `interval` seconds after it was due, jittered by
+    `jitter` so that horizons and workers drift apart instead of bursting
+    together. A failing poll is logged and retried at its next turn.
+
+    Args:
+        worker: Worker run for each poll
+        serve_config: Horizons to poll and jitter
+        stop_event: Event ending the loop once set, checked between polls
+    """
+    if not serve_config.horizons:
+        msg = "Serve mode needs at least one polling horizon"
+        raise ValueError(msg)
+
+    stop_event = stop_event or threading.Event()
+    now = time.monotonic()
+    due_at = dict.fromkeys(serve_config.horizons, now)
+
+    with worker.warm():
+        while not stop_event.is_set():
+            horizon = min(due_at, key=due_at.__getitem__)
+            if stop_event.wait(max(0.0, due_at[horizon] - time.monotonic())):
+                break
+
+            _poll(worker, horizon)
+
+            next_due_at = due_at[horizon] + _jittered(
+                horizon.interval, serve_config.jitter
+            )
+            # Skip the polls missed while this one was running late
+            due_at[horizon] = max(next_due_at, time.monotonic())
+
+    logger.info("Serve mode stopped")
+
+
+def _poll(worker: "Worker", horizon: "PollHorizon") -> None:
+    today = date.today()
+    start_date = today + timedelta(days=horizon.start_offset_days)
+    end_date = today + timedelta(days=horizon.end_offset_days)
+    logger.info(
+        "Polling %s horizon %s to %s in %s mode ...",
+        horizon.name,
+        start_date,
+        end_date,
+        horizon.mode,
+    )
+    started_at = time.perf_counter()
+    try:
+        with tracing.span("run", horizon=horizon.name, mode=horizon.mode):
+            worker.run(start_date, end_date, mode=horizon.mode)
+    except Exception:
+        logger.exception("Polling %s horizon failed", horizon.name)
+        return
+    logger.info(
+        "Polled %s horizon in %.2f seconds",
+        horizon.name,
+        time.perf_counter() - started_at,
+    )
+
+
+def _jittered(interval: float, jitter: float) -> float:
+    return interval * (1 + random.uniform(-jitter, jitter))
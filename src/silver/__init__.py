@@ -0,0 +1,20 @@
+from .crosswalk import CROSSWALK_SCHEMA, build_crosswalk_table
+from .fxstreet import (
+    SILVER_SCHEMA,
+    build_silver_table,
+    normalize_events,
+    partition_by_date_and_country,
+    read_bronze_ndjson,
+    to_parquet_bytes,
+)
+
+__all__ = [
+    "CROSSWALK_SCHEMA",
+    "SILVER_SCHEMA",
+    "build_crosswalk_table",
+    "build_silver_table",
+    "normalize_events",
+    "partition_by_date_and_country",
+    "read_bronze_ndjson",
+    "to_parquet_bytes",
+]
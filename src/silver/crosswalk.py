@@ -0,0 +1,33 @@
+from collections.abc import Iterable
+
+import pyarrow as pa
+
+from src.matching import CrosswalkRow
+
+CROSSWALK_SCHEMA = pa.schema(
+    [
+        ("match_id", pa.string()),
+        ("source", pa.string()),
+        ("source_event_id", pa.string()),
+        ("country", pa.string()),
+        ("datetime_utc", pa.timestamp("s", tz="UTC")),
+        ("canonical_name", pa.string()),
+        ("name", pa.string()),
+    ]
+)
+
+
+def build_crosswalk_table(rows: Iterable[CrosswalkRow]) -> pa.Table:
+    """Build the crosswalk of source events to matches, sorted by match."""
+    rows = sorted(rows, key=lambda row: (row.match_id, row.source))
+    return pa.Table.from_arrays(
+        [
+            pa.array(column, field.type)
+            for column, field in zip(
+                zip(*rows, strict=True) if rows else [[]] * len(CROSSWALK_SCHEMA),
+                CROSSWALK_SCHEMA,
+                strict=True,
+            )
+        ],
+        schema=CROSSWALK_SCHEMA,
+    )
@@ -0,0 +1,161 @@
+import io
+from collections.abc import Iterable, Iterator
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.json as pa_json
+import pyarrow.parquet as pq
+
+from src import profiling
+from src.resources.fxstreet import CATEGORY_MAPPING
+
+BRONZE_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("eventId", pa.string()),
+        ("name", pa.string()),
+        ("dateUtc", pa.timestamp("s", tz="UTC")),
+        ("countryCode", pa.string()),
+        ("categoryId", pa.string()),
+        ("volatility", pa.string()),
+        ("actual", pa.float64()),
+        ("consensus", pa.float64()),
+        ("previous", pa.float64()),
+    ]
+)
+
+SILVER_SCHEMA = pa.schema(
+    [
+        ("event_id", pa.string()),
+        ("event_series_id", pa.string()),
+        ("name", pa.string()),
+        ("datetime_utc", pa.timestamp("s", tz="UTC")),
+        ("date", pa.date32()),
+        ("country", pa.string()),
+        ("category", pa.string()),
+        ("volatility", pa.string()),
+        ("actual", pa.float64()),
+        ("consensus", pa.float64()),
+        ("previous", pa.float64()),
+    ]
+)
+
+_CATEGORY_IDS = pa.array(list(CATEGORY_MAPPING.keys()))
+_CATEGORY_NAMES = pa.array(list(CATEGORY_MAPPING.values()))
+
+
+@profiling.stage("decode")
+def read_bronze_ndjson(payload: bytes) -> pa.Table:
+    """Parse NDJSON bronze events into a table without building Python dicts."""
+    if not payload.strip():
+        return BRONZE_SCHEMA.empty_table()
+
+    return pa_json.read_json(
+        io.BytesIO(payload),
+        parse_options=pa_json.ParseOptions(
+            explicit_schema=BRONZE_SCHEMA,
+            unexpected_field_behavior="ignore",
+        ),
+    )
+
+
+def build_silver_table(
+    bronze_tables: Iterable[pa.Table], start_date: date, end_date: date
+) -> pa.Table:
+    """
+    Normalize bronze tables and keep the events between the dates.
+
+    Tables must be ordered from the least to the most recently written, so
+    that duplicated events keep their latest version.
+    """
+    bronze = pa.concat_tables(list(bronze_tables) or [BRONZE_SCHEMA.empty_table()])
+    return filter_date_range(normalize_events(bronze), start_date, end_date)
+
+
+@profiling.stage("serialize")
+def to_parquet_bytes(table: pa.Table) -> bytes:
+    sink = io.BytesIO()
+    pq.write_table(table, sink, compression="zstd")
+    return sink.getvalue()
+
+
+def normalize_events(bronze: pa.Table) -> pa.Table:
+    """
+    Normalize bronze FXStreet events into the silver schema.
+
+    Category ids are resolved through `CATEGORY_MAPPING` with a vectorized
+    lookup and rows are deduplicated by event id, keeping the last occurrence.
+
+    Args:
+        bronze: Table with `BRONZE_SCHEMA` columns
+
+    Returns:
+        Table with `SILVER_SCHEMA` columns
+    """
+    category_index = pc.index_in(bronze["categoryId"], value_set=_CATEGORY_IDS)
+    datetime_utc = bronze["dateUtc"]
+
+    table = pa.Table.from_arrays(
+        [
+            bronze["id"],
+            bronze["eventId"],
+            bronze["name"],
+            datetime_utc,
+            pc.cast(datetime_utc, pa.date32()),
+            bronze["countryCode"],
+            pc.take(_CATEGORY_NAMES, category_index),
+            bronze["volatility"],
+            bronze["actual"],
+            bronze["consensus"],
+            bronze["previous"],
+        ],
+        schema=SILVER_SCHEMA,
+    )
+    return _drop_duplicate_events(table)
+
+
+def filter_date_range(table: pa.Table, start_date: date, end_date: date) -> pa.Table:
+    mask = pc.and_(
+        pc.greater_equal(table["date"], pa.scalar(start_date, pa.date32())),
+        pc.less_equal(table["date"], pa.scalar(end_date, pa.date32())),
+    )
+    return table.filter(mask)
+
+
+def partition_by_date_and_country(
+    table: pa.Table,
+) -> Iterator[tuple[date, str, pa.Table]]:
+    """Yield (date, country, rows) partitions of a silver table."""
+    if table.num_rows == 0:
+        return
+
+    table = table.sort_by([("date", "ascending"), ("country", "ascending")])
+    # Combined into one array, comparing empty slices of a chunked array
+    # crashes pyarrow, e.g. on a one-row table
+    partition_keys = pc.binary_join_element_wise(
+        pc.cast(table["date"], pa.string()),
+        pc.fill_null(table["country"], "__NULL__"),
+        "/",
+    ).combine_chunks()
+    boundaries = pc.indices_nonzero(
+        pc.not_equal(partition_keys[1:], partition_keys[:-1])
+    ).to_pylist()
+
+    start = 0
+    for end in [*(boundary + 1 for boundary in boundaries), table.num_rows]:
+        partition = table.slice(start, end - start)
+        yield partition["date"][0].as_py(), partition["country"][0].as_py(), partition
+        start = end
+
+
+def _drop_duplicate_events(table: pa.Table) -> pa.Table:
+    if table.num_rows == 0:
+        return table
+
+    table = table.append_column("__row", pa.array(range(table.num_rows)))
+    last_rows = table.group_by("event_id", use_threads=False).aggregate(
+        [("__row", "max")]
+    )["__row_max"]
+    last_rows = pc.take(last_rows, pc.sort_indices(last_rows))
+    return table.take(last_rows).drop_columns(["__row"])
@@ -1,23 +1,183 @@
+import logging
 import os
 from collections.abc import Callable, Mapping
+from contextlib import AbstractContextManager
 from datetime import date
-from typing import Any, Protocol
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
 
-from dotenv import load_dotenv
+# Workers, HTTP clients, the configuration dataclasses (about 20 ms to create)
+# and their dependencies (httpx, tenacity, boto3) are imported by the builders,
+# so a run only pays for the worker it selects, and `--help` for none of them.
+# So is importlib.metadata (about 15 ms), only needed for plugin workers
+if TYPE_CHECKING:
+    import httpx
 
-from src.config import FXStreetConfig, ProxyConfig, S3Config
-from src.http_client import HTTPClient
-from src.workers import FXStreetWorker
+    from src.bronze_codec import BronzeCodec
+    from src.circuit_breaker import CircuitBreaker, RetryBudget
+    from src.config import DetailScrapeConfig, S3Config, ServeConfig
+    from src.http_cache import HTTPCache
+    from src.http_client import AsyncHTTPClient, HTTPClient
+    from src.rate_limiter import AdaptiveRateLimiter
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Entry point group of workers provided by other packages, each entry point
+# loading a builder taking the configuration dictionary
+WORKER_ENTRY_POINT_GROUP = "economic_calendar.workers"
 
 
 class Worker(Protocol):
-    def run(self, start_date: date, end_date: date, mode: str) -> None: ...
+    def run(
+        self, start_date: date, end_date: date, mode: str, *, resume: bool = False
+    ) -> None: ...
 
+    def warm(self) -> AbstractContextManager[None]: ...
 
-def _build_fxstreet_worker(config_data: Mapping[str, Any]) -> Worker:
-    """Build FXStreet worker from configuration dictionary."""
+
+def _build_http_cache(cache_cfg: Mapping[str, Any]) -> "HTTPCache | None":
+    """Build the persistent HTTP response cache, if enabled."""
+
+    if not cache_cfg.get("enabled", False):
+        return None
+
+    from src.config import CacheRule, HTTPCacheConfig  # noqa: PLC0415
+    from src.http_cache import HTTPCache  # noqa: PLC0415
+
+    defaults = HTTPCacheConfig()
+    cache_config = HTTPCacheConfig(
+        path=cache_cfg.get("path", defaults.path),
+        max_bytes=cache_cfg.get("max_bytes", defaults.max_bytes),
+        default_ttl=cache_cfg.get("default_ttl", defaults.default_ttl),
+        past_ttl=cache_cfg.get("past_ttl", defaults.past_ttl),
+        rules=tuple(
+            CacheRule(pattern=rule["pattern"], ttl=rule["ttl"])
+            for rule in cache_cfg.get("rules", [])
+        ),
+    )
+    return HTTPCache(cache_config)
+
+
+def _build_rate_limiter(http_cfg: Mapping[str, Any]) -> "AdaptiveRateLimiter | None":
+    """Build the adaptive rate limiter shared by the sync and async clients."""
+
+    rate_limit_cfg = http_cfg.get("rate_limit")
+    if rate_limit_cfg is None:
+        return None
+
+    from src.config import RateLimitConfig  # noqa: PLC0415
+    from src.rate_limiter import AdaptiveRateLimiter  # noqa: PLC0415
+
+    defaults = RateLimitConfig()
+    return AdaptiveRateLimiter(
+        RateLimitConfig(
+            initial_rate=rate_limit_cfg.get("initial_rate", defaults.initial_rate),
+            min_rate=rate_limit_cfg.get("min_rate", defaults.min_rate),
+            max_rate=rate_limit_cfg.get("max_rate", defaults.max_rate),
+            burst=rate_limit_cfg.get("burst", defaults.burst),
+            increase_step=rate_limit_cfg.get("increase_step", defaults.increase_step),
+            decrease_factor=rate_limit_cfg.get(
+                "decrease_factor", defaults.decrease_factor
+            ),
+        )
+    )
+
+
+def _build_circuit_breaker(http_cfg: Mapping[str, Any]) -> "CircuitBreaker | None":
+    """Build the per-host circuit breaker shared by the sync and async clients."""
+
+    circuit_breaker_cfg = http_cfg.get("circuit_breaker")
+    if circuit_breaker_cfg is None:
+        return None
+
+    from src.circuit_breaker import CircuitBreaker  # noqa: PLC0415
+    from src.config import CircuitBreakerConfig  # noqa: PLC0415
+
+    defaults = CircuitBreakerConfig()
+    return CircuitBreaker(
+        CircuitBreakerConfig(
+            failure_threshold=circuit_breaker_cfg.get(
+                "failure_threshold", defaults.failure_threshold
+            ),
+            reset_timeout=circuit_breaker_cfg.get(
+                "reset_timeout", defaults.reset_timeout
+            ),
+            half_open_max_calls=circuit_breaker_cfg.get(
+                "half_open_max_calls", defaults.half_open_max_calls
+            ),
+        )
+    )
+
+
+def _build_retry_budget(http_cfg: Mapping[str, Any]) -> "RetryBudget | None":
+    """Build the retry budget shared by the sync and async clients."""
+
+    retry_budget_cfg = http_cfg.get("retry_budget")
+    if retry_budget_cfg is None:
+        return None
+
+    from src.circuit_breaker import RetryBudget  # noqa: PLC0415
+    from src.config import RetryBudgetConfig  # noqa: PLC0415
+
+    defaults = RetryBudgetConfig()
+    return RetryBudget(
+        RetryBudgetConfig(
+            ratio=retry_budget_cfg.get("ratio", defaults.ratio),
+            min_retries=retry_budget_cfg.get("min_retries", defaults.min_retries),
+        )
+    )
+
+
+def _build_transports(
+    cassette_cfg: Mapping[str, Any], proxy_url: str | None
+) -> tuple["httpx.BaseTransport", "httpx.AsyncBaseTransport"] | None:
+    """Build transports recording to or replaying from a cassette, if enabled."""
+
+    mode = cassette_cfg.get("mode")
+    if mode is None:
+        return None
+
+    import httpx  # noqa: PLC0415
+
+    from src.cassette import (  # noqa: PLC0415
+        AsyncRecordingTransport,
+        AsyncReplayTransport,
+        Cassette,
+        RecordingTransport,
+        ReplayTransport,
+    )
+    from src.config import CassetteConfig  # noqa: PLC0415
+
+    cassette_config = CassetteConfig(
+        mode=mode,
+        path=cassette_cfg["path"],
+        timing_scale=cassette_cfg.get("timing_scale", 1.0),
+    )
+    cassette = Cassette(Path(cassette_config.path))
+    logger.info("HTTP cassette %s in %s mode", cassette_config.path, mode)
+    if mode == "record":
+        return (
+            RecordingTransport(cassette, httpx.HTTPTransport(proxy=proxy_url)),
+            AsyncRecordingTransport(
+                cassette, httpx.AsyncHTTPTransport(proxy=proxy_url)
+            ),
+        )
+    if mode == "replay":
+        return (
+            ReplayTransport(cassette, cassette_config.timing_scale),
+            AsyncReplayTransport(cassette, cassette_config.timing_scale),
+        )
+    msg = f"Unknown cassette mode: {mode}"
+    raise ValueError(msg)
+
+
+def _build_http_clients(
+    config_data: Mapping[str, Any],
+) -> tuple["HTTPClient", "AsyncHTTPClient"]:
+    """Build sync and async HTTP clients sharing cache, rate limits and retries."""
+
+    from src.config import ProxyConfig  # noqa: PLC0415
+    from src.http_client import AsyncHTTPClient, HTTPClient  # noqa: PLC0415
 
     proxy_url = config_data.get("proxy_url")
     proxy_config = (
@@ -25,13 +185,48 @@ def _build_fxstreet_worker(config_data: Mapping[str, Any]) -> Worker:
     )
 
     http_cfg = config_data["http"]
+    transports = _build_transports(http_cfg.get("cassette", {}), proxy_url)
+    if transports is not None:
+        # The recording transport owns the proxy, httpx would route proxied
+        # requests around it
+        proxy_config = None
+    transport, async_transport = transports or (None, None)
+    cache = _build_http_cache(http_cfg.get("cache", {}))
+    rate_limiter = _build_rate_limiter(http_cfg)
+    circuit_breaker = _build_circuit_breaker(http_cfg)
+    retry_budget = _build_retry_budget(http_cfg)
     http_client = HTTPClient(
         timeout=http_cfg["timeout"],
         max_retries=http_cfg["max_retries"],
         retry_backoff_base=http_cfg["retry_backoff_base"],
         rate_limit_delay=http_cfg["rate_limit_delay"],
         proxy_config=proxy_config,
+        cache=cache,
+        rate_limiter=rate_limiter,
+        circuit_breaker=circuit_breaker,
+        retry_budget=retry_budget,
+        transport=transport,
     )
+    async_http_client = AsyncHTTPClient(
+        timeout=http_cfg["timeout"],
+        max_retries=http_cfg["max_retries"],
+        retry_backoff_base=http_cfg["retry_backoff_base"],
+        rate_limit_delay=http_cfg["rate_limit_delay"],
+        max_concurrency=http_cfg.get("max_concurrency", 8),
+        proxy_config=proxy_config,
+        cache=cache,
+        rate_limiter=rate_limiter,
+        circuit_breaker=circuit_breaker,
+        retry_budget=retry_budget,
+        transport=async_transport,
+    )
+    return http_client, async_http_client
+
+
+def _build_s3_config(config_data: Mapping[str, Any]) -> "S3Config":
+    """Build S3 configuration from the `s3` section and environment variables."""
+
+    from src.config import S3Config  # noqa: PLC0415
 
     s3_cfg = config_data["s3"]
     s3_endpoint = os.getenv("S3_ENDPOINT")
@@ -49,19 +244,220 @@ def _build_fxstreet_worker(config_data: Mapping[str, Any]) -> Worker:
         bucket_name=s3_cfg["bucket_name"],
         use_ssl=s3_cfg.get("use_ssl", False),
         region=s3_cfg.get("region", "us-east-1"),
+        part_size=s3_cfg.get("part_size", 8 * 1024 * 1024),
+        bucket_cache_path=s3_cfg.get(
+            "bucket_cache_path", ".checkpoints/s3_buckets.json"
+        ),
+        bucket_cache_ttl=s3_cfg.get("bucket_cache_ttl", 86400.0),
+    )
+
+    return s3_config
+
+
+def _build_bronze_codec(config_data: Mapping[str, Any]) -> "BronzeCodec":
+    from src.bronze_codec import BronzeCodec  # noqa: PLC0415
+
+    bronze_cfg = config_data.get("bronze", {})
+    return BronzeCodec(
+        format=bronze_cfg.get("format", "json"),
+        compression=bronze_cfg.get("compression", "none"),
+    )
+
+
+def _build_detail_scrape_config(
+    config_data: Mapping[str, Any],
+) -> "DetailScrapeConfig":
+    from src.config import DetailScrapeConfig  # noqa: PLC0415
+
+    detail_scrape_cfg = config_data.get("detail_scrape", {})
+    defaults = DetailScrapeConfig()
+    return DetailScrapeConfig(
+        max_concurrency=detail_scrape_cfg.get(
+            "max_concurrency", defaults.max_concurrency
+        ),
+        batch_size=detail_scrape_cfg.get("batch_size", defaults.batch_size),
+        max_workers=detail_scrape_cfg.get("max_workers", defaults.max_workers),
+    )
+
+
+def _build_fxstreet_worker(config_data: Mapping[str, Any]) -> Worker:
+    """Build FXStreet worker from configuration dictionary."""
+
+    from src.config import (  # noqa: PLC0415
+        BackfillConfig,
+        DeltaConfig,
+        EnrichmentConfig,
+        FXStreetConfig,
+        IncrementalConfig,
+        ShardingConfig,
+    )
+    from src.workers.fxstreet import FXStreetWorker  # noqa: PLC0415
+
+    http_client, async_http_client = _build_http_clients(config_data)
+
+    s3_config = _build_s3_config(config_data)
+
+    backfill_cfg = config_data.get("backfill", {})
+    backfill_config = BackfillConfig(
+        window=backfill_cfg.get("window", "month"),
+        max_workers=backfill_cfg.get("max_workers", 4),
+        checkpoint_path=backfill_cfg.get(
+            "checkpoint_path", ".checkpoints/fxstreet.sqlite3"
+        ),
+    )
+
+    incremental_cfg = config_data.get("incremental", {})
+    incremental_config = IncrementalConfig(
+        volatile_days=incremental_cfg.get("volatile_days", 7),
+        manifest_cache_path=incremental_cfg.get(
+            "manifest_cache_path", ".checkpoints/fxstreet_manifest.json"
+        ),
+        manifest_cache_ttl=incremental_cfg.get("manifest_cache_ttl", 3600.0),
+    )
+
+    enrichment_cfg = config_data.get("enrichment", {})
+    enrichment_defaults = EnrichmentConfig()
+    enrichment_config = EnrichmentConfig(
+        details_store_path=enrichment_cfg.get(
+            "details_store_path", enrichment_defaults.details_store_path
+        ),
+        details_max_age=enrichment_cfg.get(
+            "details_max_age", enrichment_defaults.details_max_age
+        ),
+        max_concurrency=enrichment_cfg.get(
+            "max_concurrency", enrichment_defaults.max_concurrency
+        ),
+        details_output_name_template=enrichment_cfg.get(
+            "details_output_name_template",
+            enrichment_defaults.details_output_name_template,
+        ),
+    )
+
+    sharding_cfg = config_data.get("sharding", {})
+    sharding_config = ShardingConfig(
+        shard_by=sharding_cfg.get("shard_by"),
+        shard_size=sharding_cfg.get("shard_size", 10),
+    )
+
+    delta_cfg = config_data.get("delta", {})
+    delta_config = DeltaConfig(
+        output_name_template=delta_cfg.get(
+            "output_name_template", DeltaConfig().output_name_template
+        ),
     )
 
     fxstreet_config = FXStreetConfig(
         http_client=http_client,
         s3_config=s3_config,
+        async_http_client=async_http_client,
         raw_output_name_template=config_data["raw_output_name_template"],
+        backfill_config=backfill_config,
+        incremental_config=incremental_config,
+        enrichment_config=enrichment_config,
+        sharding_config=sharding_config,
+        delta_config=delta_config,
+        bronze_codec=_build_bronze_codec(config_data),
+        silver_output_prefix=config_data.get(
+            "silver_output_prefix", "fxstreet/silver/events"
+        ),
+        typed_events=config_data.get("typed_events", False),
     )
 
     return FXStreetWorker(fxstreet_config)
 
 
+def _build_investing_worker(config_data: Mapping[str, Any]) -> Worker:
+    """Build Investing.com worker from configuration dictionary."""
+
+    from src.config import InvestingConfig  # noqa: PLC0415
+    from src.workers.investing import InvestingWorker  # noqa: PLC0415
+
+    http_client, async_http_client = _build_http_clients(config_data)
+
+    investing_config = InvestingConfig(
+        http_client=http_client,
+        s3_config=_build_s3_config(config_data),
+        async_http_client=async_http_client,
+        raw_output_name_template=config_data["raw_output_name_template"],
+        details_output_name_template=config_data.get(
+            "details_output_name_template",
+            "investing/event_details/{start_date}_{end_date}.json",
+        ),
+        checkpoint_path=config_data.get(
+            "checkpoint_path", ".checkpoints/investing.sqlite3"
+        ),
+        bronze_codec=_build_bronze_codec(config_data),
+        detail_scrape_config=_build_detail_scrape_config(config_data),
+    )
+
+    return InvestingWorker(investing_config)
+
+
+def _build_trading_view_worker(config_data: Mapping[str, Any]) -> Worker:
+    """Build TradingView worker from configuration dictionary."""
+
+    from src.config import TradingViewConfig  # noqa: PLC0415
+    from src.workers.trading_view import TradingViewWorker  # noqa: PLC0415
+
+    http_client, async_http_client = _build_http_clients(config_data)
+
+    trading_view_config = TradingViewConfig(
+        http_client=http_client,
+        s3_config=_build_s3_config(config_data),
+        async_http_client=async_http_client,
+        raw_output_name_template=config_data["raw_output_name_template"],
+        details_output_name_template=config_data.get(
+            "details_output_name_template",
+            "trading_view/event_details/{start_date}_{end_date}.json",
+        ),
+        checkpoint_path=config_data.get(
+            "checkpoint_path", ".checkpoints/trading_view.sqlite3"
+        ),
+        bronze_codec=_build_bronze_codec(config_data),
+        detail_scrape_config=_build_detail_scrape_config(config_data),
+    )
+
+    return TradingViewWorker(trading_view_config)
+
+
+def _build_catalog_worker(config_data: Mapping[str, Any]) -> Worker:
+    """Build unified catalog worker from configuration dictionary."""
+
+    from src.config import BronzeSourceConfig, CatalogConfig  # noqa: PLC0415
+    from src.workers.catalog import CatalogWorker  # noqa: PLC0415
+
+    catalog_config = CatalogConfig(
+        s3_config=_build_s3_config(config_data),
+        sources={
+            source: BronzeSourceConfig(
+                bucket_name=source_cfg["bucket_name"],
+                raw_output_name_template=source_cfg["raw_output_name_template"],
+            )
+            for source, source_cfg in config_data["sources"].items()
+        },
+        crosswalk_output_prefix=config_data.get(
+            "crosswalk_output_prefix", "catalog/silver/crosswalk"
+        ),
+        time_bucket_minutes=config_data.get("matching", {}).get(
+            "time_bucket_minutes", 10
+        ),
+        manifest_cache_dir=config_data.get(
+            "manifest_cache_dir", ".checkpoints/catalog"
+        ),
+    )
+
+    return CatalogWorker(catalog_config)
+
+
+# Sources ingested from upstream calendars, run by `--sources all`
+SOURCES = ("fxstreet", "investing", "trading_view")
+
+# Built-in workers, each builder importing its worker module when called
 WORKER_MAPPING: dict[str, Callable[[Mapping[str, Any]], Worker]] = {
     "fxstreet": _build_fxstreet_worker,
+    "investing": _build_investing_worker,
+    "trading_view": _build_trading_view_worker,
+    "catalog": _build_catalog_worker,
 }
 
 
@@ -73,9 +469,48 @@ def build_worker(config_data: Mapping[str, Any]) -> Worker:
         msg = "`worker` must be a string"
         raise TypeError(msg)
 
-    builder = WORKER_MAPPING.get(worker_name)
+    builder = WORKER_MAPPING.get(worker_name) or _load_worker_entry_point(worker_name)
     if builder is None:
         msg = f"Unknown worker: {worker_name}"
         raise ValueError(msg)
 
+    # Loaded here rather than at import time, only runs building a worker need it
+    from dotenv import load_dotenv  # noqa: PLC0415
+
+    load_dotenv()
+
     return builder(config_data)
+
+
+def _load_worker_entry_point(
+    worker_name: str,
+) -> Callable[[Mapping[str, Any]], Worker] | None:
+    """Return the builder of a worker registered by another package, if any."""
+
+    from importlib.metadata import entry_points  # noqa: PLC0415
+
+    for entry_point in entry_points(group=WORKER_ENTRY_POINT_GROUP, name=worker_name):
+        logger.info("Loading worker %s from %s", worker_name, entry_point.value)
+        return entry_point.load()
+    return None
+
+
+def build_serve_config(config_data: Mapping[str, Any]) -> "ServeConfig":
+    """Build serve mode configuration from the `serve` section."""
+
+    from src.config import PollHorizon, ServeConfig  # noqa: PLC0415
+
+    serve_cfg = config_data.get("serve", {})
+    return ServeConfig(
+        horizons=tuple(
+            PollHorizon(
+                name=horizon_cfg["name"],
+                start_offset_days=horizon_cfg["start_offset_days"],
+                end_offset_days=horizon_cfg["end_offset_days"],
+                interval=horizon_cfg["interval"],
+                mode=horizon_cfg.get("mode", "raw"),
+            )
+            for horizon_cfg in serve_cfg.get("horizons", [])
+        ),
+        jitter=serve_cfg.get("jitter", ServeConfig().jitter),
+    )
@@ -1,3 +1,26 @@
-from .fxstreet import FXStreetWorker
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["FXStreetWorker"]
+if TYPE_CHECKING:
+    from .catalog import CatalogWorker
+    from .fxstreet import FXStreetWorker
+    from .investing import InvestingWorker
+    from .trading_view import TradingViewWorker
+
+# Workers by name, imported from their module on first access so that using
+# one worker does not import the dependencies of the others
+_WORKER_MODULES = {
+    "CatalogWorker": ".catalog",
+    "FXStreetWorker": ".fxstreet",
+    "InvestingWorker": ".investing",
+    "TradingViewWorker": ".trading_view",
+}
+
+__all__ = ["CatalogWorker", "FXStreetWorker", "InvestingWorker", "TradingViewWorker"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _WORKER_MODULES:
+        return getattr(import_module(_WORKER_MODULES[name], __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
+
+import boto3
+import httpx
+from botocore.exceptions import ClientError
+
+from src import metrics, tracing
+from src.bronze_codec import BronzeCodec, JSONArrayItemCounter
+from src.bucket_cache import BucketCache
+from src.config import DetailScrapeConfig, S3Config
+from src.detail_scrape import DetailPage, scrape_details
+from src.http_client import AsyncHTTPClient, HTTPClient
+from src.s3_upload import instrument_s3_client, upload_stream
+
+logger = logging.getLogger("root")
+
+T = TypeVar("T")
+
+
+class S3Worker:
+    """Base of the workers writing bronze objects to an S3 bucket."""
+
+    def __init__(self, s3_config: S3Config, bronze_codec: BronzeCodec) -> None:
+        self.s3_config = s3_config
+        self.bronze_codec = bronze_codec
+        self.s3_client = boto3.client(
+            "s3",
+            endpoint_url=s3_config.endpoint,
+            aws_access_key_id=s3_config.access_key,
+            aws_secret_access_key=s3_config.secret_key,
+            use_ssl=s3_config.use_ssl,
+        )
+        instrument_s3_client(self.s3_client)
+
+        self._runner: asyncio.Runner | None = None
+        self._warm_http_clients: set[AsyncHTTPClient] = set()
+
+        self._ensure_bucket()
+
+    @contextmanager
+    def warm(self) -> Iterator[None]:
+        """
+        Keep one event loop, and the async connection pools bound to it, across runs.
+
+        Outside of this context every run uses a fresh event loop and closes its
+        async connection pools when done.
+        """
+        with asyncio.Runner() as runner:
+            self._runner = runner
+            try:
+                yield
+            finally:
+                self._runner = None
+                for async_http_client in self._warm_http_clients:
+                    runner.run(async_http_client.aclose())
+                self._warm_http_clients.clear()
+
+    @staticmethod
+    def _reset_retry_budget(http_client: HTTPClient) -> None:
+        """Give every run, e.g. every serve poll, a fresh retry budget."""
+        if http_client.retry_budget is not None:
+            http_client.retry_budget.reset()
+
+    def _run_async(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        if self._runner is None:
+            return asyncio.run(coroutine)
+        return self._runner.run(coroutine)
+
+    async def _release_async_http_client(
+        self, async_http_client: AsyncHTTPClient | None
+    ) -> None:
+        """Close the pool of a client at the end of a run, unless kept warm."""
+        if async_http_client is None:
+            return
+        if self._runner is None:
+            await async_http_client.aclose()
+        else:
+            self._warm_http_clients.add(async_http_client)
+
+    def _get_output_key(self, template: str, start_date: date, end_date: date) -> str:
+        key = template.format(start_date=start_date, end_date=end_date)
+        return self.bronze_codec.output_key(key)
+
+    def _upload_records(self, key: str, records: Iterable[bytes]) -> str:
+        """
+        Upload JSON records with the bronze codec and return the payload SHA-256.
+
+        Records are consumed lazily, so a generator keeps fetching, encoding and
+        uploading in a single pass.
+        """
+        logger.info(
+            "Uploading records to S3 bucket %s as %s ...",
+            self.s3_config.bucket_name,
+            key,
+        )
+        with tracing.span("s3.upload", key=key):
+            return upload_stream(
+                self.s3_client,
+                self.s3_config.bucket_name,
+                key,
+                self.bronze_codec.encode_records(self._count_records(records)),
+                part_size=self.s3_config.part_size,
+                **self.bronze_codec.put_kwargs(),
+            )
+
+    def _count_records(self, records: Iterable[bytes]) -> Iterator[bytes]:
+        count = 0
+        try:
+            for record in records:
+                count += 1
+                yield record
+        finally:
+            metrics.EVENTS_UPLOADED.inc(count, bucket=self.s3_config.bucket_name)
+
+    def _count_array_items(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        counter = JSONArrayItemCounter()
+        try:
+            for chunk in chunks:
+                counter.feed(chunk)
+                yield chunk
+            counter.close()
+        finally:
+            metrics.EVENTS_UPLOADED.inc(
+                counter.count, bucket=self.s3_config.bucket_name
+            )
+
+    def _run_detail_scrape(
+        self,
+        key: str,
+        detail_keys: Iterable[str],
+        fetch: Callable[[str], Awaitable[httpx.Response]],
+        parse_batch: Callable[[list[DetailPage]], list[NamedTuple]],
+        async_http_client: AsyncHTTPClient | None,
+        detail_scrape_config: DetailScrapeConfig,
+    ) -> None:
+        """Scrape detail pages, parsing them in worker processes, and upload them."""
+        records, failed_keys = self._run_async(
+            self._scrape_details(
+                detail_keys, fetch, parse_batch, async_http_client, detail_scrape_config
+            )
+        )
+        self._upload_records(
+            key,
+            (json.dumps(record._asdict()).encode("utf-8") for record in records),
+        )
+
+        if failed_keys:
+            msg = f"Details of {len(failed_keys)} events could not be fetched"
+            raise RuntimeError(msg)
+
+    async def _scrape_details(
+        self,
+        detail_keys: Iterable[str],
+        fetch: Callable[[str], Awaitable[httpx.Response]],
+        parse_batch: Callable[[list[DetailPage]], list[NamedTuple]],
+        async_http_client: AsyncHTTPClient | None,
+        detail_scrape_config: DetailScrapeConfig,
+    ) -> tuple[list[NamedTuple], list[str]]:
+        try:
+            with ProcessPoolExecutor(detail_scrape_config.max_workers) as executor:
+                return await scrape_details(
+                    detail_keys,
+                    fetch,
+                    parse_batch,
+                    executor,
+                    max_concurrency=detail_scrape_config.max_concurrency,
+                    batch_size=detail_scrape_config.batch_size,
+                )
+        finally:
+            await self._release_async_http_client(async_http_client)
+
+    def _ensure_bucket(self) -> None:
+        """Create the bucket unless the bucket cache has seen it recently."""
+        if self.s3_config.bucket_cache_path is None:
+            self._create_bucket()
+            return
+
+        bucket_cache = BucketCache(
+            Path(self.s3_config.bucket_cache_path), self.s3_config.bucket_cache_ttl
+        )
+        if bucket_cache.contains(self.s3_config.endpoint, self.s3_config.bucket_name):
+            logger.debug("Bucket %s is cached as existing", self.s3_config.bucket_name)
+            return
+
+        self._create_bucket()
+        bucket_cache.add(self.s3_config.endpoint, self.s3_config.bucket_name)
+
+    def _create_bucket(self) -> None:
+        try:
+            logger.info("Creating bucket %s ...", self.s3_config.bucket_name)
+            self.s3_client.create_bucket(Bucket=self.s3_config.bucket_name)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code == "BucketAlreadyOwnedByYou":
+                logger.info(
+                    "Bucket %s already exists and is owned by you",
+                    self.s3_config.bucket_name,
+                )
+            else:
+                logger.exception(
+                    "Failed to create bucket %s", self.s3_config.bucket_name
+                )
+                raise
+        except Exception:
+            logger.exception("Failed to create bucket %s", self.s3_config.bucket_name)
+            raise
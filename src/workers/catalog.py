@@ -0,0 +1,128 @@
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date
+from pathlib import Path
+
+from src.bronze_codec import BronzeCodec, codec_for_key
+from src.config import BronzeSourceConfig, CatalogConfig
+from src.manifest import BronzeManifest, parse_bronze_windows
+from src.matching import (
+    MatchCandidate,
+    from_fxstreet,
+    from_investing,
+    from_trading_view,
+    match_events,
+)
+from src.parsers.investing import parse_calendar_pages
+from src.workers.base import S3Worker
+
+logger = logging.getLogger("root")
+
+# Turns the decoded bronze records of a source into match candidates
+CANDIDATE_READERS: dict[str, Callable[[Iterable[dict]], Iterator[MatchCandidate]]] = {
+    "fxstreet": from_fxstreet,
+    # Investing bronze records are raw calendar pages
+    "investing": lambda pages: from_investing(parse_calendar_pages(pages)),
+    "trading_view": from_trading_view,
+}
+
+
+class CatalogWorker(S3Worker):
+    """Builds the unified catalog from the bronze objects of every source."""
+
+    def __init__(self, catalog_config: CatalogConfig) -> None:
+        super().__init__(catalog_config.s3_config, BronzeCodec())
+        self.catalog_config = catalog_config
+
+        unknown_sources = set(catalog_config.sources) - set(CANDIDATE_READERS)
+        if unknown_sources:
+            msg = f"Unknown catalog sources: {', '.join(sorted(unknown_sources))}"
+            raise ValueError(msg)
+
+    def run(
+        self,
+        start_date: date,
+        end_date: date,
+        mode: str = "silver",
+        *,
+        resume: bool = False,  # noqa: ARG002
+    ) -> None:
+        if mode == "silver":
+            self._run_silver(start_date, end_date)
+        else:
+            msg = f"Invalid mode: {mode}"
+            raise ValueError(msg)
+
+    def _run_silver(self, start_date: date, end_date: date) -> None:
+        # pyarrow is an optional dependency, only needed for silver runs
+        from src import silver  # noqa: PLC0415
+
+        logger.info(
+            "Running catalog silver mode worker for %s to %s ...", start_date, end_date
+        )
+        candidates = [
+            candidate
+            for source, source_config in self.catalog_config.sources.items()
+            for candidate in self._read_candidates(
+                source, source_config, start_date, end_date
+            )
+            if start_date <= candidate.datetime_utc.date() <= end_date
+        ]
+        rows = match_events(candidates, self.catalog_config.time_bucket_minutes)
+        table = silver.build_crosswalk_table(rows)
+
+        key = (
+            f"{self.catalog_config.crosswalk_output_prefix}"
+            f"/{start_date}_{end_date}.parquet"
+        )
+        self.s3_client.put_object(
+            Bucket=self.catalog_config.s3_config.bucket_name,
+            Key=key,
+            Body=silver.to_parquet_bytes(table),
+            ContentType="application/vnd.apache.parquet",
+        )
+        logger.info(
+            "Wrote crosswalk of %d events in %d matches to %s",
+            table.num_rows,
+            len(set(table["match_id"].to_pylist())),
+            key,
+        )
+
+        logger.info("Job completed successfully")
+
+    def _read_candidates(
+        self,
+        source: str,
+        source_config: BronzeSourceConfig,
+        start_date: date,
+        end_date: date,
+    ) -> Iterator[MatchCandidate]:
+        manifest = BronzeManifest(
+            self.s3_client,
+            bucket_name=source_config.bucket_name,
+            prefix=source_config.raw_output_name_template.split("{", 1)[0],
+            cache_path=(
+                Path(self.catalog_config.manifest_cache_dir) / f"{source}_manifest.json"
+            ),
+        )
+        # Newest first, matching keeps the first version of each event like
+        # the silver layer keeps the most recently written one
+        keys = [
+            key
+            for key, (window_start, window_end) in parse_bronze_windows(
+                reversed(manifest.keys_by_write_time(refresh=True)),
+                source_config.raw_output_name_template,
+            )
+            if window_start <= end_date and window_end >= start_date
+        ]
+        logger.info("Reading %d %s bronze objects ...", len(keys), source)
+
+        read_candidates = CANDIDATE_READERS[source]
+        for key in keys:
+            yield from read_candidates(
+                self._read_bronze_records(source_config.bucket_name, key)
+            )
+
+    def _read_bronze_records(self, bucket_name: str, key: str) -> Iterator[dict]:
+        response = self.s3_client.get_object(Bucket=bucket_name, Key=key)
+        yield from codec_for_key(key).decode(response["Body"].iter_chunks())
@@ -1,84 +1,603 @@
+import asyncio
 import json
 import logging
-from datetime import date
+import re
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+from pathlib import Path
 
-import boto3
 from botocore.exceptions import ClientError
 
+from src import tracing
+from src.bronze_codec import codec_for_key
+from src.checkpoint import CheckpointJournal
 from src.config import FXStreetConfig
+from src.date_windows import split_date_range
+from src.deltas import changed_events, fingerprint_events
+from src.event_details import EventDetailsStore
+from src.manifest import BronzeManifest, parse_bronze_windows
+from src.parsers.fxstreet import FXStreetEvent, encode_event
 from src.resources.fxstreet import FXStreetResource
+from src.s3_upload import upload_stream
+from src.workers.base import S3Worker
 
 logger = logging.getLogger("root")
 
+_SEQUENCE_PATTERN = re.compile(r"\d+")
 
-class FXStreetWorker:
+
+class FXStreetWorker(S3Worker):
     def __init__(self, fxstreet_config: FXStreetConfig) -> None:
+        super().__init__(fxstreet_config.s3_config, fxstreet_config.bronze_codec)
         self.fxstreet_config = fxstreet_config
-        self.fxstreet_resource = FXStreetResource(fxstreet_config.http_client)
-        self.s3_client = boto3.client(
-            "s3",
-            endpoint_url=fxstreet_config.s3_config.endpoint,
-            aws_access_key_id=fxstreet_config.s3_config.access_key,
-            aws_secret_access_key=fxstreet_config.s3_config.secret_key,
-            use_ssl=fxstreet_config.s3_config.use_ssl,
+        self.fxstreet_resource = FXStreetResource(
+            fxstreet_config.http_client, fxstreet_config.async_http_client
+        )
+        self.checkpoint_journal = CheckpointJournal(
+            Path(fxstreet_config.backfill_config.checkpoint_path)
+        )
+        self.event_details_store = EventDetailsStore(
+            Path(fxstreet_config.enrichment_config.details_store_path),
+            max_age=fxstreet_config.enrichment_config.details_max_age,
+        )
+        self.bronze_manifest = BronzeManifest(
+            self.s3_client,
+            bucket_name=fxstreet_config.s3_config.bucket_name,
+            prefix=fxstreet_config.raw_output_name_template.split("{", 1)[0],
+            cache_path=Path(fxstreet_config.incremental_config.manifest_cache_path),
+            cache_ttl=fxstreet_config.incremental_config.manifest_cache_ttl,
         )
 
-        self._create_bucket()
-
-    def run(self, start_date: date, end_date: date, mode: str = "raw") -> None:
+    def run(
+        self,
+        start_date: date,
+        end_date: date,
+        mode: str = "raw",
+        *,
+        resume: bool = False,
+    ) -> None:
+        self._reset_retry_budget(self.fxstreet_config.http_client)
         if mode == "raw":
-            self._run_raw(start_date, end_date)
+            self._run_raw(start_date, end_date, resume=resume)
+        elif mode == "backfill":
+            self._run_backfill(start_date, end_date, resume=resume)
+        elif mode == "incremental":
+            self._run_incremental(start_date, end_date, resume=resume)
+        elif mode == "retry":
+            self._run_retry(start_date, end_date)
+        elif mode == "delta":
+            self._run_delta(start_date, end_date)
+        elif mode == "details":
+            self._run_details(start_date, end_date)
+        elif mode == "silver":
+            self._run_silver(start_date, end_date)
         else:
             msg = f"Invalid mode: {mode}"
             raise ValueError(msg)
 
-    def _run_raw(self, start_date: date, end_date: date) -> None:
+    def _run_raw(self, start_date: date, end_date: date, *, resume: bool) -> None:
         logger.info(
             "Running FXStreet raw mode worker for %s to %s ...", start_date, end_date
         )
-        events = self.fxstreet_resource.get_calendar_events(start_date, end_date)
+        key = self._get_raw_output_key(start_date, end_date)
+        if resume and self.checkpoint_journal.is_completed(key):
+            logger.info("Skipping %s, already completed", key)
+            return
+
+        try:
+            with self.fxstreet_resource.stream_calendar_events(
+                start_date, end_date
+            ) as response:
+                logger.info(
+                    "Streaming events to S3 bucket %s as %s ...",
+                    self.fxstreet_config.s3_config.bucket_name,
+                    key,
+                )
+                payload_sha256 = upload_stream(
+                    self.s3_client,
+                    self.fxstreet_config.s3_config.bucket_name,
+                    key,
+                    self._count_array_items(response.iter_bytes()),
+                    part_size=self.fxstreet_config.s3_config.part_size,
+                    reencoder=self.fxstreet_config.bronze_codec.encode,
+                    **self.fxstreet_config.bronze_codec.put_kwargs(),
+                )
+        except Exception as e:
+            self.checkpoint_journal.record_failure(start_date, end_date, key, e)
+            raise
+
+        self.checkpoint_journal.record(start_date, end_date, key, payload_sha256)
+
+        logger.info("Job completed successfully")
+
+    def _run_backfill(self, start_date: date, end_date: date, *, resume: bool) -> None:
+        backfill_config = self.fxstreet_config.backfill_config
+        windows = split_date_range(start_date, end_date, backfill_config.window)
+        if resume:
+            windows = self._skip_completed_windows(windows)
+
+        logger.info(
+            "Running FXStreet backfill for %s to %s in %d %s windows ...",
+            start_date,
+            end_date,
+            len(windows),
+            backfill_config.window,
+        )
+        self._run_windows(windows)
+
+        logger.info("Job completed successfully")
 
+    def _run_retry(self, start_date: date, end_date: date) -> None:
+        windows = self.checkpoint_journal.failed_windows(start_date, end_date)
         logger.info(
-            "Uploading events to S3 bucket %s ...",
-            self.fxstreet_config.s3_config.bucket_name,
+            "Retrying %d failed FXStreet windows between %s and %s ...",
+            len(windows),
+            start_date,
+            end_date,
         )
+        if windows:
+            self._run_windows(windows)
 
-        key = self.fxstreet_config.raw_output_name_template.format(
-            start_date=start_date,
-            end_date=end_date,
+        logger.info("Job completed successfully")
+
+    def _run_incremental(
+        self, start_date: date, end_date: date, *, resume: bool
+    ) -> None:
+        backfill_config = self.fxstreet_config.backfill_config
+        windows = split_date_range(start_date, end_date, backfill_config.window)
+
+        existing_keys = self.bronze_manifest.keys()
+        volatile_since = date.today() - timedelta(
+            days=self.fxstreet_config.incremental_config.volatile_days
         )
-        self.s3_client.put_object(
-            Bucket=self.fxstreet_config.s3_config.bucket_name,
-            Key=key,
-            Body=json.dumps(events).encode("utf-8"),
+        pending_windows = [
+            (window_start, window_end)
+            for window_start, window_end in windows
+            if window_end >= volatile_since
+            or self._get_raw_output_key(window_start, window_end) not in existing_keys
+        ]
+        logger.info(
+            "Incremental run, skipping %d already materialized windows",
+            len(windows) - len(pending_windows),
         )
+        if resume:
+            pending_windows = self._skip_completed_windows(pending_windows)
+
+        logger.info(
+            "Running FXStreet incremental for %s to %s in %d %s windows ...",
+            start_date,
+            end_date,
+            len(pending_windows),
+            backfill_config.window,
+        )
+        try:
+            self._run_windows(pending_windows)
+        finally:
+            self.bronze_manifest.save()
 
         logger.info("Job completed successfully")
 
-    def _create_bucket(self) -> None:
+    def _run_delta(self, start_date: date, end_date: date) -> None:
+        windows = split_date_range(
+            start_date, end_date, self.fxstreet_config.backfill_config.window
+        )
+        logger.info(
+            "Running FXStreet delta for %s to %s in %d %s windows ...",
+            start_date,
+            end_date,
+            len(windows),
+            self.fxstreet_config.backfill_config.window,
+        )
+        failed_windows = self._run_async(
+            self._gather_windows(windows, self._delta_window)
+        )
+        if failed_windows:
+            msg = f"{len(failed_windows)} of {len(windows)} delta windows failed"
+            raise RuntimeError(msg)
+
+        logger.info("Job completed successfully")
+
+    async def _delta_window(self, window_start: date, window_end: date) -> None:
+        """
+        Write the events of a window that changed since their day's snapshot.
+
+        The window is pulled in one request, but snapshots and deltas are kept
+        per calendar day of `dateUtc`, so that polls of a sliding horizon, e.g.
+        the next seven days, compare against the snapshots of the previous
+        poll whatever the bounds of their window.
+        """
+        events = await self._aget_calendar_events(window_start, window_end)
+        events_by_day: dict[date, list[dict]] = {}
+        for event in events:
+            events_by_day.setdefault(_event_day(event, window_start), []).append(event)
+        for day, day_events in sorted(events_by_day.items()):
+            await self._delta_day(day, day_events)
+
+    async def _delta_day(self, day: date, events: list[dict]) -> None:
+        """
+        Write the events of a day that changed since the day's bronze snapshot.
+
+        New and changed events go to a delta object numbered after the previous
+        delta of the day, then the snapshot is replaced by the fresh pull so
+        the next run compares against it. Nothing is written if nothing changed.
+        """
+        key = self._get_raw_output_key(day, day)
+        previous_fingerprints = await asyncio.to_thread(
+            self._read_snapshot_fingerprints, key
+        )
+        delta, new, changed = changed_events(previous_fingerprints, events)
+        if not delta:
+            logger.info("No changes on %s", day)
+            return
+
+        # Deltas are listed too, so a lost or fresh journal never reuses, and
+        # overwrites, the sequence of a delta already in the bucket
+        listed_sequence = await asyncio.to_thread(
+            self._last_listed_delta_sequence, day, day
+        )
+        sequence = (
+            max(self.checkpoint_journal.last_delta_sequence(key), listed_sequence) + 1
+        )
+        delta_key = self.bronze_codec.output_key(
+            self.fxstreet_config.delta_config.output_name_template.format(
+                start_date=day, end_date=day, sequence=sequence
+            )
+        )
+        logger.info(
+            "Writing %d new and %d changed events of %s as delta %d ...",
+            new,
+            changed,
+            day,
+            sequence,
+        )
+        await asyncio.to_thread(self._upload_events, delta_key, delta)
+        self.checkpoint_journal.record_delta(key, delta_key, sequence, len(delta))
+
+        payload_sha256 = await asyncio.to_thread(self._upload_events, key, events)
+        self.checkpoint_journal.record(day, day, key, payload_sha256)
+        self.bronze_manifest.add(key)
+
+    def _last_listed_delta_sequence(self, window_start: date, window_end: date) -> int:
+        """Return the highest sequence of the deltas of a window in the bucket."""
+        prefix = self.fxstreet_config.delta_config.output_name_template.split(
+            "{sequence", 1
+        )[0].format(start_date=window_start, end_date=window_end)
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        return max(
+            (
+                int(match[0])
+                for page in paginator.paginate(
+                    Bucket=self.fxstreet_config.s3_config.bucket_name, Prefix=prefix
+                )
+                for obj in page.get("Contents", [])
+                if (match := _SEQUENCE_PATTERN.match(obj["Key"], len(prefix)))
+            ),
+            default=0,
+        )
+
+    def _read_snapshot_fingerprints(self, key: str) -> dict[str, bytes]:
+        """Return the event fingerprints of a bronze snapshot, empty if missing."""
         try:
+            response = self.s3_client.get_object(
+                Bucket=self.fxstreet_config.s3_config.bucket_name, Key=key
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchKey":
+                raise
+            return {}
+        return fingerprint_events(
+            codec_for_key(key).decode(response["Body"].iter_chunks())
+        )
+
+    def _run_details(self, start_date: date, end_date: date) -> None:
+        logger.info(
+            "Running FXStreet event details enrichment for %s to %s ...",
+            start_date,
+            end_date,
+        )
+        windows = split_date_range(
+            start_date, end_date, self.fxstreet_config.backfill_config.window
+        )
+        details, failed_event_ids = self._run_async(self._enrich_event_details(windows))
+
+        key = self._get_output_key(
+            self.fxstreet_config.enrichment_config.details_output_name_template,
+            start_date,
+            end_date,
+        )
+        self._upload_events(key, details)
+
+        if failed_event_ids:
+            msg = f"Details of {len(failed_event_ids)} events could not be fetched"
+            raise RuntimeError(msg)
+
+        logger.info("Job completed successfully")
+
+    async def _enrich_event_details(
+        self, windows: list[tuple[date, date]]
+    ) -> tuple[list[dict], list[str]]:
+        """
+        Fetch the details of every event series found in the windows.
+
+        Calendars are pulled with the backfill parallelism, then the unique event
+        ids not already in the details store are fetched concurrently.
+
+        Returns:
+            Details in order of first appearance, and the event ids that failed
+        """
+        window_semaphore = asyncio.Semaphore(
+            self.fxstreet_config.backfill_config.max_workers
+        )
+        details_semaphore = asyncio.Semaphore(
+            self.fxstreet_config.enrichment_config.max_concurrency
+        )
+        try:
+            calendars = await asyncio.gather(
+                *(
+                    self._get_window_events(window_semaphore, window_start, window_end)
+                    for window_start, window_end in windows
+                )
+            )
+            event_ids = list(
+                dict.fromkeys(
+                    event["eventId"]
+                    for events in calendars
+                    for event in events
+                    if event.get("eventId")
+                )
+            )
+            details = self.event_details_store.get_many(event_ids)
+            missing_event_ids = [
+                event_id for event_id in event_ids if event_id not in details
+            ]
             logger.info(
-                "Creating bucket %s ...", self.fxstreet_config.s3_config.bucket_name
+                "Found %d event series, %d already stored, fetching %d ...",
+                len(event_ids),
+                len(details),
+                len(missing_event_ids),
             )
-            self.s3_client.create_bucket(
-                Bucket=self.fxstreet_config.s3_config.bucket_name
+            results = await asyncio.gather(
+                *(
+                    self._get_event_details(details_semaphore, event_id)
+                    for event_id in missing_event_ids
+                ),
+                return_exceptions=True,
             )
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code == "BucketAlreadyOwnedByYou":
-                logger.info(
-                    "Bucket %s already exists and is owned by you",
-                    self.fxstreet_config.s3_config.bucket_name,
+        finally:
+            await self._release_async_http_client(
+                self.fxstreet_config.async_http_client
+            )
+
+        failed_event_ids = []
+        for event_id, result in zip(missing_event_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Fetching details of event %s failed", event_id, exc_info=result
                 )
+                failed_event_ids.append(event_id)
             else:
-                logger.exception(
-                    "Failed to create bucket %s",
-                    self.fxstreet_config.s3_config.bucket_name,
+                details[event_id] = result
+
+        return [
+            details[event_id] for event_id in event_ids if event_id in details
+        ], failed_event_ids
+
+    async def _get_window_events(
+        self, semaphore: asyncio.Semaphore, window_start: date, window_end: date
+    ) -> list[dict]:
+        async with semaphore:
+            return await self._aget_calendar_events(window_start, window_end)
+
+    async def _aget_calendar_events(
+        self, start_date: date, end_date: date
+    ) -> list[dict]:
+        sharding_config = self.fxstreet_config.sharding_config
+        if sharding_config.shard_by is None:
+            return await self.fxstreet_resource.aget_calendar_events(
+                start_date, end_date
+            )
+        return await self.fxstreet_resource.aget_calendar_events_sharded(
+            start_date,
+            end_date,
+            shard_by=sharding_config.shard_by,
+            shard_size=sharding_config.shard_size,
+        )
+
+    async def _aget_calendar_event_records(
+        self, start_date: date, end_date: date
+    ) -> list[FXStreetEvent]:
+        sharding_config = self.fxstreet_config.sharding_config
+        if sharding_config.shard_by is None:
+            return await self.fxstreet_resource.aget_calendar_event_records(
+                start_date, end_date
+            )
+        return await self.fxstreet_resource.aget_calendar_event_records_sharded(
+            start_date,
+            end_date,
+            shard_by=sharding_config.shard_by,
+            shard_size=sharding_config.shard_size,
+        )
+
+    async def _get_event_details(
+        self, semaphore: asyncio.Semaphore, event_id: str
+    ) -> dict:
+        async with semaphore:
+            details = await self.fxstreet_resource.aget_event_details(event_id)
+        self.event_details_store.put(event_id, details)
+        return details
+
+    def _run_silver(self, start_date: date, end_date: date) -> None:
+        # pyarrow is an optional dependency, only needed for silver runs
+        from src import silver  # noqa: PLC0415
+
+        logger.info(
+            "Running FXStreet silver mode worker for %s to %s ...", start_date, end_date
+        )
+        bronze_windows = self._list_bronze_windows()
+        bucket_name = self.fxstreet_config.s3_config.bucket_name
+        # Objects overlapping several batches are downloaded and parsed once
+        bronze_tables = {}
+
+        for batch_start, batch_end in split_date_range(
+            start_date, end_date, self.fxstreet_config.backfill_config.window
+        ):
+            keys = [
+                key
+                for key, (window_start, window_end) in bronze_windows
+                if window_start <= batch_end and window_end >= batch_start
+            ]
+            logger.info(
+                "Normalizing %d bronze objects for %s to %s ...",
+                len(keys),
+                batch_start,
+                batch_end,
+            )
+            for key in keys:
+                if key not in bronze_tables:
+                    bronze_tables[key] = silver.read_bronze_ndjson(
+                        self._read_bronze_ndjson(key)
+                    )
+            table = silver.build_silver_table(
+                [bronze_tables[key] for key in keys], batch_start, batch_end
+            )
+            for key, (_, window_end) in bronze_windows:
+                if window_end <= batch_end:
+                    bronze_tables.pop(key, None)
+
+            partitions = 0
+            for day, country, partition in silver.partition_by_date_and_country(table):
+                self.s3_client.put_object(
+                    Bucket=bucket_name,
+                    Key=(
+                        f"{self.fxstreet_config.silver_output_prefix}"
+                        f"/date={day}/country={country}/events.parquet"
+                    ),
+                    Body=silver.to_parquet_bytes(partition),
+                    ContentType="application/vnd.apache.parquet",
                 )
-                raise
-        except Exception:
-            logger.exception(
-                "Failed to create bucket %s",
-                self.fxstreet_config.s3_config.bucket_name,
+                partitions += 1
+            logger.info("Wrote %d events in %d partitions", table.num_rows, partitions)
+
+        logger.info("Job completed successfully")
+
+    def _list_bronze_windows(self) -> list[tuple[str, tuple[date, date]]]:
+        """Return existing bronze keys with their windows, oldest write first."""
+        return parse_bronze_windows(
+            self.bronze_manifest.keys_by_write_time(refresh=True),
+            self.fxstreet_config.raw_output_name_template,
+        )
+
+    def _read_bronze_ndjson(self, key: str) -> bytes:
+        response = self.s3_client.get_object(
+            Bucket=self.fxstreet_config.s3_config.bucket_name, Key=key
+        )
+        records = codec_for_key(key).iter_raw_records(response["Body"].iter_chunks())
+        return b"\n".join(records)
+
+    def _skip_completed_windows(
+        self, windows: list[tuple[date, date]]
+    ) -> list[tuple[date, date]]:
+        pending_windows = [
+            window
+            for window in windows
+            if not self.checkpoint_journal.is_completed(
+                self._get_raw_output_key(*window)
             )
-            raise
+        ]
+        logger.info(
+            "Resuming, skipping %d already completed windows",
+            len(windows) - len(pending_windows),
+        )
+        return pending_windows
+
+    def _run_windows(self, windows: list[tuple[date, date]]) -> None:
+        failed_windows = self._run_async(self._backfill_windows(windows))
+        if failed_windows:
+            msg = (
+                f"{len(failed_windows)} of {len(windows)} windows failed and were "
+                "recorded for a later run in retry mode"
+            )
+            raise RuntimeError(msg)
+
+    async def _backfill_windows(
+        self, windows: list[tuple[date, date]]
+    ) -> list[tuple[date, date]]:
+        """Fetch and upload windows in parallel, returning the ones that failed."""
+        failed_windows = await self._gather_windows(windows, self._backfill_window)
+        for window, error in failed_windows:
+            self.checkpoint_journal.record_failure(
+                *window, self._get_raw_output_key(*window), error
+            )
+        return [window for window, _ in failed_windows]
+
+    async def _gather_windows(
+        self,
+        windows: list[tuple[date, date]],
+        run_window: Callable[[date, date], Awaitable[None]],
+    ) -> list[tuple[tuple[date, date], BaseException]]:
+        """Run windows with the backfill parallelism, returning the failed ones."""
+        semaphore = asyncio.Semaphore(self.fxstreet_config.backfill_config.max_workers)
+
+        async def run_bounded(window_start: date, window_end: date) -> None:
+            async with semaphore:
+                with tracing.span("window", start=window_start, end=window_end):
+                    await run_window(window_start, window_end)
+
+        try:
+            results = await asyncio.gather(
+                *(
+                    run_bounded(window_start, window_end)
+                    for window_start, window_end in windows
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            await self._release_async_http_client(
+                self.fxstreet_config.async_http_client
+            )
+
+        failed_windows = []
+        for window, result in zip(windows, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error("Window %s to %s failed", *window, exc_info=result)
+                failed_windows.append((window, result))
+        return failed_windows
+
+    async def _backfill_window(self, window_start: date, window_end: date) -> None:
+        key = self._get_raw_output_key(window_start, window_end)
+        if self.fxstreet_config.typed_events:
+            records = await self._aget_calendar_event_records(window_start, window_end)
+            payload_sha256 = await asyncio.to_thread(
+                self._upload_event_records, key, records
+            )
+        else:
+            events = await self._aget_calendar_events(window_start, window_end)
+            payload_sha256 = await asyncio.to_thread(self._upload_events, key, events)
+
+        self.checkpoint_journal.record(window_start, window_end, key, payload_sha256)
+        self.bronze_manifest.add(key)
+
+    def _get_raw_output_key(self, start_date: date, end_date: date) -> str:
+        return self._get_output_key(
+            self.fxstreet_config.raw_output_name_template, start_date, end_date
+        )
+
+    def _upload_events(self, key: str, events: list[dict]) -> str:
+        """Upload events with the bronze codec and return the payload SHA-256."""
+        logger.info("Uploading %d events ...", len(events))
+        return self._upload_records(
+            key, (json.dumps(event).encode("utf-8") for event in events)
+        )
+
+    def _upload_event_records(self, key: str, records: list[FXStreetEvent]) -> str:
+        """Like `_upload_events`, for events decoded into records."""
+        logger.info("Uploading %d events ...", len(records))
+        return self._upload_records(key, map(encode_event, records))
+
+
+def _event_day(event: dict, default: date) -> date:
+    """Return the UTC day of an event, `default` if its `dateUtc` is unusable."""
+    try:
+        return date.fromisoformat(event["dateUtc"][:10])
+    except (KeyError, TypeError, ValueError):
+        return default
@@ -0,0 +1,92 @@
+import json
+import logging
+from datetime import date
+from pathlib import Path
+
+from src.checkpoint import CheckpointJournal
+from src.config import InvestingConfig
+from src.parsers.investing import parse_calendar_pages, parse_event_details_batch
+from src.resources.investing import InvestingResource
+from src.workers.base import S3Worker
+
+logger = logging.getLogger("root")
+
+
+class InvestingWorker(S3Worker):
+    def __init__(self, investing_config: InvestingConfig) -> None:
+        super().__init__(investing_config.s3_config, investing_config.bronze_codec)
+        self.investing_config = investing_config
+        self.investing_resource = InvestingResource(
+            investing_config.http_client, investing_config.async_http_client
+        )
+        self.checkpoint_journal = CheckpointJournal(
+            Path(investing_config.checkpoint_path)
+        )
+
+    def run(
+        self,
+        start_date: date,
+        end_date: date,
+        mode: str = "raw",
+        *,
+        resume: bool = False,
+    ) -> None:
+        self._reset_retry_budget(self.investing_config.http_client)
+        if mode == "raw":
+            self._run_raw(start_date, end_date, resume=resume)
+        elif mode == "details":
+            self._run_details(start_date, end_date)
+        else:
+            msg = f"Invalid mode: {mode}"
+            raise ValueError(msg)
+
+    def _run_raw(self, start_date: date, end_date: date, *, resume: bool) -> None:
+        logger.info(
+            "Running Investing raw mode worker for %s to %s ...", start_date, end_date
+        )
+        key = self._get_output_key(
+            self.investing_config.raw_output_name_template, start_date, end_date
+        )
+        if resume and self.checkpoint_journal.is_completed(key):
+            logger.info("Skipping %s, already completed", key)
+            return
+
+        # Pages are uploaded as they arrive while the next one is prefetched
+        pages = self.investing_resource.iter_calendar_pages(start_date, end_date)
+        try:
+            payload_sha256 = self._upload_records(
+                key, (json.dumps(page).encode("utf-8") for page in pages)
+            )
+        except Exception as e:
+            self.checkpoint_journal.record_failure(start_date, end_date, key, e)
+            raise
+
+        self.checkpoint_journal.record(start_date, end_date, key, payload_sha256)
+
+        logger.info("Job completed successfully")
+
+    def _run_details(self, start_date: date, end_date: date) -> None:
+        logger.info(
+            "Running Investing event details scrape for %s to %s ...",
+            start_date,
+            end_date,
+        )
+        events = parse_calendar_pages(
+            self.investing_resource.iter_calendar_pages(start_date, end_date)
+        )
+        event_urls = list(dict.fromkeys(event.url for event in events if event.url))
+
+        self._run_detail_scrape(
+            self._get_output_key(
+                self.investing_config.details_output_name_template,
+                start_date,
+                end_date,
+            ),
+            event_urls,
+            self.investing_resource.aget_event_details,
+            parse_event_details_batch,
+            self.investing_config.async_http_client,
+            self.investing_config.detail_scrape_config,
+        )
+
+        logger.info("Job completed successfully")
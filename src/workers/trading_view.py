@@ -0,0 +1,111 @@
+import json
+import logging
+from datetime import date
+from pathlib import Path
+
+from src.checkpoint import CheckpointJournal
+from src.config import TradingViewConfig
+from src.parsers.trading_view import parse_event_details_batch
+from src.resources.trading_view import TradingViewResource
+from src.workers.base import S3Worker
+
+logger = logging.getLogger("root")
+
+
+class TradingViewWorker(S3Worker):
+    def __init__(self, trading_view_config: TradingViewConfig) -> None:
+        super().__init__(
+            trading_view_config.s3_config, trading_view_config.bronze_codec
+        )
+        self.trading_view_config = trading_view_config
+        self.trading_view_resource = TradingViewResource(
+            trading_view_config.http_client, trading_view_config.async_http_client
+        )
+        self.checkpoint_journal = CheckpointJournal(
+            Path(trading_view_config.checkpoint_path)
+        )
+
+    def run(
+        self,
+        start_date: date,
+        end_date: date,
+        mode: str = "raw",
+        *,
+        resume: bool = False,
+    ) -> None:
+        self._reset_retry_budget(self.trading_view_config.http_client)
+        if mode == "raw":
+            self._run_raw(start_date, end_date, resume=resume)
+        elif mode == "details":
+            self._run_details(start_date, end_date)
+        else:
+            msg = f"Invalid mode: {mode}"
+            raise ValueError(msg)
+
+    def _run_raw(self, start_date: date, end_date: date, *, resume: bool) -> None:
+        logger.info(
+            "Running TradingView raw mode worker for %s to %s ...",
+            start_date,
+            end_date,
+        )
+        key = self._get_output_key(
+            self.trading_view_config.raw_output_name_template, start_date, end_date
+        )
+        if resume and self.checkpoint_journal.is_completed(key):
+            logger.info("Skipping %s, already completed", key)
+            return
+
+        try:
+            events = self._get_calendar_events(start_date, end_date)
+            payload_sha256 = self._upload_records(
+                key, (json.dumps(event).encode("utf-8") for event in events)
+            )
+        except Exception as e:
+            self.checkpoint_journal.record_failure(start_date, end_date, key, e)
+            raise
+
+        self.checkpoint_journal.record(start_date, end_date, key, payload_sha256)
+
+        logger.info("Job completed successfully")
+
+    def _run_details(self, start_date: date, end_date: date) -> None:
+        logger.info(
+            "Running TradingView event details scrape for %s to %s ...",
+            start_date,
+            end_date,
+        )
+        events = self._get_calendar_events(start_date, end_date)
+        event_tickers = list(
+            dict.fromkeys(
+                _event_ticker(event["ticker"])
+                for event in events
+                if event.get("ticker")
+            )
+        )
+
+        self._run_detail_scrape(
+            self._get_output_key(
+                self.trading_view_config.details_output_name_template,
+                start_date,
+                end_date,
+            ),
+            event_tickers,
+            self.trading_view_resource.aget_event_details,
+            parse_event_details_batch,
+            self.trading_view_config.async_http_client,
+            self.trading_view_config.detail_scrape_config,
+        )
+
+        logger.info("Job completed successfully")
+
+    def _get_calendar_events(self, start_date: date, end_date: date) -> list[dict]:
+        data = self.trading_view_resource.get_calendar_events(start_date, end_date)
+        # The events API wraps the events as {"status": "ok", "result": [...]}
+        return data["result"] if isinstance(data, dict) else data
+
+
+def _event_ticker(ticker: str) -> str:
+    """Turn a calendar ticker into the symbol used by indicator page URLs."""
+    if ":" in ticker:
+        return ticker.replace(":", "-")
+    return f"ECONOMICS-{ticker}"
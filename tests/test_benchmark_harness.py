@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from benchmarks.harness import (
+    Stage,
+    compare,
+    measure,
+    run_fxstreet,
+    run_trading_view,
+)
+from benchmarks.upstream import UpstreamConfig
+
+UPSTREAM_CONFIG = UpstreamConfig(events_per_response=20, pages=2)
+
+
+def test_measure_reports_the_peak_of_its_own_stage(tmp_path: Path) -> None:
+    def allocate(stage: Stage) -> int:
+        chunks = [bytes(1024 * 1024) for _ in range(8)]
+        return run_trading_view(stage, 1) + len(chunks)
+
+    allocating = measure("allocate", allocate, UPSTREAM_CONFIG, tmp_path, repeat=1)
+    idling = measure(
+        "idle", lambda stage: run_trading_view(stage, 1), UPSTREAM_CONFIG, tmp_path, 1
+    )
+
+    assert allocating["peak_traced_mib"] >= 8
+    assert idling["peak_traced_mib"] < 1
+    assert allocating["events"] == idling["events"] + 8
+
+
+def test_fxstreet_stage_counts_uploaded_events(tmp_path: Path) -> None:
+    result = measure(
+        "fxstreet_raw",
+        lambda stage: run_fxstreet(stage, 2, "raw"),
+        UPSTREAM_CONFIG,
+        tmp_path,
+        repeat=1,
+    )
+
+    assert result["events"] == 40
+    assert result["requests"] == 2
+
+
+def test_compare_flags_regressions_beyond_tolerance() -> None:
+    baseline = {"fast": {"events_per_sec": 100}, "slow": {"events_per_sec": 100}}
+    results = [
+        {"stage": "fast", "events_per_sec": 90},
+        {"stage": "slow", "events_per_sec": 70},
+        {"stage": "new", "events_per_sec": 1},
+    ]
+
+    assert compare(results, baseline, tolerance=0.2) == ["slow"]
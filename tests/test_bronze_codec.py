@@ -0,0 +1,167 @@
+import json
+from collections.abc import Iterator
+
+import pytest
+
+from src.bronze_codec import (
+    COMPRESSIONS,
+    FORMATS,
+    BronzeCodec,
+    JSONArrayItemCounter,
+    codec_for_key,
+    iter_json_array_items,
+    iter_json_array_values,
+)
+
+EVENTS = [
+    {"id": "1", "name": "CPI [YoY]", "actual": 1.5, "tags": ["a", "b"]},
+    {"id": "2", "name": 'Quote " and \\ escape, }', "actual": None},
+    {"id": "3", "name": "Ünïcode €", "nested": {"list": [1, 2, {"x": []}]}},
+]
+
+
+def chunked(payload: bytes, size: int) -> Iterator[bytes]:
+    for offset in range(0, len(payload), size):
+        yield payload[offset : offset + size]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 10_000])
+def test_splitter_handles_any_chunk_boundary(chunk_size: int) -> None:
+    payload = json.dumps(EVENTS, ensure_ascii=False, indent=2).encode()
+
+    items = list(iter_json_array_items(chunked(payload, chunk_size)))
+
+    assert [json.loads(item) for item in items] == EVENTS
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 10_000])
+def test_splitter_yields_decoded_values(chunk_size: int) -> None:
+    payload = json.dumps(EVENTS, ensure_ascii=False).encode()
+
+    assert list(iter_json_array_values(chunked(payload, chunk_size))) == EVENTS
+
+
+def test_splitter_yields_scalars() -> None:
+    assert list(iter_json_array_items(chunked(b' [1, "two", null ,3.5] ', 1))) == [
+        b"1",
+        b'"two"',
+        b"null",
+        b"3.5",
+    ]
+
+
+def test_splitter_waits_for_numbers_cut_between_chunks() -> None:
+    payload = b"[3.5, 1e-5, -2E+3]"
+
+    assert list(iter_json_array_items(chunked(payload, 1))) == [
+        b"3.5",
+        b"1e-5",
+        b"-2E+3",
+    ]
+
+
+def test_splitter_rejects_invalid_items() -> None:
+    with pytest.raises(ValueError, match="Invalid JSON array item"):
+        list(iter_json_array_items([b'[{"id": "1"}x]']))
+
+
+@pytest.mark.parametrize("payload", [b"[]", b" [ ] ", b"[\n]\n"])
+def test_splitter_empty_array(payload: bytes) -> None:
+    assert list(iter_json_array_items([payload])) == []
+
+
+def test_splitter_rejects_truncated_array() -> None:
+    with pytest.raises(ValueError, match="Truncated"):
+        list(iter_json_array_items([b'[{"id": "1"}, ']))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 10_000])
+def test_counter_counts_items_of_any_chunking(chunk_size: int) -> None:
+    counter = JSONArrayItemCounter()
+    for chunk in chunked(json.dumps(EVENTS).encode(), chunk_size):
+        counter.feed(chunk)
+
+    assert counter.close() == len(EVENTS)
+
+    truncated = JSONArrayItemCounter()
+    truncated.feed(b'[{"id": "1"}, ')
+    with pytest.raises(ValueError, match="Truncated"):
+        truncated.close()
+
+
+def test_splitter_rejects_non_array() -> None:
+    with pytest.raises(ValueError, match="Expected a JSON array"):
+        list(iter_json_array_items([b'{"id": "1"}']))
+
+
+def _codecs() -> list[BronzeCodec]:
+    return [
+        BronzeCodec(format=format_, compression=compression)
+        for format_ in FORMATS
+        for compression in COMPRESSIONS
+    ]
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.suffix)
+def test_encode_decode_round_trip(codec: BronzeCodec) -> None:
+    if codec.compression == "zstd":
+        pytest.importorskip("zstandard")
+    payload = json.dumps(EVENTS).encode()
+
+    encoded = b"".join(codec.encode(chunked(payload, 5)))
+
+    assert list(codec.decode(chunked(encoded, 3))) == EVENTS
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.suffix)
+def test_encode_records_round_trip(codec: BronzeCodec) -> None:
+    if codec.compression == "zstd":
+        pytest.importorskip("zstandard")
+    records = [json.dumps(event).encode() for event in EVENTS]
+
+    encoded = b"".join(codec.encode_records(records))
+
+    assert list(codec.iter_raw_records([encoded])) == records
+
+
+def test_encode_records_without_records() -> None:
+    assert b"".join(BronzeCodec().encode_records([])) == b"[]"
+    assert b"".join(BronzeCodec(format="ndjson").encode_records([])) == b""
+
+
+def test_output_key_and_put_kwargs() -> None:
+    codec = BronzeCodec(format="ndjson", compression="gzip")
+
+    assert codec.output_key("events/2024-01-01_2024-01-31.json") == (
+        "events/2024-01-01_2024-01-31.ndjson.gz"
+    )
+    assert codec.put_kwargs() == {
+        "ContentType": "application/x-ndjson",
+        "ContentEncoding": "gzip",
+    }
+    assert BronzeCodec().put_kwargs() == {"ContentType": "application/json"}
+
+
+@pytest.mark.parametrize(
+    ("key", "codec"),
+    [
+        ("a/b.json", BronzeCodec()),
+        ("a/b.ndjson", BronzeCodec(format="ndjson")),
+        ("a/b.json.gz", BronzeCodec(compression="gzip")),
+        ("a/b.ndjson.zst", BronzeCodec(format="ndjson", compression="zstd")),
+    ],
+)
+def test_codec_for_key(key: str, codec: BronzeCodec) -> None:
+    assert codec_for_key(key) == codec
+
+
+def test_codec_for_unknown_key() -> None:
+    with pytest.raises(ValueError, match="Cannot infer"):
+        codec_for_key("a/b.parquet")
+
+
+def test_invalid_codec() -> None:
+    with pytest.raises(ValueError, match="format"):
+        BronzeCodec(format="csv")
+    with pytest.raises(ValueError, match="compression"):
+        BronzeCodec(compression="brotli")
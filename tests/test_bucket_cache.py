@@ -0,0 +1,49 @@
+from pathlib import Path
+from unittest import mock
+
+from benchmarks.s3 import InMemoryS3
+from src.bronze_codec import BronzeCodec
+from src.bucket_cache import BucketCache
+from src.config import S3Config
+from src.workers.base import S3Worker
+
+ENDPOINT = "http://s3.invalid"
+
+
+def test_added_buckets_are_cached_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "buckets.json"
+    BucketCache(path).add(ENDPOINT, "fxstreet")
+
+    bucket_cache = BucketCache(path)
+    assert bucket_cache.contains(ENDPOINT, "fxstreet")
+    assert not bucket_cache.contains(ENDPOINT, "investing")
+    assert not bucket_cache.contains("http://other.invalid", "fxstreet")
+
+
+def test_expired_and_corrupt_caches_miss(tmp_path: Path) -> None:
+    path = tmp_path / "buckets.json"
+    BucketCache(path).add(ENDPOINT, "fxstreet")
+
+    assert not BucketCache(path, ttl=-1).contains(ENDPOINT, "fxstreet")
+
+    path.write_text("{")
+    assert not BucketCache(path).contains(ENDPOINT, "fxstreet")
+
+
+def test_workers_create_cached_buckets_once(tmp_path: Path) -> None:
+    s3 = InMemoryS3()
+    s3_config = S3Config(
+        endpoint=ENDPOINT,
+        access_key="",
+        secret_key="",
+        bucket_name="fxstreet",
+        bucket_cache_path=str(tmp_path / "buckets.json"),
+    )
+    create_bucket = mock.Mock(wraps=s3.create_bucket)
+    s3.create_bucket = create_bucket
+
+    with mock.patch("boto3.client", return_value=s3):
+        S3Worker(s3_config, BronzeCodec())
+        S3Worker(s3_config, BronzeCodec())
+
+    create_bucket.assert_called_once_with(Bucket="fxstreet")
@@ -0,0 +1,92 @@
+import gzip
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.cassette import (
+    AsyncRecordingTransport,
+    AsyncReplayTransport,
+    Cassette,
+    CassetteMissError,
+    RecordingTransport,
+    ReplayTransport,
+)
+
+URL = "https://calendar.invalid/events"
+
+
+class Upstream:
+    """Upstream numbering its responses and echoing request bodies."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        return httpx.Response(
+            200,
+            json={"call": self.requests, "body": request.content.decode()},
+            headers={"x-upstream": "yes"},
+        )
+
+
+@pytest.fixture
+def upstream() -> Upstream:
+    return Upstream()
+
+
+def test_replay_answers_recorded_requests_in_order(
+    tmp_path: Path, upstream: Upstream
+) -> None:
+    path = tmp_path / "cassettes" / "calendar.ndjson.gz"
+    with httpx.Client(
+        transport=RecordingTransport(Cassette(path), httpx.MockTransport(upstream))
+    ) as client:
+        client.get(URL)
+        client.get(URL)
+        client.post(URL, content=b"page=2")
+
+    with httpx.Client(transport=ReplayTransport(Cassette(path), 0)) as client:
+        replayed = [client.get(URL).json()["call"] for _ in range(3)]
+        posted = client.post(URL, content=b"page=2")
+
+    assert upstream.requests == 3
+    assert replayed == [1, 2, 2]
+    assert posted.json() == {"call": 3, "body": "page=2"}
+    assert posted.headers["x-upstream"] == "yes"
+    # Every exchange is its own gzip member, readable as one stream
+    with gzip.open(path, "rt") as file:
+        assert len(file.readlines()) == 3
+
+
+def test_replay_misses_unrecorded_requests(tmp_path: Path, upstream: Upstream) -> None:
+    path = tmp_path / "calendar.ndjson.gz"
+    with httpx.Client(
+        transport=RecordingTransport(Cassette(path), httpx.MockTransport(upstream))
+    ) as client:
+        client.post(URL, content=b"page=1")
+
+    with (
+        httpx.Client(transport=ReplayTransport(Cassette(path), 0)) as client,
+        pytest.raises(CassetteMissError, match="POST"),
+    ):
+        client.post(URL, content=b"page=2")
+
+
+async def test_async_transports_share_the_cassette_format(
+    tmp_path: Path, upstream: Upstream
+) -> None:
+    path = tmp_path / "calendar.ndjson.gz"
+    async with httpx.AsyncClient(
+        transport=AsyncRecordingTransport(Cassette(path), httpx.MockTransport(upstream))
+    ) as client:
+        recorded = await client.get(URL, params={"page": 1})
+
+    with httpx.Client(transport=ReplayTransport(Cassette(path), 0)) as client:
+        assert client.get(URL, params={"page": 1}).json() == recorded.json()
+    async with httpx.AsyncClient(
+        transport=AsyncReplayTransport(Cassette(path), 0)
+    ) as client:
+        assert (await client.get(URL, params={"page": 1})).json() == recorded.json()
+    assert upstream.requests == 1
@@ -0,0 +1,61 @@
+import io
+import json
+from datetime import UTC, date, datetime
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from benchmarks.s3 import InMemoryS3
+from src.config import BronzeSourceConfig, CatalogConfig, S3Config
+from src.workers.catalog import CatalogWorker
+
+BUCKET = "catalog"
+
+
+def test_catalog_matches_the_most_recently_written_event(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    s3 = InMemoryS3()
+    s3.create_bucket(Bucket="fxstreet")
+    # The event was rescheduled after the first window holding it was written
+    versions = [
+        ("fxstreet/events/2024-01-10_2024-01-10.json", "2024-01-10T13:30:00Z", 1),
+        ("fxstreet/events/2024-01-01_2024-01-31.json", "2024-01-11T13:30:00Z", 2),
+    ]
+    for key, date_utc, written_day in versions:
+        event = {
+            "id": "fx",
+            "name": "Nonfarm Payrolls",
+            "dateUtc": date_utc,
+            "countryCode": "US",
+        }
+        s3.put_object(Bucket="fxstreet", Key=key, Body=json.dumps([event]).encode())
+        s3.last_modified["fxstreet", key] = datetime(2024, 2, written_day, tzinfo=UTC)
+
+    config = CatalogConfig(
+        s3_config=S3Config(
+            endpoint="http://s3.invalid",
+            access_key="",
+            secret_key="",
+            bucket_name=BUCKET,
+            bucket_cache_path=None,
+        ),
+        sources={
+            "fxstreet": BronzeSourceConfig(
+                "fxstreet", "fxstreet/events/{start_date}_{end_date}.json"
+            )
+        },
+        manifest_cache_dir=str(tmp_path),
+    )
+    with mock.patch("boto3.client", return_value=s3):
+        CatalogWorker(config).run(date(2024, 1, 1), date(2024, 1, 31))
+
+    table = pq.read_table(
+        io.BytesIO(
+            s3.objects[BUCKET, "catalog/silver/crosswalk/2024-01-01_2024-01-31.parquet"]
+        )
+    )
+    assert table["source_event_id"].to_pylist() == ["fx"]
+    assert table["datetime_utc"].to_pylist() == [
+        datetime(2024, 1, 11, 13, 30, tzinfo=UTC)
+    ]
@@ -0,0 +1,59 @@
+from datetime import date
+from pathlib import Path
+
+from src.checkpoint import CheckpointJournal
+
+KEY = "fxstreet/events/2024-01-01_2024-01-31.json"
+
+
+def test_records_completed_windows(tmp_path: Path) -> None:
+    journal = CheckpointJournal(tmp_path / "journal.sqlite3")
+
+    assert not journal.is_completed(KEY)
+    journal.record(date(2024, 1, 1), date(2024, 1, 31), KEY, "abc")
+
+    assert journal.is_completed(KEY)
+    assert not journal.is_completed("fxstreet/events/2024-02-01_2024-02-29.json")
+
+
+def test_checkpoints_persist_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "journal.sqlite3"
+    journal = CheckpointJournal(path)
+    journal.record(date(2024, 1, 1), date(2024, 1, 31), KEY, "abc")
+    journal.close()
+
+    assert CheckpointJournal(path).is_completed(KEY)
+
+
+def test_failed_windows_until_completed(tmp_path: Path) -> None:
+    journal = CheckpointJournal(tmp_path / "journal.sqlite3")
+    february = "fxstreet/events/2024-02-01_2024-02-29.json"
+    journal.record_failure(
+        date(2024, 2, 1), date(2024, 2, 29), february, TimeoutError("slow")
+    )
+    journal.record_failure(date(2024, 1, 1), date(2024, 1, 31), KEY, ValueError())
+
+    assert journal.failed_windows(date(2024, 1, 1), date(2024, 12, 31)) == [
+        (date(2024, 1, 1), date(2024, 1, 31)),
+        (date(2024, 2, 1), date(2024, 2, 29)),
+    ]
+    assert journal.failed_windows(date(2024, 2, 1), date(2024, 12, 31)) == [
+        (date(2024, 2, 1), date(2024, 2, 29)),
+    ]
+
+    journal.record(date(2024, 1, 1), date(2024, 1, 31), KEY, "abc")
+
+    assert journal.failed_windows(date(2024, 1, 1), date(2024, 12, 31)) == [
+        (date(2024, 2, 1), date(2024, 2, 29)),
+    ]
+
+
+def test_last_delta_sequence(tmp_path: Path) -> None:
+    journal = CheckpointJournal(tmp_path / "journal.sqlite3")
+    assert journal.last_delta_sequence(KEY) == 0
+
+    journal.record_delta(KEY, "fxstreet/deltas/a/000001.json", 1, 3)
+    journal.record_delta(KEY, "fxstreet/deltas/a/000002.json", 2, 1)
+    journal.record_delta("other.json", "fxstreet/deltas/b/000007.json", 7, 1)
+
+    assert journal.last_delta_sequence(KEY) == 2
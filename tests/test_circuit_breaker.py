@@ -0,0 +1,153 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.circuit_breaker import CircuitBreaker, CircuitOpenError, RetryBudget
+from src.config import CircuitBreakerConfig, RetryBudgetConfig
+from src.http_client import AsyncHTTPClient, HTTPClient
+
+HOST = "calendar.example.com"
+URL = f"https://{HOST}/events"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr("src.circuit_breaker.time.monotonic", clock)
+    return clock
+
+
+def breaker(**kwargs) -> CircuitBreaker:
+    return CircuitBreaker(CircuitBreakerConfig(**kwargs))
+
+
+@pytest.mark.usefixtures("clock")
+def test_circuit_opens_after_consecutive_failures() -> None:
+    circuit_breaker = breaker(failure_threshold=2)
+
+    circuit_breaker.record_failure(HOST)
+    circuit_breaker.record_success(HOST)
+    circuit_breaker.record_failure(HOST)
+    circuit_breaker.before_request(HOST)
+    circuit_breaker.record_failure(HOST)
+
+    with pytest.raises(CircuitOpenError) as error:
+        circuit_breaker.before_request(HOST)
+    assert error.value.host == HOST
+    circuit_breaker.before_request("other.example.com")
+
+
+def test_half_open_probe_closes_or_reopens_circuit(clock: Clock) -> None:
+    circuit_breaker = breaker(failure_threshold=1, reset_timeout=10)
+    circuit_breaker.record_failure(HOST)
+
+    clock.now += 10
+    circuit_breaker.before_request(HOST)
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_request(HOST)
+    circuit_breaker.record_failure(HOST)
+
+    clock.now += 5
+    with pytest.raises(CircuitOpenError) as error:
+        circuit_breaker.before_request(HOST)
+    assert error.value.retry_in == pytest.approx(5)
+
+    clock.now += 5
+    circuit_breaker.before_request(HOST)
+    circuit_breaker.record_success(HOST)
+    circuit_breaker.before_request(HOST)
+    circuit_breaker.before_request(HOST)
+
+
+async def test_cancelled_probe_gives_its_slot_back(clock: Clock) -> None:
+    circuit_breaker = breaker(failure_threshold=1, reset_timeout=10)
+    circuit_breaker.record_failure(HOST)
+    clock.now += 10
+    probe_sent = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+        if not probe_sent.is_set():
+            probe_sent.set()
+            await asyncio.Event().wait()
+        return httpx.Response(200)
+
+    client = AsyncHTTPClient(
+        rate_limit_delay=0,
+        circuit_breaker=circuit_breaker,
+        transport=httpx.MockTransport(handler),
+    )
+    probe = asyncio.create_task(client.request("GET", URL))
+    await probe_sent.wait()
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert (await client.request("GET", URL)).status_code == 200
+    circuit_breaker.before_request(HOST)
+    await client.aclose()
+
+
+def test_retry_budget_is_bounded_by_requests() -> None:
+    retry_budget = RetryBudget(RetryBudgetConfig(ratio=0.5, min_retries=1))
+
+    assert retry_budget.try_spend()
+    assert not retry_budget.try_spend()
+
+    for _ in range(4):
+        retry_budget.record_request()
+    assert retry_budget.try_spend()
+    assert retry_budget.try_spend()
+    assert not retry_budget.try_spend()
+
+    retry_budget.reset()
+    assert retry_budget.try_spend()
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_client_counts_throttling_as_breaker_failure(status_code: int) -> None:
+    circuit_breaker = breaker(failure_threshold=2)
+    client = HTTPClient(
+        rate_limit_delay=0,
+        max_retries=1,
+        circuit_breaker=circuit_breaker,
+        transport=httpx.MockTransport(lambda _: httpx.Response(status_code)),
+    )
+
+    for _ in range(2):
+        client.request("GET", URL, ignore_codes=[status_code])
+
+    with pytest.raises(CircuitOpenError):
+        client.request("GET", URL)
+
+
+def test_client_stops_retrying_once_budget_is_spent() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(500)
+
+    client = HTTPClient(
+        rate_limit_delay=0,
+        max_retries=3,
+        retry_backoff_base=0,
+        retry_budget=RetryBudget(RetryBudgetConfig(ratio=0, min_retries=1)),
+        transport=httpx.MockTransport(handler),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.request("GET", URL)
+    assert len(requests) == 2
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.request("GET", URL)
+    assert len(requests) == 3
@@ -0,0 +1,46 @@
+from datetime import date
+
+import pytest
+
+from src.date_windows import split_date_range
+
+
+def test_days() -> None:
+    assert split_date_range(date(2024, 1, 30), date(2024, 2, 1), "day") == [
+        (date(2024, 1, 30), date(2024, 1, 30)),
+        (date(2024, 1, 31), date(2024, 1, 31)),
+        (date(2024, 2, 1), date(2024, 2, 1)),
+    ]
+
+
+def test_weeks_start_on_monday() -> None:
+    # 2024-01-03 is a Wednesday
+    assert split_date_range(date(2024, 1, 3), date(2024, 1, 16), "week") == [
+        (date(2024, 1, 3), date(2024, 1, 7)),
+        (date(2024, 1, 8), date(2024, 1, 14)),
+        (date(2024, 1, 15), date(2024, 1, 16)),
+    ]
+
+
+def test_months_are_calendar_aligned_across_years() -> None:
+    assert split_date_range(date(2023, 11, 15), date(2024, 2, 10), "month") == [
+        (date(2023, 11, 15), date(2023, 11, 30)),
+        (date(2023, 12, 1), date(2023, 12, 31)),
+        (date(2024, 1, 1), date(2024, 1, 31)),
+        (date(2024, 2, 1), date(2024, 2, 10)),
+    ]
+
+
+def test_single_day_range() -> None:
+    day = date(2024, 2, 29)
+    assert split_date_range(day, day, "month") == [(day, day)]
+
+
+def test_invalid_window() -> None:
+    with pytest.raises(ValueError, match="Invalid window"):
+        split_date_range(date(2024, 1, 1), date(2024, 1, 2), "year")
+
+
+def test_start_after_end() -> None:
+    with pytest.raises(ValueError, match="after end date"):
+        split_date_range(date(2024, 1, 2), date(2024, 1, 1), "day")
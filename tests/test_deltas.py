@@ -0,0 +1,32 @@
+from src.deltas import changed_events, event_fingerprint, fingerprint_events
+
+
+def test_fingerprint_ignores_key_order() -> None:
+    assert event_fingerprint({"id": "a", "actual": 1}) == event_fingerprint(
+        {"actual": 1, "id": "a"}
+    )
+    assert event_fingerprint({"id": "a", "actual": 1}) != event_fingerprint(
+        {"id": "a", "actual": 2}
+    )
+
+
+def test_fingerprint_events_skips_events_without_id() -> None:
+    assert list(fingerprint_events([{"id": "a"}, {"id": None}, {}])) == ["a"]
+
+
+def test_changed_events() -> None:
+    previous = fingerprint_events(
+        [{"id": "same", "actual": 1}, {"id": "changed", "actual": None}]
+    )
+
+    delta, new, changed = changed_events(
+        previous,
+        [
+            {"id": "changed", "actual": 2},
+            {"id": "same", "actual": 1},
+            {"id": "new", "actual": None},
+        ],
+    )
+
+    assert delta == [{"id": "changed", "actual": 2}, {"id": "new", "actual": None}]
+    assert (new, changed) == (1, 1)
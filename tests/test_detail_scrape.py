@@ -0,0 +1,122 @@
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from src.detail_scrape import DetailPage, scrape_details
+from src.parsers import investing, trading_view
+
+INVESTING_PAGE = """
+<h1 class="ecTitle float_lang_base_1 relativeAttr">Nonfarm Payrolls</h1>
+<div id="overViewBox" class="overViewBox event">
+  <div class="left">Nonfarm Payrolls measures the change in the number of
+  people employed &amp; paid.<br/></div>
+  <div class="right">
+    <div><span>Importance:</span><span data-img_key="bull3"></span></div>
+    <div><span>Country:</span> <span> <i title="United States"></i></span></div>
+    <div><span>Currency:</span><span>USD</span></div>
+    <div><span>Source:</span> <span> <a href="https://www.bls.gov/" target="_blank"
+      title="Bureau of Labor Statistics">BLS</a></span></div>
+  </div>
+</div>
+"""
+
+TRADING_VIEW_PAGE = """
+<title>United States Non Farm Payrolls &amp; more</title>
+<meta name="description" content="Actual   and forecast values">
+<link rel="canonical" href="https://www.tradingview.com/symbols/ECONOMICS-USNFP/">
+"""
+
+
+def pages_to_keys(pages: list[DetailPage]) -> list[str]:
+    return [key for key, _, _ in pages]
+
+
+async def fetch(key: str) -> httpx.Response:
+    if key.startswith("missing"):
+        raise httpx.ConnectError(key)
+    return httpx.Response(200, text=key)
+
+
+async def test_scrape_details_batches_pages_and_reports_failures() -> None:
+    batches = []
+
+    def parse_batch(pages: list[DetailPage]) -> list[str]:
+        batches.append(len(pages))
+        return pages_to_keys(pages)
+
+    with ThreadPoolExecutor(1) as executor:
+        records, failed_keys = await scrape_details(
+            ["a", "b", "missing-1", "c", "a", "d", "e"],
+            fetch,
+            parse_batch,
+            executor,
+            max_concurrency=2,
+            batch_size=2,
+        )
+
+    assert sorted(records) == ["a", "b", "c", "d", "e"]
+    assert failed_keys == ["missing-1"]
+    assert sorted(batches) == [1, 2, 2]
+
+
+async def test_scrape_details_without_keys() -> None:
+    with ThreadPoolExecutor(1) as executor:
+        assert await scrape_details([], fetch, pages_to_keys, executor) == ([], [])
+
+
+@pytest.mark.parametrize(
+    "parse_batch",
+    [investing.parse_event_details_batch, trading_view.parse_event_details_batch],
+)
+async def test_parsers_run_in_worker_processes(
+    parse_batch: Callable[[list[DetailPage]], list],
+) -> None:
+    async def fetch_page(key: str) -> httpx.Response:
+        return httpx.Response(200, text=f"<title>{key}</title>")
+
+    with ProcessPoolExecutor(1) as executor:
+        records, _ = await scrape_details(["x"], fetch_page, parse_batch, executor)
+
+    assert len(records) == 1
+
+
+def test_parse_investing_event_details_page() -> None:
+    details = investing.parse_event_details_page("/e/nfp", INVESTING_PAGE)
+
+    assert details == investing.InvestingEventDetails(
+        event_url="/e/nfp",
+        title="Nonfarm Payrolls",
+        description=(
+            "Nonfarm Payrolls measures the change in the number of people "
+            "employed & paid."
+        ),
+        importance=3,
+        country="United States",
+        currency="USD",
+        source="Bureau of Labor Statistics",
+        source_url="https://www.bls.gov/",
+    )
+
+
+def test_parse_trading_view_event_details_page() -> None:
+    details = trading_view.parse_event_details_batch(
+        [("USNFP", TRADING_VIEW_PAGE.encode(), "utf-8")]
+    )
+
+    assert details == [
+        trading_view.TradingViewEventDetails(
+            event_ticker="USNFP",
+            title="United States Non Farm Payrolls & more",
+            description="Actual and forecast values",
+            canonical_url="https://www.tradingview.com/symbols/ECONOMICS-USNFP/",
+        )
+    ]
+
+
+def test_parse_empty_details_page() -> None:
+    details = investing.parse_event_details_page("/e/x", "")
+
+    assert details.title is None
+    assert details.source is None
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from src.event_details import EventDetailsStore
+
+
+def test_get_many_returns_stored_details(tmp_path: Path) -> None:
+    store = EventDetailsStore(tmp_path / "details.sqlite3", max_age=60)
+    store.put("cpi", {"id": "cpi", "unit": "%"})
+    store.put("gdp", {"id": "gdp"})
+    store.put("cpi", {"id": "cpi", "unit": "pp"})
+
+    assert store.get_many(["cpi", "missing"]) == {"cpi": {"id": "cpi", "unit": "pp"}}
+
+
+def test_get_many_skips_expired_details(tmp_path: Path) -> None:
+    store = EventDetailsStore(tmp_path / "details.sqlite3", max_age=-1)
+    store.put("cpi", {"id": "cpi"})
+
+    assert store.get_many(["cpi"]) == {}
+
+
+def test_get_many_batches_large_lookups(tmp_path: Path) -> None:
+    store = EventDetailsStore(tmp_path / "nested" / "details.sqlite3", max_age=60)
+    event_ids = [f"event-{index}" for index in range(1200)]
+    for event_id in event_ids[::100]:
+        store.put(event_id, {"id": event_id})
+    store.close()
+
+    store = EventDetailsStore(tmp_path / "nested" / "details.sqlite3", max_age=60)
+
+    assert sorted(store.get_many(event_ids)) == sorted(event_ids[::100])
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from src.parsers.fxstreet import FXStreetEvent, decode_events, encode_event
+
+EVENTS = [
+    {
+        "dateUtc": "2024-01-10T13:30:00Z",
+        "id": "a",
+        "eventId": "cpi",
+        "name": "CPI (MoM)",
+        "countryCode": "US",
+        "categoryId": None,
+        "volatility": "HIGH",
+        "actual": 0.3,
+        "consensus": 0.2,
+        "previous": -1,
+        "isTentative": False,
+        "unit": "%",
+    },
+    {
+        "id": "b",
+        "eventId": "cpi",
+        "name": "CPI (MoM)",
+        "dateUtc": "2024-02-10T13:30:00Z",
+        "countryCode": "US",
+        "categoryId": None,
+        "volatility": "HIGH",
+        "actual": None,
+        "consensus": None,
+        "previous": 0.3,
+    },
+]
+
+
+def test_decode_events_into_records() -> None:
+    first, second = decode_events(json.dumps(EVENTS).encode())
+
+    assert first[:10] == (
+        "a",
+        "cpi",
+        "CPI (MoM)",
+        "2024-01-10T13:30:00Z",
+        "US",
+        None,
+        "HIGH",
+        0.3,
+        0.2,
+        -1,
+    )
+    assert first.extra == (False, "%")
+    assert first.key_order == tuple(EVENTS[0])
+    assert second.extra == ()
+    # Strings repeated across events are shared
+    assert first.name is second.name
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_encode_event_matches_the_dict_path(
+    chunk_size: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("src.parsers.fxstreet._CHUNK_SIZE", chunk_size)
+    payload = json.dumps(EVENTS, indent=2, ensure_ascii=False).encode()
+
+    assert [encode_event(record) for record in decode_events(payload)] == [
+        json.dumps(event).encode() for event in EVENTS
+    ]
+
+
+def test_encode_event_without_key_order() -> None:
+    record = FXStreetEvent("a", None, None, "2024-01-10", None, None, None, 1, 2, 3)
+
+    assert json.loads(encode_event(record)) == {
+        "id": "a",
+        "eventId": None,
+        "name": None,
+        "dateUtc": "2024-01-10",
+        "countryCode": None,
+        "categoryId": None,
+        "volatility": None,
+        "actual": 1,
+        "consensus": 2,
+        "previous": 3,
+    }
+
+
+@pytest.mark.parametrize(
+    ("payload", "match"),
+    [
+        (b'{"id": "a"}', "Expected a JSON array"),
+        (b"[1]", "event 0 is not a JSON object"),
+        (b'[{"id": "a"}]', "event 0 has no 'eventId'"),
+        (
+            json.dumps([EVENTS[1], {**EVENTS[1], "actual": "0.3"}]).encode(),
+            "event 1 has a field of an invalid type",
+        ),
+        (json.dumps(EVENTS).encode()[:-1], "Truncated"),
+    ],
+)
+def test_decode_events_rejects_invalid_payloads(payload: bytes, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        decode_events(payload)
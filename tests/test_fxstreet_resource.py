@@ -0,0 +1,77 @@
+from datetime import date
+
+import httpx
+import pytest
+
+from src.http_client import AsyncHTTPClient, HTTPClient
+from src.resources.fxstreet import (
+    EVENTS_API_PARAMS,
+    SUPPORTED_COUNTRIES,
+    FXStreetResource,
+    merge_events,
+    shard_params,
+)
+
+
+def test_shard_params_covers_every_country_once() -> None:
+    shards = shard_params("country", 20)
+
+    assert [len(shard["countries"]) for shard in shards] == [20, 20, 11]
+    assert [country for shard in shards for country in shard["countries"]] == (
+        SUPPORTED_COUNTRIES
+    )
+    assert all(
+        shard["categories"] == EVENTS_API_PARAMS["categories"] for shard in shards
+    )
+
+
+def test_shard_params_rejects_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="shard_by"):
+        shard_params("volatility", 2)
+    with pytest.raises(ValueError, match="shard_size"):
+        shard_params("category", 0)
+
+
+def test_merge_events_keeps_first_occurrence() -> None:
+    merged = merge_events(
+        [
+            [{"id": "a", "shard": 1}, {"id": None, "shard": 1}],
+            [{"id": "a", "shard": 2}, {"id": "b", "shard": 2}, {"shard": 2}],
+        ]
+    )
+
+    assert merged == [
+        {"id": "a", "shard": 1},
+        {"id": None, "shard": 1},
+        {"id": "b", "shard": 2},
+        {"shard": 2},
+    ]
+
+
+async def test_sharded_calendar_requests_are_merged() -> None:
+    categories = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        shard_categories = request.url.params.get_list("categories")
+        categories.append(shard_categories)
+        # Every shard returns the shared event "common"
+        return httpx.Response(200, json=[{"id": "common"}, {"id": shard_categories[0]}])
+
+    async_http_client = AsyncHTTPClient(
+        rate_limit_delay=0, transport=httpx.MockTransport(handler)
+    )
+    resource = FXStreetResource(HTTPClient(rate_limit_delay=0), async_http_client)
+
+    events = await resource.aget_calendar_events_sharded(
+        date(2024, 1, 1), date(2024, 1, 31), shard_by="category", shard_size=5
+    )
+    await async_http_client.aclose()
+
+    assert len(categories) == 3
+    assert sorted(category for shard in categories for category in shard) == sorted(
+        EVENTS_API_PARAMS["categories"]
+    )
+    assert [event["id"] for event in events] == [
+        "common",
+        *(shard["categories"][0] for shard in shard_params("category", 5)),
+    ]
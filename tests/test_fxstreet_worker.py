@@ -0,0 +1,395 @@
+import dataclasses
+import io
+import json
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import pytest
+
+from benchmarks.s3 import InMemoryS3
+from src import metrics
+from src.checkpoint import CheckpointJournal
+from src.circuit_breaker import RetryBudget
+from src.config import (
+    BackfillConfig,
+    EnrichmentConfig,
+    FXStreetConfig,
+    IncrementalConfig,
+    RetryBudgetConfig,
+    S3Config,
+)
+from src.date_windows import split_date_range
+from src.event_details import EventDetailsStore
+from src.http_client import AsyncHTTPClient, HTTPClient
+from src.workers.fxstreet import FXStreetWorker
+
+BUCKET = "fxstreet"
+
+
+class FXStreetUpstream:
+    """
+    Mock FXStreet API serving `events`, recording the requests it got.
+
+    Windows starting on a day of `failing_starts` are answered with a 404.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[dict] = []
+        self.failing_starts: set[str] = set()
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        *_, start, end = request.url.path.split("/")
+        if start[:10] in self.failing_starts:
+            return httpx.Response(404)
+        if "/v2/eventDates/" in request.url.path:
+            return httpx.Response(
+                200,
+                json=[
+                    item
+                    for item in self.events
+                    if start[:10] <= item["dateUtc"][:10] <= end[:10]
+                ],
+            )
+        return httpx.Response(200, json={"id": end, "name": "details"})
+
+
+@pytest.fixture
+def s3() -> InMemoryS3:
+    return InMemoryS3()
+
+
+@pytest.fixture
+def upstream() -> FXStreetUpstream:
+    return FXStreetUpstream()
+
+
+@pytest.fixture
+def worker(
+    s3: InMemoryS3, upstream: FXStreetUpstream, tmp_path: Path
+) -> Iterator[FXStreetWorker]:
+    config = FXStreetConfig(
+        http_client=HTTPClient(
+            rate_limit_delay=0, transport=httpx.MockTransport(upstream)
+        ),
+        async_http_client=AsyncHTTPClient(
+            rate_limit_delay=0, transport=httpx.MockTransport(upstream)
+        ),
+        s3_config=S3Config(
+            endpoint="http://s3.invalid",
+            access_key="",
+            secret_key="",
+            bucket_name=BUCKET,
+            bucket_cache_path=None,
+        ),
+        backfill_config=BackfillConfig(
+            checkpoint_path=str(tmp_path / "checkpoints.sqlite3")
+        ),
+        incremental_config=IncrementalConfig(
+            manifest_cache_path=str(tmp_path / "manifest.json")
+        ),
+        enrichment_config=EnrichmentConfig(
+            details_store_path=str(tmp_path / "details.sqlite3")
+        ),
+    )
+    with mock.patch("boto3.client", return_value=s3):
+        yield FXStreetWorker(config)
+
+
+def put_bronze(s3: InMemoryS3, key: str, written_at: datetime, *events: dict) -> None:
+    s3.put_object(Bucket=BUCKET, Key=key, Body=json.dumps(list(events)).encode())
+    s3.last_modified[BUCKET, key] = written_at
+
+
+def event(
+    event_id: str, date_utc: str, actual: float, series_id: str = "series"
+) -> dict:
+    return {
+        "id": event_id,
+        "eventId": series_id,
+        "name": "CPI",
+        "dateUtc": date_utc,
+        "countryCode": "US",
+        "categoryId": None,
+        "volatility": "HIGH",
+        "actual": actual,
+        "consensus": None,
+        "previous": None,
+    }
+
+
+def requested_starts(upstream: FXStreetUpstream) -> list[str]:
+    return sorted(
+        request.url.path.split("/")[-2][:10]
+        for request in upstream.requests
+        if "/v2/eventDates/" in request.url.path
+    )
+
+
+def test_backfill_uploads_and_records_each_window(
+    s3: InMemoryS3, upstream: FXStreetUpstream, worker: FXStreetWorker
+) -> None:
+    upstream.events = [
+        event("a", "2024-01-10T13:30:00Z", 1.0),
+        event("b", "2024-02-11T13:30:00Z", 2.0),
+        event("c", "2024-03-12T13:30:00Z", 3.0),
+    ]
+
+    worker.run(date(2024, 1, 1), date(2024, 3, 31), mode="backfill")
+
+    assert requested_starts(upstream) == ["2024-01-01", "2024-02-01", "2024-03-01"]
+    keys = [
+        "fxstreet/events/2024-01-01_2024-01-31.json",
+        "fxstreet/events/2024-02-01_2024-02-29.json",
+        "fxstreet/events/2024-03-01_2024-03-31.json",
+    ]
+    assert {key: json.loads(s3.objects[BUCKET, key]) for key in keys} == {
+        key: [item] for key, item in zip(keys, upstream.events, strict=True)
+    }
+    assert all(worker.checkpoint_journal.is_completed(key) for key in keys)
+
+
+def test_resume_skips_completed_windows_and_retries_failed_ones(
+    s3: InMemoryS3, upstream: FXStreetUpstream, worker: FXStreetWorker
+) -> None:
+    upstream.events = [
+        event("a", "2024-01-10T13:30:00Z", 1.0),
+        event("b", "2024-02-11T13:30:00Z", 2.0),
+    ]
+    upstream.failing_starts = {"2024-02-01"}
+    with pytest.raises(RuntimeError, match="1 of 3 windows failed"):
+        worker.run(date(2024, 1, 1), date(2024, 3, 31), mode="backfill")
+    assert (BUCKET, "fxstreet/events/2024-02-01_2024-02-29.json") not in s3.objects
+
+    upstream.failing_starts = set()
+    upstream.requests.clear()
+    worker.run(date(2024, 1, 1), date(2024, 3, 31), mode="backfill", resume=True)
+
+    assert requested_starts(upstream) == ["2024-02-01"]
+    assert json.loads(
+        s3.objects[BUCKET, "fxstreet/events/2024-02-01_2024-02-29.json"]
+    ) == [upstream.events[1]]
+    assert (
+        worker.checkpoint_journal.failed_windows(date(2024, 1, 1), date(2024, 3, 31))
+        == []
+    )
+
+
+def test_incremental_skips_windows_in_the_manifest(
+    s3: InMemoryS3, upstream: FXStreetUpstream, worker: FXStreetWorker
+) -> None:
+    upstream.events = [event("b", "2024-02-11T13:30:00Z", 2.0)]
+    put_bronze(
+        s3,
+        "fxstreet/events/2024-01-01_2024-01-31.json",
+        datetime(2024, 2, 1, tzinfo=UTC),
+        event("a", "2024-01-10T13:30:00Z", 1.0),
+    )
+
+    worker.run(date(2024, 1, 1), date(2024, 2, 29), mode="incremental")
+
+    assert requested_starts(upstream) == ["2024-02-01"]
+    assert json.loads(
+        s3.objects[BUCKET, "fxstreet/events/2024-01-01_2024-01-31.json"]
+    ) == [event("a", "2024-01-10T13:30:00Z", 1.0)]
+
+
+def test_incremental_refetches_volatile_windows(
+    s3: InMemoryS3, upstream: FXStreetUpstream, worker: FXStreetWorker
+) -> None:
+    end_date = date.today()
+    start_date = end_date - timedelta(days=3)
+    windows = split_date_range(start_date, end_date, "month")
+    for window_start, window_end in windows:
+        put_bronze(
+            s3,
+            f"fxstreet/events/{window_start}_{window_end}.json",
+            datetime.now(UTC),
+        )
+
+    worker.run(start_date, end_date, mode="incremental")
+
+    assert requested_starts(upstream) == [
+        window_start.isoformat() for window_start, _ in windows
+    ]
+
+
+def test_silver_keeps_the_most_recently_written_event(
+    s3: InMemoryS3, worker: FXStreetWorker
+) -> None:
+    pytest.importorskip("pyarrow")
+    # Sorted by key the shorter window comes last, but it was written first
+    put_bronze(
+        s3,
+        "fxstreet/events/2024-01-15_2024-01-31.json",
+        datetime(2024, 1, 20, tzinfo=UTC),
+        event("a", "2024-01-20T12:30:00Z", 1.0),
+    )
+    put_bronze(
+        s3,
+        "fxstreet/events/2024-01-01_2024-01-31.json",
+        datetime(2024, 2, 1, tzinfo=UTC),
+        event("a", "2024-01-20T12:30:00Z", 2.0),
+    )
+
+    worker.run(date(2024, 1, 1), date(2024, 1, 31), mode="silver")
+
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    body = s3.objects[
+        BUCKET, "fxstreet/silver/events/date=2024-01-20/country=US/events.parquet"
+    ]
+    assert pq.read_table(io.BytesIO(body))["actual"].to_pylist() == [2.0]
+
+
+def test_silver_reads_each_bronze_object_once(
+    s3: InMemoryS3, worker: FXStreetWorker
+) -> None:
+    pytest.importorskip("pyarrow")
+    put_bronze(
+        s3,
+        "fxstreet/events/2024-01-01_2024-03-31.json",
+        datetime(2024, 4, 1, tzinfo=UTC),
+        event("a", "2024-01-20T12:30:00Z", 1.0),
+        event("b", "2024-03-20T12:30:00Z", 1.0),
+    )
+    get_object = mock.Mock(wraps=s3.get_object)
+    s3.get_object = get_object
+
+    worker.run(date(2024, 1, 1), date(2024, 3, 31), mode="silver")
+
+    assert get_object.call_count == 1
+    assert sorted(key for _, key in s3.objects if key.endswith(".parquet")) == [
+        "fxstreet/silver/events/date=2024-01-20/country=US/events.parquet",
+        "fxstreet/silver/events/date=2024-03-20/country=US/events.parquet",
+    ]
+
+
+def test_each_run_gets_a_fresh_retry_budget(worker: FXStreetWorker) -> None:
+    retry_budget = RetryBudget(RetryBudgetConfig(ratio=0, min_retries=1))
+    worker.fxstreet_config.http_client.retry_budget = retry_budget
+    assert retry_budget.try_spend()
+    assert not retry_budget.try_spend()
+
+    worker.run(date(2024, 1, 1), date(2024, 1, 31), mode="retry")
+
+    assert retry_budget.try_spend()
+
+
+def test_details_fetches_only_missing_series(
+    s3: InMemoryS3, upstream: FXStreetUpstream, worker: FXStreetWorker, tmp_path: Path
+) -> None:
+    upstream.events = [
+        event("a", "2024-01-02T12:30:00Z", 1.0, series_id="cpi"),
+        event("b", "2024-01-03T12:30:00Z", 1.0, series_id="gdp"),
+        event("c", "2024-02-02T12:30:00Z", 1.0, series_id="cpi"),
+    ]
+    EventDetailsStore(tmp_path / "details.sqlite3", max_age=60).put(
+        "gdp", {"id": "gdp", "name": "stored"}
+    )
+
+    worker.run(date(2024, 1, 1), date(2024, 2, 29), mode="details")
+
+    detail_paths = [
+        request.url.path
+        for request in upstream.requests
+        if "/v1/eventDates/" in request.url.path
+    ]
+    assert detail_paths == ["/en/api/v1/eventDates/cpi"]
+    body = s3.objects[BUCKET, "fxstreet/event_details/2024-01-01_2024-02-29.json"]
+    assert json.loads(body) == [
+        {"id": "cpi", "name": "details"},
+        {"id": "gdp", "name": "stored"},
+    ]
+
+
+def test_delta_sequences_survive_a_lost_journal(
+    s3: InMemoryS3, upstream: FXStreetUpstream, worker: FXStreetWorker, tmp_path: Path
+) -> None:
+    upstream.events = [event("a", "2024-01-02T12:30:00Z", 1.0)]
+    worker.run(date(2024, 1, 1), date(2024, 1, 31), mode="delta")
+    worker.run(date(2024, 1, 1), date(2024, 1, 31), mode="delta")
+
+    upstream.events = [event("a", "2024-01-02T12:30:00Z", 2.0)]
+    worker.checkpoint_journal = CheckpointJournal(tmp_path / "fresh.sqlite3")
+    worker.run(date(2024, 1, 1), date(2024, 1, 31), mode="delta")
+
+    deltas = {
+        key: json.loads(body)
+        for (_, key), body in s3.objects.items()
+        if key.startswith("fxstreet/deltas/")
+    }
+    assert [
+        (key, [item["actual"] for item in events])
+        for key, events in sorted(deltas.items())
+    ] == [
+        ("fxstreet/deltas/2024-01-02_2024-01-02/000001.json", [1.0]),
+        ("fxstreet/deltas/2024-01-02_2024-01-02/000002.json", [2.0]),
+    ]
+
+
+def test_delta_polls_of_a_sliding_horizon_write_only_changes(
+    s3: InMemoryS3, upstream: FXStreetUpstream, worker: FXStreetWorker
+) -> None:
+    upstream.events = [
+        event("a", "2024-01-11T12:30:00Z", 1.0),
+        event("b", "2024-01-12T12:30:00Z", 2.0),
+        event("c", "2024-01-18T12:30:00Z", 3.0),
+    ]
+    worker.run(date(2024, 1, 10), date(2024, 1, 17), mode="delta")
+    first_poll = dict(s3.objects)
+
+    # The next day's poll sees the same events, plus a revision and a new day
+    upstream.events[1] = event("b", "2024-01-12T12:30:00Z", 2.5)
+    worker.run(date(2024, 1, 11), date(2024, 1, 18), mode="delta")
+
+    written = {
+        key: [item["id"] for item in json.loads(body)]
+        for (_, key), body in s3.objects.items()
+        if first_poll.get((BUCKET, key)) != body
+    }
+    assert written == {
+        "fxstreet/deltas/2024-01-12_2024-01-12/000002.json": ["b"],
+        "fxstreet/events/2024-01-12_2024-01-12.json": ["b"],
+        "fxstreet/deltas/2024-01-18_2024-01-18/000001.json": ["c"],
+        "fxstreet/events/2024-01-18_2024-01-18.json": ["c"],
+    }
+
+
+def test_raw_counts_uploaded_events(
+    s3: InMemoryS3, upstream: FXStreetUpstream, worker: FXStreetWorker
+) -> None:
+    upstream.events = [
+        event("a", "2024-01-10T13:30:00Z", 1.0),
+        event("b", "2024-01-11T13:30:00Z", 2.0),
+    ]
+    uploaded = metrics.EVENTS_UPLOADED.value(bucket=BUCKET)
+
+    worker.run(date(2024, 1, 1), date(2024, 1, 31), mode="raw")
+
+    assert metrics.EVENTS_UPLOADED.value(bucket=BUCKET) == uploaded + 2
+    (body,) = s3.objects.values()
+    assert json.loads(body) == upstream.events
+
+
+def test_typed_backfill_uploads_the_same_bytes(
+    s3: InMemoryS3, upstream: FXStreetUpstream, worker: FXStreetWorker
+) -> None:
+    upstream.events = [
+        {"unit": "%", **event("a", "2024-01-10T13:30:00Z", 1.5)},
+        event("b", "2024-02-11T13:30:00Z", 2.0),
+    ]
+    worker.run(date(2024, 1, 1), date(2024, 2, 29), mode="backfill")
+    dict_objects = dict(s3.objects)
+
+    worker.fxstreet_config = dataclasses.replace(
+        worker.fxstreet_config, typed_events=True
+    )
+    worker.run(date(2024, 1, 1), date(2024, 2, 29), mode="backfill")
+
+    assert len(dict_objects) == 2
+    assert s3.objects == dict_objects
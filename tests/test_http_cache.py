@@ -0,0 +1,114 @@
+import time
+from pathlib import Path
+
+import httpx
+
+from src.config import CacheRule, HTTPCacheConfig
+from src.http_cache import HTTPCache
+from src.http_client import HTTPClient
+
+URL = "https://calendar.example.com/events"
+
+
+def http_cache(tmp_path: Path, **kwargs) -> HTTPCache:
+    return HTTPCache(HTTPCacheConfig(path=str(tmp_path / "cache.sqlite3"), **kwargs))
+
+
+def response(status_code: int = 200, **kwargs) -> httpx.Response:
+    return httpx.Response(status_code, request=httpx.Request("GET", URL), **kwargs)
+
+
+def test_cache_key_covers_params_and_body() -> None:
+    key = HTTPCache.cache_key("GET", URL, {"params": {"a": "1"}})
+
+    assert key == HTTPCache.cache_key("get", URL, {"params": {"a": "1"}})
+    assert key != HTTPCache.cache_key("GET", URL, {"params": {"a": "2"}})
+    assert HTTPCache.cache_key("POST", URL, {"json": {"a": 1, "b": 2}}) == (
+        HTTPCache.cache_key("POST", URL, {"json": {"b": 2, "a": 1}})
+    )
+    assert HTTPCache.cache_key("DELETE", URL, {}) is None
+
+
+def test_ttl_for_rules_and_past_dates(tmp_path: Path) -> None:
+    cache = http_cache(
+        tmp_path,
+        default_ttl=10,
+        past_ttl=1000,
+        rules=(CacheRule(pattern=r"/details/", ttl=5),),
+    )
+
+    assert cache.ttl_for(f"{URL}/details/1", {}) == 5
+    assert cache.ttl_for(URL, {"params": {"from": "2020-01-01"}}) == 1000
+    assert cache.ttl_for(URL, {"params": {"from": "2999-01-01"}}) == 10
+    assert cache.ttl_for(URL, {}) == 10
+
+
+def test_store_and_lookup(tmp_path: Path) -> None:
+    cache = http_cache(tmp_path)
+    cache.store(
+        "key",
+        response(content=b"[]", headers={"ETag": '"v1"', "Content-Length": "2"}),
+        ttl=60,
+    )
+
+    cached = cache.lookup("key")
+
+    assert cached is not None
+    assert cached.is_fresh
+    assert cached.body == b"[]"
+    assert cached.validators() == {"If-None-Match": '"v1"'}
+    assert "content-length" not in dict(cached.headers)
+    assert cache.lookup("missing") is None
+
+
+def test_refresh_extends_expired_entry(tmp_path: Path) -> None:
+    cache = http_cache(tmp_path)
+    cache.store("key", response(content=b"[]"), ttl=-1)
+    assert not cache.lookup("key").is_fresh
+
+    cache.refresh("key", ttl=60)
+
+    assert cache.lookup("key").is_fresh
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = http_cache(tmp_path, max_bytes=20)
+    cache.store("old", response(content=b"x" * 10), ttl=60)
+    cache.store("used", response(content=b"x" * 10), ttl=60)
+    time.sleep(0.01)
+    cache.lookup("old")
+
+    cache.store("new", response(content=b"x" * 10), ttl=60)
+
+    assert cache.lookup("used") is None
+    assert cache.lookup("old") is not None
+    assert cache.lookup("new") is not None
+
+
+def test_client_serves_fresh_entries_and_revalidates_stale_ones(
+    tmp_path: Path,
+) -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[1], headers={"ETag": '"v1"'})
+
+    cache = http_cache(tmp_path, default_ttl=60)
+    client = HTTPClient(
+        rate_limit_delay=0, cache=cache, transport=httpx.MockTransport(handler)
+    )
+
+    assert client.request("GET", URL).json() == [1]
+    assert client.request("GET", URL).json() == [1]
+    assert len(requests) == 1
+
+    key = HTTPCache.cache_key("GET", URL, {})
+    cache.refresh(key, ttl=-1)
+
+    assert client.request("GET", URL).json() == [1]
+    assert len(requests) == 2
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert cache.lookup(key).is_fresh
@@ -0,0 +1,129 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.circuit_breaker import RetryBudget
+from src.config import RetryBudgetConfig
+from src.http_client import AsyncHTTPClient
+
+URL = "https://calendar.example.com/events"
+
+
+def async_client(
+    transport: httpx.AsyncBaseTransport | None = None, **kwargs
+) -> AsyncHTTPClient:
+    return AsyncHTTPClient(rate_limit_delay=0, transport=transport, **kwargs)
+
+
+def mock_transport(*responses: httpx.Response) -> tuple[httpx.MockTransport, list]:
+    """Transport answering with `responses` in turn, and the requests it got."""
+    requests = []
+    pending = list(responses)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return pending.pop(0) if len(pending) > 1 else pending[0]
+
+    return httpx.MockTransport(handler), requests
+
+
+async def test_request_returns_response() -> None:
+    transport, requests = mock_transport(httpx.Response(200, json=[{"id": "1"}]))
+    client = async_client(transport)
+
+    response = await client.request("GET", URL, params={"q": "x"})
+    await client.aclose()
+
+    assert response.json() == [{"id": "1"}]
+    assert str(requests[0].url) == f"{URL}?q=x"
+
+
+async def test_concurrency_is_bounded() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    client = async_client(httpx.MockTransport(handler), max_concurrency=3)
+    await asyncio.gather(*(client.request("GET", URL) for _ in range(10)))
+    await client.aclose()
+
+    assert max_in_flight == 3
+
+
+async def test_server_errors_are_retried() -> None:
+    transport, requests = mock_transport(
+        httpx.Response(503, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"ok": True}),
+    )
+    client = async_client(transport, max_retries=2)
+
+    response = await client.request("GET", URL)
+    await client.aclose()
+
+    assert response.json() == {"ok": True}
+    assert len(requests) == 2
+
+
+async def test_last_attempt_does_not_spend_the_retry_budget() -> None:
+    transport, requests = mock_transport(
+        httpx.Response(503, headers={"Retry-After": "0"})
+    )
+    retry_budget = RetryBudget(RetryBudgetConfig(ratio=0, min_retries=3))
+    client = async_client(transport, max_retries=2, retry_budget=retry_budget)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.request("GET", URL)
+    await client.aclose()
+
+    assert len(requests) == 3
+    # Two retries were made, the third one is left for the next request
+    assert retry_budget.try_spend()
+    assert not retry_budget.try_spend()
+
+
+async def test_client_errors_are_not_retried() -> None:
+    transport, requests = mock_transport(httpx.Response(404))
+    client = async_client(transport, max_retries=2)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.request("GET", URL)
+    await client.aclose()
+
+    assert len(requests) == 1
+
+
+async def test_ignored_codes_are_returned() -> None:
+    transport, _ = mock_transport(httpx.Response(404))
+    client = async_client(transport)
+
+    response = await client.request("GET", URL, ignore_codes=[404])
+    await client.aclose()
+
+    assert response.status_code == 404
+
+
+def test_client_is_reusable_across_event_loops() -> None:
+    transport, requests = mock_transport(httpx.Response(200))
+    client = async_client(transport)
+
+    async def request_and_close() -> int:
+        response = await client.request("GET", URL)
+        await client.aclose()
+        return response.status_code
+
+    assert asyncio.run(request_and_close()) == 200
+    assert asyncio.run(request_and_close()) == 200
+    assert len(requests) == 2
+
+
+def test_max_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        AsyncHTTPClient(max_concurrency=0)
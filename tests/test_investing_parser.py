@@ -0,0 +1,77 @@
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+from src.parsers.investing import (
+    InvestingEvent,
+    iter_calendar_events,
+    parse_calendar_pages,
+)
+
+FIXTURE = (
+    Path(__file__).parent.parent
+    / "benchmarks"
+    / "fixtures"
+    / "investing_calendar_page.json"
+)
+
+
+def calendar_page() -> dict:
+    return json.loads(FIXTURE.read_text())
+
+
+def test_parses_event_rows_and_skips_day_separators() -> None:
+    events = list(iter_calendar_events(calendar_page()["data"]))
+
+    assert len(events) == 9
+    assert events[0] == InvestingEvent(
+        row_id="514201",
+        event_id="1057",
+        datetime_utc=datetime(2025, 1, 6, 1, 45, tzinfo=UTC),
+        country_id="37",
+        country="China",
+        currency="CNY",
+        importance=2,
+        name="Caixin Services PMI (Dec)",
+        url="/economic-calendar/chinese-caixin-services-pmi-596",
+        actual="52.2",
+        forecast="51.7",
+        previous="51.5",
+    )
+
+
+def test_unescapes_text_and_keeps_missing_values_empty() -> None:
+    events = {
+        event.row_id: event for event in iter_calendar_events(calendar_page()["data"])
+    }
+
+    assert events["514204"].name == "S&P Global Services PMI (Dec)"
+    assert events["514206"].actual is None
+    holiday = events["514209"]
+    assert holiday.event_id is None
+    assert holiday.importance is None
+    assert holiday.url is None
+    assert holiday.name == "Japan - Bank Holiday"
+
+
+def test_row_without_closing_tag() -> None:
+    fragment = (
+        '<tr id="eventRowId_1" event_attr_ID="2" '
+        'data-event-datetime="2025/01/06 13:30:00">'
+        '<td class="left event"><a href="/e">Payrolls &amp; Wages</a></td>'
+    )
+
+    (event,) = iter_calendar_events(fragment)
+
+    assert event.name == "Payrolls & Wages"
+    assert event.url == "/e"
+    assert event.country is None
+    assert event.datetime_utc == datetime(2025, 1, 6, 13, 30, tzinfo=UTC)
+
+
+def test_parse_calendar_pages_chains_pages() -> None:
+    page = calendar_page()
+
+    events = list(parse_calendar_pages([page, {"data": ""}, page]))
+
+    assert len(events) == 18
@@ -0,0 +1,118 @@
+import threading
+from datetime import date
+from urllib.parse import parse_qs
+
+import httpx
+
+from src.http_client import AsyncHTTPClient, HTTPClient
+from src.resources.investing import InvestingResource
+
+
+class CalendarUpstream:
+    """Mock Investing calendar serving `pages` pages, recording the form data."""
+
+    def __init__(self, pages: int) -> None:
+        self.pages = pages
+        self.forms: list[dict[str, list[str]]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        form = parse_qs(request.content.decode())
+        self.forms.append(form)
+        page_num = int(form.get("limit_from", ["0"])[0])
+        return httpx.Response(
+            200,
+            json={
+                "data": f"<tr>page {page_num}</tr>",
+                "bind_scroll_handler": page_num < self.pages - 1,
+                "last_time_scope": 1000 + page_num,
+            },
+        )
+
+
+def test_iter_calendar_pages_follows_scroll_pages() -> None:
+    upstream = CalendarUpstream(pages=3)
+    resource = InvestingResource(
+        HTTPClient(rate_limit_delay=0, transport=httpx.MockTransport(upstream))
+    )
+
+    pages = list(resource.iter_calendar_pages(date(2024, 1, 1), date(2024, 1, 31)))
+
+    assert [page["data"] for page in pages] == [
+        "<tr>page 0</tr>",
+        "<tr>page 1</tr>",
+        "<tr>page 2</tr>",
+    ]
+    assert upstream.forms[0]["dateFrom"] == ["2024-01-01"]
+    assert upstream.forms[0]["dateTo"] == ["2024-01-31"]
+    assert [form["limit_from"] for form in upstream.forms] == [["0"], ["1"], ["2"]]
+    assert [form["last_time_scope"] for form in upstream.forms[1:]] == [
+        ["1000"],
+        ["1001"],
+    ]
+
+
+def test_single_page_calendar() -> None:
+    upstream = CalendarUpstream(pages=1)
+    resource = InvestingResource(
+        HTTPClient(rate_limit_delay=0, transport=httpx.MockTransport(upstream))
+    )
+
+    assert len(resource.get_calendar_events(date(2024, 1, 1), date(2024, 1, 1))) == 1
+    assert len(upstream.forms) == 1
+
+
+def test_abandoned_iteration_does_not_wait_for_prefetch() -> None:
+    upstream = CalendarUpstream(pages=10)
+    prefetching = threading.Event()
+    release = threading.Event()
+    prefetched = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if upstream.forms:
+            prefetching.set()
+            release.wait(timeout=5)
+            prefetched.set()
+        return upstream(request)
+
+    resource = InvestingResource(
+        HTTPClient(rate_limit_delay=0, transport=httpx.MockTransport(handler))
+    )
+    pages = resource.iter_calendar_pages(date(2024, 1, 1), date(2024, 1, 31))
+
+    assert next(pages)["last_time_scope"] == 1000
+    assert prefetching.wait(timeout=5)
+    pages.close()
+
+    assert not prefetched.is_set()
+    release.set()
+    assert prefetched.wait(timeout=5)
+
+
+async def test_aiter_calendar_pages_follows_scroll_pages() -> None:
+    upstream = CalendarUpstream(pages=3)
+    async_http_client = AsyncHTTPClient(
+        rate_limit_delay=0, transport=httpx.MockTransport(upstream)
+    )
+    resource = InvestingResource(HTTPClient(rate_limit_delay=0), async_http_client)
+
+    pages = await resource.aget_calendar_events(date(2024, 1, 1), date(2024, 1, 31))
+    await async_http_client.aclose()
+
+    assert [page["last_time_scope"] for page in pages] == [1000, 1001, 1002]
+    assert len(upstream.forms) == 3
+
+
+async def test_abandoned_iteration_cancels_prefetch() -> None:
+    upstream = CalendarUpstream(pages=10)
+    async_http_client = AsyncHTTPClient(
+        rate_limit_delay=0, transport=httpx.MockTransport(upstream)
+    )
+    resource = InvestingResource(HTTPClient(rate_limit_delay=0), async_http_client)
+
+    pages = resource.aiter_calendar_pages(date(2024, 1, 1), date(2024, 1, 31))
+    first_page = await anext(pages)
+    await pages.aclose()
+    await async_http_client.aclose()
+
+    assert first_page["last_time_scope"] == 1000
+    assert len(upstream.forms) <= 2
@@ -0,0 +1,124 @@
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+from benchmarks.s3 import InMemoryS3
+from src.manifest import BronzeManifest, parse_bronze_windows
+
+BUCKET = "calendar"
+PREFIX = "fxstreet/events/"
+
+
+def manifest(s3: InMemoryS3, tmp_path: Path, **kwargs) -> BronzeManifest:
+    return BronzeManifest(
+        s3,
+        bucket_name=BUCKET,
+        prefix=PREFIX,
+        cache_path=tmp_path / "manifest.json",
+        **kwargs,
+    )
+
+
+def put(s3: InMemoryS3, *keys: str) -> None:
+    for key in keys:
+        s3.put_object(Bucket=BUCKET, Key=key, Body=b"[]")
+
+
+def test_lists_keys_under_prefix(tmp_path: Path) -> None:
+    s3 = InMemoryS3()
+    put(s3, f"{PREFIX}2024-01-01_2024-01-31.json", "investing/events/x.json")
+
+    assert manifest(s3, tmp_path).keys() == {f"{PREFIX}2024-01-01_2024-01-31.json"}
+
+
+def test_fresh_cache_avoids_listing(tmp_path: Path) -> None:
+    s3 = InMemoryS3()
+    put(s3, f"{PREFIX}a.json")
+    manifest(s3, tmp_path).keys()
+    put(s3, f"{PREFIX}b.json")
+    requests = s3.requests
+
+    assert manifest(s3, tmp_path).keys() == {f"{PREFIX}a.json"}
+    assert s3.requests == requests
+    assert manifest(s3, tmp_path).keys(refresh=True) == {
+        f"{PREFIX}a.json",
+        f"{PREFIX}b.json",
+    }
+
+
+def test_stale_or_foreign_cache_is_ignored(tmp_path: Path) -> None:
+    s3 = InMemoryS3()
+    put(s3, f"{PREFIX}a.json")
+    manifest(s3, tmp_path).keys()
+    put(s3, f"{PREFIX}b.json")
+
+    assert len(manifest(s3, tmp_path, cache_ttl=-1).keys()) == 2
+
+    cache_path = tmp_path / "manifest.json"
+    cache = json.loads(cache_path.read_text())
+    cache["prefix"] = "other/"
+    cache_path.write_text(json.dumps(cache))
+    put(s3, f"{PREFIX}c.json")
+
+    assert len(manifest(s3, tmp_path).keys()) == 3
+
+
+def test_corrupt_cache_is_ignored(tmp_path: Path) -> None:
+    s3 = InMemoryS3()
+    put(s3, f"{PREFIX}a.json")
+    (tmp_path / "manifest.json").write_text("{")
+
+    assert manifest(s3, tmp_path).keys() == {f"{PREFIX}a.json"}
+
+
+def test_added_keys_are_saved(tmp_path: Path) -> None:
+    s3 = InMemoryS3()
+    bronze_manifest = manifest(s3, tmp_path)
+    bronze_manifest.keys()
+    bronze_manifest.add(f"{PREFIX}new.json")
+    bronze_manifest.save()
+
+    assert manifest(s3, tmp_path).keys() == {f"{PREFIX}new.json"}
+
+
+def test_keys_by_write_time(tmp_path: Path) -> None:
+    s3 = InMemoryS3()
+    put(s3, f"{PREFIX}a.json", f"{PREFIX}b.json", f"{PREFIX}c.json")
+    s3.last_modified[BUCKET, f"{PREFIX}a.json"] = datetime(2024, 3, 1, tzinfo=UTC)
+    s3.last_modified[BUCKET, f"{PREFIX}b.json"] = datetime(2024, 1, 1, tzinfo=UTC)
+    s3.last_modified[BUCKET, f"{PREFIX}c.json"] = datetime(2024, 2, 1, tzinfo=UTC)
+    manifest(s3, tmp_path).keys()
+
+    assert manifest(s3, tmp_path).keys_by_write_time() == [
+        f"{PREFIX}b.json",
+        f"{PREFIX}c.json",
+        f"{PREFIX}a.json",
+    ]
+
+
+def test_cache_without_write_times_is_ignored(tmp_path: Path) -> None:
+    s3 = InMemoryS3()
+    put(s3, f"{PREFIX}a.json")
+    (tmp_path / "manifest.json").write_text(
+        json.dumps(
+            {
+                "bucket_name": BUCKET,
+                "prefix": PREFIX,
+                "listed_at": datetime.now(UTC).timestamp(),
+                "keys": [f"{PREFIX}stale.json"],
+            }
+        )
+    )
+
+    assert manifest(s3, tmp_path).keys() == {f"{PREFIX}a.json"}
+
+
+def test_parse_bronze_windows_keeps_key_order() -> None:
+    template = "fxstreet/events/{start_date}_{end_date}.json"
+    keys = [
+        "fxstreet/events/2024-02-01_2024-02-29.json.gz",
+        "fxstreet/events/2024-01-01_2024-01-31.json",
+        "fxstreet/other.json",
+    ]
+
+    assert [key for key, _ in parse_bronze_windows(keys, template)] == keys[:2]
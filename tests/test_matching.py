@@ -0,0 +1,163 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.matching import (
+    MatchCandidate,
+    canonical_name,
+    from_fxstreet,
+    from_investing,
+    from_trading_view,
+    match_events,
+    normalize_country,
+)
+from src.parsers.investing import InvestingEvent
+
+RELEASED_AT = datetime(2025, 1, 10, 13, 30, tzinfo=UTC)
+
+
+def candidate(
+    source: str,
+    event_id: str,
+    name: str = "Nonfarm Payrolls",
+    country: str = "US",
+    datetime_utc: datetime = RELEASED_AT,
+) -> MatchCandidate:
+    return MatchCandidate(source, event_id, country, datetime_utc, name)
+
+
+@pytest.mark.parametrize(
+    ("country", "code"),
+    [("UK", "GB"), ("EMU", "EU"), ("Euro Zone", "EU"), ("United States", "US")],
+)
+def test_normalize_country(country: str, code: str) -> None:
+    assert normalize_country(country) == code
+    assert normalize_country(" us ") == "US"
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        ("Non-Farm Payrolls (Dec)", "Nonfarm Payrolls"),
+        ("Trade Balance", "Balance of Trade"),
+        ("CPI (MoM)", "CPI m/m"),
+        ("GDP (Q4) Prel", "GDP Preliminary"),
+        ("Consumer&#39;s Confidence", "Consumers Confidence"),
+    ],
+)
+def test_canonical_name_matches_source_spellings(first: str, second: str) -> None:
+    assert canonical_name(first) == canonical_name(second)
+
+
+def test_canonical_name_keeps_rate_of_change_apart() -> None:
+    assert canonical_name("CPI (MoM)") != canonical_name("CPI (YoY)")
+
+
+def test_source_events_become_candidates() -> None:
+    fxstreet = list(
+        from_fxstreet(
+            [
+                {
+                    "id": "fx",
+                    "dateUtc": "2025-01-10T13:30:00Z",
+                    "name": "Nonfarm Payrolls",
+                    "countryCode": "US",
+                },
+                {"id": "undated", "name": "Holiday"},
+            ]
+        )
+    )
+    investing = list(
+        from_investing(
+            [
+                InvestingEvent(
+                    row_id="1",
+                    event_id="8",
+                    datetime_utc=RELEASED_AT,
+                    country_id="5",
+                    country="United States",
+                    currency="USD",
+                    importance=3,
+                    name="Nonfarm Payrolls (Dec)",
+                    url=None,
+                    actual=None,
+                    forecast=None,
+                    previous=None,
+                ),
+            ]
+        )
+    )
+    trading_view = list(
+        from_trading_view(
+            [
+                {
+                    "id": 42,
+                    "date": "2025-01-10T08:30:00-05:00",
+                    "title": "Non Farm Payrolls",
+                    "country": "US",
+                }
+            ]
+        )
+    )
+
+    assert fxstreet == [candidate("fxstreet", "fx")]
+    assert investing == [candidate("investing", "1", "Nonfarm Payrolls (Dec)")]
+    assert trading_view == [candidate("trading_view", "42", "Non Farm Payrolls")]
+
+
+def test_match_events_groups_sources_of_the_same_release() -> None:
+    rows = match_events(
+        [
+            candidate("fxstreet", "fx", "Non-Farm Payrolls (Dec)"),
+            candidate("investing", "in", "Nonfarm Payrolls"),
+            candidate("fxstreet", "fx", "Non-Farm Payrolls (Dec)"),
+            candidate("fxstreet", "uk", country="GB"),
+            candidate("fxstreet", "cpi", "CPI"),
+        ]
+    )
+
+    match_ids = {row.source_event_id: row.match_id for row in rows}
+    assert len(rows) == 4
+    assert match_ids["fx"] == match_ids["in"]
+    assert len(set(match_ids.values())) == 3
+
+
+def test_match_events_absorbs_bucket_boundaries() -> None:
+    rows = match_events(
+        [
+            candidate(
+                "fxstreet", "fx", datetime_utc=RELEASED_AT - timedelta(minutes=1)
+            ),
+            candidate(
+                "investing", "in", datetime_utc=RELEASED_AT + timedelta(minutes=1)
+            ),
+            candidate(
+                "trading_view", "tv", datetime_utc=RELEASED_AT + timedelta(minutes=90)
+            ),
+        ],
+        bucket_minutes=10,
+    )
+
+    match_ids = {row.source_event_id: row.match_id for row in rows}
+    assert match_ids["fx"] == match_ids["in"] != match_ids["tv"]
+
+
+def test_match_ids_are_stable_across_runs() -> None:
+    candidates = [candidate("fxstreet", "fx"), candidate("investing", "in")]
+
+    assert match_events(candidates) == match_events(reversed(candidates))[::-1]
+
+
+def test_build_crosswalk_table() -> None:
+    pytest.importorskip("pyarrow")
+    from src.silver.crosswalk import (  # noqa: PLC0415
+        CROSSWALK_SCHEMA,
+        build_crosswalk_table,
+    )
+
+    rows = match_events([candidate("investing", "in"), candidate("fxstreet", "fx")])
+    table = build_crosswalk_table(rows)
+
+    assert table.schema == CROSSWALK_SCHEMA
+    assert table["source"].to_pylist() == ["fxstreet", "investing"]
+    assert build_crosswalk_table([]).num_rows == 0
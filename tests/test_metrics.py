@@ -0,0 +1,72 @@
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from src.metrics import MetricsRegistry, start_http_server
+
+
+def test_render_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests", ("host", "status"))
+    latency = registry.histogram(
+        "latency_seconds", "Latency", ("host",), buckets=(0.1, 1)
+    )
+
+    requests.inc(host="a.invalid", status=200)
+    requests.inc(2, host="a.invalid", status=200)
+    requests.inc(host='quote"d', status="error")
+    latency.observe(0.05, host="a.invalid")
+    latency.observe(0.5, host="a.invalid")
+    latency.observe(5, host="a.invalid")
+
+    assert requests.value(host="a.invalid", status=200) == 3
+    assert latency.count(host="a.invalid") == 3
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Requests",
+        "# TYPE requests_total counter",
+        'requests_total{host="a.invalid",status="200"} 3',
+        'requests_total{host="quote\\"d",status="error"} 1',
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{host="a.invalid",le="0.1"} 1',
+        'latency_seconds_bucket{host="a.invalid",le="1"} 2',
+        'latency_seconds_bucket{host="a.invalid",le="+Inf"} 3',
+        'latency_seconds_sum{host="a.invalid"} 5.55',
+        'latency_seconds_count{host="a.invalid"} 3',
+    ]
+
+
+def test_metric_names_are_unique() -> None:
+    registry = MetricsRegistry()
+    registry.counter("events_total", "Events")
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.histogram("events_total", "Events")
+
+
+def test_write_textfile(tmp_path: Path) -> None:
+    registry = MetricsRegistry()
+    registry.counter("events_total", "Events").inc(4)
+    path = tmp_path / "textfile" / "calendar.prom"
+
+    registry.write_textfile(path)
+
+    assert path.read_text().endswith("events_total 4\n")
+    assert [file.name for file in path.parent.iterdir()] == ["calendar.prom"]
+
+
+def test_http_server_serves_metrics() -> None:
+    registry = MetricsRegistry()
+    registry.counter("events_total", "Events").inc()
+    server = start_http_server(0, "127.0.0.1", registry)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        with urllib.request.urlopen(f"{url}/metrics") as response:  # noqa: S310
+            assert response.read().decode() == registry.render()
+        with pytest.raises(urllib.error.HTTPError, match="404"):
+            urllib.request.urlopen(f"{url}/other")  # noqa: S310
+    finally:
+        server.shutdown()
+        server.server_close()
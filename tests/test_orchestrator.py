@@ -0,0 +1,117 @@
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from datetime import date
+from typing import Any
+
+import pytest
+
+from src import orchestrator
+
+
+class FakeWorker:
+    def __init__(self, config_data: Mapping[str, Any], runs: list) -> None:
+        self.config_data = config_data
+        self.runs = runs
+
+    def run(
+        self, start_date: date, end_date: date, mode: str, *, resume: bool = False
+    ) -> None:
+        self.runs.append(
+            (
+                self.config_data["worker"],
+                threading.current_thread().name,
+                (start_date, end_date, mode, resume),
+            )
+        )
+        if "barrier" in self.config_data:
+            self.config_data["barrier"].wait()
+        if self.config_data.get("fail"):
+            msg = "upstream down"
+            raise ConnectionError(msg)
+
+    @contextmanager
+    def warm(self) -> Iterator[None]:
+        yield
+
+
+@pytest.fixture
+def runs(monkeypatch: pytest.MonkeyPatch) -> list:
+    runs = []
+    monkeypatch.setattr(
+        orchestrator,
+        "build_worker",
+        lambda config_data: FakeWorker(config_data, runs),
+    )
+    return runs
+
+
+def test_run_sources_runs_each_source_in_its_own_thread(runs: list) -> None:
+    # Only passed once both sources run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    orchestrator.run_sources(
+        {
+            "fxstreet": {"worker": "fxstreet", "barrier": barrier},
+            "investing": {"worker": "investing", "barrier": barrier},
+        },
+        date(2024, 1, 1),
+        date(2024, 1, 31),
+        "raw",
+        resume=True,
+    )
+
+    assert sorted(worker for worker, _, _ in runs) == ["fxstreet", "investing"]
+    assert len({thread for _, thread, _ in runs}) == 2
+    assert all(thread.startswith("source") for _, thread, _ in runs)
+    assert {arguments for _, _, arguments in runs} == {
+        (date(2024, 1, 1), date(2024, 1, 31), "raw", True)
+    }
+
+
+def test_failing_source_does_not_stop_the_others(runs: list) -> None:
+    with pytest.raises(RuntimeError, match="Sources failed: investing"):
+        orchestrator.run_sources(
+            {
+                "fxstreet": {"worker": "fxstreet"},
+                "investing": {"worker": "investing", "fail": True},
+                "trading_view": {"worker": "trading_view"},
+            },
+            date(2024, 1, 1),
+            date(2024, 1, 31),
+            "raw",
+        )
+
+    assert sorted(worker for worker, _, _ in runs) == [
+        "fxstreet",
+        "investing",
+        "trading_view",
+    ]
+
+
+def test_serve_source_that_cannot_start_stops_the_others(runs: list) -> None:
+    stop_event = threading.Event()
+
+    with pytest.raises(RuntimeError, match="Sources failed: investing"):
+        orchestrator.serve_sources(
+            {
+                "fxstreet": {
+                    "worker": "fxstreet",
+                    "serve": {
+                        "horizons": [
+                            {
+                                "name": "week",
+                                "start_offset_days": 0,
+                                "end_offset_days": 7,
+                                "interval": 3600,
+                            }
+                        ]
+                    },
+                },
+                "investing": {"worker": "investing"},
+            },
+            stop_event,
+        )
+
+    assert stop_event.is_set()
+    assert "investing" not in {worker for worker, _, _ in runs}
@@ -0,0 +1,55 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src import profiling
+
+
+@profiling.stage("upload")
+def upload(stop_event: threading.Event) -> None:
+    while not stop_event.is_set():
+        time.sleep(0.001)
+
+
+def test_samples_are_split_by_stage(tmp_path: Path) -> None:
+    profiler = profiling.SamplingProfiler(interval=0.001, memory_check_interval=0)
+    stop_event = threading.Event()
+    thread = threading.Thread(target=upload, args=(stop_event,))
+
+    profiler.start()
+    thread.start()
+    time.sleep(0.1)
+    stop_event.set()
+    thread.join()
+    profiler.stop()
+    profiler.write(tmp_path)
+
+    assert {path.name for path in tmp_path.iterdir()} == {
+        "summary.txt",
+        "allocations.txt",
+        *(
+            f"{name}.{suffix}"
+            for name in (*profiling.STAGES, profiling.OTHER_STAGE)
+            for suffix in ("txt", "folded")
+        ),
+    }
+    # Time blocked in sleep counts for the marked function that called it
+    folded = (tmp_path / "upload.folded").read_text()
+    assert "upload (test_profiling.py" in folded
+    assert folded.splitlines()[0].split(";")[-1].startswith("upload")
+    assert (tmp_path / "allocations.txt").read_text().startswith("Traced memory peak")
+
+
+def test_stop_without_start_is_a_no_op(tmp_path: Path) -> None:
+    profiler = profiling.SamplingProfiler()
+    profiler.stop()
+    profiler.write(tmp_path)
+
+    assert "0 thread samples" in (tmp_path / "summary.txt").read_text()
+
+
+def test_unknown_stage() -> None:
+    with pytest.raises(ValueError, match="Unknown profiling stage"):
+        profiling.mark_stage("parse", test_unknown_stage)
@@ -0,0 +1,105 @@
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from src.config import RateLimitConfig
+from src.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+HOST = "calendar.example.com"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr("src.rate_limiter.time.monotonic", clock)
+    return clock
+
+
+def limiter(**kwargs) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(RateLimitConfig(**kwargs))
+
+
+def test_burst_then_wait_for_tokens(clock: Clock) -> None:
+    rate_limiter = limiter(initial_rate=2.0, burst=2)
+
+    assert rate_limiter.reserve(HOST) == 0
+    assert rate_limiter.reserve(HOST) == 0
+    assert rate_limiter.reserve(HOST) == pytest.approx(0.5)
+
+    clock.now += 1.5
+    assert rate_limiter.reserve(HOST) == 0
+
+
+@pytest.mark.usefixtures("clock")
+def test_hosts_have_separate_buckets() -> None:
+    rate_limiter = limiter(initial_rate=1.0)
+
+    assert rate_limiter.reserve(HOST) == 0
+    assert rate_limiter.reserve("other.example.com") == 0
+    assert rate_limiter.reserve(HOST) == pytest.approx(1.0)
+
+
+def test_throttle_decreases_rate_and_honours_retry_after(clock: Clock) -> None:
+    rate_limiter = limiter(initial_rate=4.0, min_rate=1.0, decrease_factor=0.5)
+    rate_limiter.reserve(HOST)
+
+    rate_limiter.on_throttle(HOST, retry_after=10)
+
+    clock.now += 1
+    assert rate_limiter.reserve(HOST) == pytest.approx(9.0)
+
+    for _ in range(5):
+        rate_limiter.on_throttle(HOST)
+    clock.now += 100
+    rate_limiter.reserve(HOST)
+    assert rate_limiter.reserve(HOST) == pytest.approx(1.0)
+
+
+@pytest.mark.usefixtures("clock")
+def test_success_increases_rate_up_to_max() -> None:
+    rate_limiter = limiter(initial_rate=1.0, max_rate=2.0, increase_step=0.5)
+
+    for _ in range(5):
+        rate_limiter.on_success(HOST)
+    rate_limiter.reserve(HOST)
+
+    assert rate_limiter.reserve(HOST) == pytest.approx(0.5)
+
+
+@pytest.mark.usefixtures("clock")
+def test_fixed_limiter_spaces_requests() -> None:
+    rate_limiter = AdaptiveRateLimiter.fixed(0.25)
+    rate_limiter.reserve(HOST)
+    rate_limiter.on_success(HOST)
+
+    assert rate_limiter.reserve(HOST) == pytest.approx(0.25)
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"Retry-After": "7"}, 7.0),
+        ({"Retry-After": "-3"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+    ],
+)
+def test_parse_retry_after(headers: dict[str, str], expected: float | None) -> None:
+    assert parse_retry_after(httpx.Response(429, headers=headers)) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    retry_at = datetime.now(UTC) + timedelta(seconds=60)
+    response = httpx.Response(503, headers={"Retry-After": format_datetime(retry_at)})
+
+    assert parse_retry_after(response) == pytest.approx(60, abs=2)
@@ -0,0 +1,82 @@
+import hashlib
+from collections.abc import Iterable, Iterator
+
+import pytest
+
+from benchmarks.s3 import InMemoryS3
+from src.s3_upload import MIN_PART_SIZE, upload_stream
+
+BUCKET = "calendar"
+KEY = "fxstreet/events/2024-01-01_2024-01-31.json"
+
+
+def chunked(payload: bytes, size: int) -> Iterator[bytes]:
+    for offset in range(0, len(payload), size):
+        yield payload[offset : offset + size]
+
+
+def test_small_payload_is_put_in_one_request() -> None:
+    s3 = InMemoryS3()
+    payload = b'[{"id": "1"}]'
+
+    digest = upload_stream(
+        s3, BUCKET, KEY, chunked(payload, 4), ContentType="application/json"
+    )
+
+    assert s3.objects[BUCKET, KEY] == payload
+    assert s3.requests == 1
+    assert digest == hashlib.sha256(payload).hexdigest()
+
+
+def test_large_payload_is_uploaded_in_parts() -> None:
+    s3 = InMemoryS3()
+    payload = bytes(range(256)) * (MIN_PART_SIZE * 2 // 256 + 1000)
+
+    digest = upload_stream(
+        s3, BUCKET, KEY, chunked(payload, 1024 * 1024), part_size=MIN_PART_SIZE
+    )
+
+    assert s3.objects[BUCKET, KEY] == payload
+    # create, three parts and complete
+    assert s3.requests == 5
+    assert digest == hashlib.sha256(payload).hexdigest()
+
+
+def test_reencoder_transforms_chunks() -> None:
+    s3 = InMemoryS3()
+
+    def upper(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        return (chunk.upper() for chunk in chunks)
+
+    digest = upload_stream(s3, BUCKET, KEY, [b"ab", b"c"], reencoder=upper)
+
+    assert s3.objects[BUCKET, KEY] == b"ABC"
+    assert digest == hashlib.sha256(b"ABC").hexdigest()
+
+
+def test_failed_multipart_upload_is_aborted() -> None:
+    s3 = InMemoryS3()
+    aborted = []
+    abort = s3.abort_multipart_upload
+
+    def record_abort(**kwargs: str) -> dict:
+        aborted.append(kwargs["UploadId"])
+        return abort(**kwargs)
+
+    s3.abort_multipart_upload = record_abort
+
+    def failing_chunks() -> Iterator[bytes]:
+        yield b"x" * MIN_PART_SIZE
+        msg = "connection reset"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError):
+        upload_stream(s3, BUCKET, KEY, failing_chunks(), part_size=MIN_PART_SIZE)
+
+    assert aborted == ["0"]
+    assert (BUCKET, KEY) not in s3.objects
+
+
+def test_part_size_must_reach_s3_minimum() -> None:
+    with pytest.raises(ValueError, match="part_size"):
+        upload_stream(InMemoryS3(), BUCKET, KEY, [], part_size=1024)
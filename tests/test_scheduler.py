@@ -0,0 +1,95 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pytest
+
+from src.config import PollHorizon, ServeConfig
+from src.scheduler import serve
+
+TODAY = date.today()
+
+
+class PollingWorker:
+    """Worker recording its polls, stopping serve mode after `max_polls`."""
+
+    def __init__(self, stop_event: threading.Event, max_polls: int) -> None:
+        self.stop_event = stop_event
+        self.max_polls = max_polls
+        self.polls: list[tuple[date, date, str]] = []
+        self.warm_entered = 0
+        self.fail_modes: set[str] = set()
+
+    def run(
+        self,
+        start_date: date,
+        end_date: date,
+        mode: str,
+        *,
+        resume: bool = False,  # noqa: ARG002
+    ) -> None:
+        self.polls.append((start_date, end_date, mode))
+        if len(self.polls) >= self.max_polls:
+            self.stop_event.set()
+        if mode in self.fail_modes:
+            msg = "upstream down"
+            raise ConnectionError(msg)
+
+    @contextmanager
+    def warm(self) -> Iterator[None]:
+        self.warm_entered += 1
+        yield
+
+
+def horizon(name: str, interval: float, mode: str = "raw") -> PollHorizon:
+    return PollHorizon(
+        name=name, start_offset_days=-1, end_offset_days=7, interval=interval, mode=mode
+    )
+
+
+def test_serve_polls_horizons_on_their_cadence() -> None:
+    stop_event = threading.Event()
+    worker = PollingWorker(stop_event, max_polls=4)
+
+    serve(
+        worker,
+        ServeConfig(
+            horizons=(horizon("fast", 0.01), horizon("slow", 60, mode="delta")),
+            jitter=0,
+        ),
+        stop_event,
+    )
+
+    assert worker.warm_entered == 1
+    assert worker.polls[0] == (
+        TODAY - timedelta(days=1),
+        TODAY + timedelta(days=7),
+        "raw",
+    )
+    assert [mode for _, _, mode in worker.polls] == ["raw", "delta", "raw", "raw"]
+
+
+def test_failing_poll_does_not_stop_serving() -> None:
+    stop_event = threading.Event()
+    worker = PollingWorker(stop_event, max_polls=3)
+    worker.fail_modes = {"raw"}
+
+    serve(worker, ServeConfig(horizons=(horizon("fast", 0.01),)), stop_event)
+
+    assert len(worker.polls) == 3
+
+
+def test_set_stop_event_ends_before_polling() -> None:
+    stop_event = threading.Event()
+    stop_event.set()
+    worker = PollingWorker(stop_event, max_polls=1)
+
+    serve(worker, ServeConfig(horizons=(horizon("fast", 0.01),)), stop_event)
+
+    assert worker.polls == []
+
+
+def test_serve_needs_horizons() -> None:
+    with pytest.raises(ValueError, match="horizon"):
+        serve(PollingWorker(threading.Event(), max_polls=1), ServeConfig())
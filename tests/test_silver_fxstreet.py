@@ -0,0 +1,132 @@
+import io
+import json
+from datetime import date
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.silver.fxstreet import (  # noqa: E402
+    SILVER_SCHEMA,
+    build_silver_table,
+    partition_by_date_and_country,
+    read_bronze_ndjson,
+    to_parquet_bytes,
+)
+
+CENTRAL_BANKS = "C94405B5-5F85-4397-AB11-002A481C4B92"
+
+
+def event(event_id: str, date_utc: str, country: str | None = "US", **fields) -> dict:
+    return {
+        "id": event_id,
+        "eventId": "series",
+        "name": "CPI",
+        "dateUtc": date_utc,
+        "countryCode": country,
+        "categoryId": CENTRAL_BANKS,
+        "volatility": "HIGH",
+        "actual": 1.5,
+        "consensus": None,
+        "previous": 1.0,
+        **fields,
+    }
+
+
+def ndjson(*events: dict) -> bytes:
+    return b"\n".join(json.dumps(item).encode() for item in events)
+
+
+def silver(*events: dict) -> "pa.Table":
+    return build_silver_table(
+        [read_bronze_ndjson(ndjson(*events))], date(2024, 1, 1), date(2024, 1, 31)
+    )
+
+
+def test_read_bronze_ndjson_ignores_unknown_fields() -> None:
+    table = read_bronze_ndjson(ndjson(event("a", "2024-01-02T12:30:00Z", unit="%")))
+
+    assert table.num_rows == 1
+    assert "unit" not in table.column_names
+
+
+def test_read_empty_bronze_payload() -> None:
+    assert read_bronze_ndjson(b"").num_rows == 0
+
+
+def test_build_silver_table_normalizes_events() -> None:
+    table = silver(event("a", "2024-01-02T12:30:00Z"))
+
+    assert table.schema == SILVER_SCHEMA
+    row = table.to_pylist()[0]
+    assert row["event_id"] == "a"
+    assert row["date"] == date(2024, 1, 2)
+    assert row["category"] == "Central Banks"
+    assert row["previous"] == 1.0
+
+
+def test_build_silver_table_filters_dates() -> None:
+    table = silver(
+        event("before", "2023-12-31T23:00:00Z"),
+        event("inside", "2024-01-31T23:00:00Z"),
+        event("after", "2024-02-01T00:00:00Z"),
+    )
+
+    assert table["event_id"].to_pylist() == ["inside"]
+
+
+def test_build_silver_table_keeps_last_duplicate() -> None:
+    first = read_bronze_ndjson(ndjson(event("a", "2024-01-02T12:30:00Z", actual=1.0)))
+    second = read_bronze_ndjson(ndjson(event("a", "2024-01-02T12:30:00Z", actual=2.0)))
+
+    table = build_silver_table([first, second], date(2024, 1, 1), date(2024, 1, 31))
+
+    assert table["actual"].to_pylist() == [2.0]
+
+
+def test_build_silver_table_without_tables() -> None:
+    table = build_silver_table([], date(2024, 1, 1), date(2024, 1, 31))
+
+    assert table.num_rows == 0
+    assert table.schema == SILVER_SCHEMA
+
+
+def test_partition_empty_table() -> None:
+    assert list(partition_by_date_and_country(SILVER_SCHEMA.empty_table())) == []
+
+
+def test_partition_single_row_table() -> None:
+    partitions = list(partition_by_date_and_country(silver(event("a", "2024-01-02"))))
+
+    assert [(day, country, rows.num_rows) for day, country, rows in partitions] == [
+        (date(2024, 1, 2), "US", 1)
+    ]
+
+
+def test_partition_by_date_and_country() -> None:
+    table = pa.concat_tables(
+        [
+            silver(event("a", "2024-01-03", "US"), event("b", "2024-01-02", "UK")),
+            silver(event("c", "2024-01-02", None), event("d", "2024-01-02", "UK")),
+        ]
+    )
+
+    partitions = {
+        (day, country): sorted(rows["event_id"].to_pylist())
+        for day, country, rows in partition_by_date_and_country(table)
+    }
+
+    assert partitions == {
+        (date(2024, 1, 2), "UK"): ["b", "d"],
+        (date(2024, 1, 2), None): ["c"],
+        (date(2024, 1, 3), "US"): ["a"],
+    }
+
+
+def test_to_parquet_bytes_round_trip() -> None:
+    table = silver(event("a", "2024-01-02T12:30:00Z"))
+
+    parquet = pq.read_table(io.BytesIO(to_parquet_bytes(table)))
+
+    assert parquet.to_pylist() == table.to_pylist()
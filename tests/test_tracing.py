@@ -0,0 +1,56 @@
+import asyncio
+import json
+from pathlib import Path
+
+from src.tracing import Tracer
+
+
+def read_events(path: Path) -> list[dict]:
+    # The trace ends with an empty event closing the array
+    *events, end = json.loads(path.read_text())
+    assert end == {}
+    return events
+
+
+def test_spans_are_written_to_a_chrome_trace(tmp_path: Path) -> None:
+    tracer = Tracer()
+    path = tmp_path / "traces" / "run.json"
+    tracer.start(path)
+
+    with tracer.span("fetch", host="a.invalid") as attributes:
+        attributes["status"] = 200
+    with tracer.span("upload"):
+        pass
+    tracer.stop()
+
+    (fetch, upload) = read_events(path)
+    assert fetch["name"] == "fetch"
+    assert fetch["ph"] == "X"
+    assert fetch["args"] == {"host": "a.invalid", "status": 200}
+    assert fetch["ts"] + fetch["dur"] <= upload["ts"]
+
+
+def test_disabled_tracer_yields_attributes_without_writing(tmp_path: Path) -> None:
+    tracer = Tracer()
+
+    with tracer.span("fetch", host="a.invalid") as attributes:
+        assert attributes == {"host": "a.invalid"}
+
+    assert not tracer.enabled
+    tracer.stop()
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_tasks_get_their_own_track(tmp_path: Path) -> None:
+    tracer = Tracer()
+    path = tmp_path / "run.json"
+    tracer.start(path)
+
+    async def fetch() -> None:
+        with tracer.span("fetch"):
+            await asyncio.sleep(0)
+
+    await asyncio.gather(fetch(), fetch())
+    tracer.stop()
+
+    assert len({event["tid"] for event in read_events(path)}) == 2
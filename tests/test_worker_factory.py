@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+
+from src.worker_factory import build_worker
+
+
+def test_importing_the_factory_does_not_import_workers() -> None:
+    code = (
+        "import sys, src.worker_factory; "
+        "print(sorted(name for name in sys.modules if name.startswith('src.workers')))"
+    )
+
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_importing_the_cli_does_not_import_the_configuration() -> None:
+    code = "import sys, main; print('src.config' in sys.modules)"
+
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+    assert output.strip() == "False"
+
+
+def test_unknown_worker() -> None:
+    with pytest.raises(ValueError, match="Unknown worker: missing"):
+        build_worker({"worker": "missing"})
+    with pytest.raises(TypeError, match="worker"):
+        build_worker({})